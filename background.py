@@ -0,0 +1,102 @@
+"""
+Background work for Tk applications.
+
+BackgroundTask runs a picklable function in a separate process, so heavy
+work such as maze generation or solving never holds the GIL of the Tk
+thread, and polls for the result with after(). A running task can be
+cancelled, which terminates the worker process immediately.
+
+multiprocessing is imported when the first task starts rather than with
+this module, since it is one of the slower imports on the games' startup
+path.
+"""
+
+import traceback
+from typing import Any, Callable, Optional
+
+
+def _run(conn, func, args):
+    """Worker process entry point: send (ok, result_or_traceback) back"""
+    try:
+        conn.send((True, func(*args)))
+    except BaseException:
+        conn.send((False, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class BackgroundTask:
+    """
+    Run func(*args) in a worker process and deliver the outcome on the Tk thread.
+
+    Attributes:
+        on_done (Callable): Called with the result when the work succeeds
+        on_error (Callable): Called with the worker traceback text on failure
+    """
+
+    def __init__(self, widget, func: Callable, *args,
+                 on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[str], None]] = None,
+                 poll_ms: int = 25):
+        self.widget = widget
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self.process = None
+        self.conn = None
+        self.after_id = None
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None
+
+    def start(self) -> 'BackgroundTask':
+        import multiprocessing
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self.conn = parent_conn
+        self.process = multiprocessing.Process(
+            target=_run, args=(child_conn, self.func, self.args), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.after_id = self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        """Stop the worker; neither callback will be called"""
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        if self.process is not None:
+            self.process.terminate()
+            self._cleanup()
+
+    def _poll(self):
+        self.after_id = None
+        try:
+            ready = self.conn.poll()
+            message = self.conn.recv() if ready else None
+        except EOFError:
+            # Worker died without reporting back
+            message = (False, f"Worker exited with code {self.process.exitcode}")
+
+        if message is None:
+            self.after_id = self.widget.after(self.poll_ms, self._poll)
+            return
+
+        self._cleanup()
+        ok, value = message
+        if ok:
+            self.on_done(value)
+        elif self.on_error is not None:
+            self.on_error(value)
+        else:
+            print(value)
+
+    def _cleanup(self):
+        self.process.join()
+        self.conn.close()
+        self.process = None
+        self.conn = None
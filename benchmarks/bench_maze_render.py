@@ -0,0 +1,120 @@
+"""
+Per-move redraw cost of the maze renderers across maze sizes.
+
+Run with:
+    python benchmarks/bench_maze_render.py
+
+Uses a real Tk canvas when a display is available, otherwise a canvas
+stand-in that only counts the Tk commands issued. Both the time and the
+command count per move should stay flat as the maze grows. The viewport
+renderer is also run on mazes too large to draw in full.
+"""
+
+import os
+import random
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze import generate_maze
+from maze_grid import MazeGrid
+from maze_render import MazeRenderer, TiledMazeRenderer
+from maze_trail import Trail
+
+SIZES = [21, 51, 101, 201]
+VIEWPORT_SIZES = SIZES + [1001, 2001]
+MOVES = 500
+
+
+class CountingCanvas:
+    """Canvas stand-in that counts Tk commands instead of drawing"""
+
+    def __init__(self):
+        self.commands = 0
+        self.next_id = 1
+        self.options = {'width': 400, 'height': 400}
+
+    def _create(self, *args, **kwargs):
+        self.commands += 1
+        self.next_id += 1
+        return self.next_id - 1
+
+    create_rectangle = create_oval = create_polygon = _create
+
+    def _command(self, *args, **kwargs):
+        self.commands += 1
+
+    delete = itemconfigure = coords = tag_raise = xview_moveto = yview_moveto = _command
+
+    def config(self, **options):
+        self.commands += 1
+        self.options.update(options)
+
+    def cget(self, option):
+        return self.options[option]
+
+    def winfo_width(self):
+        return 1
+
+    winfo_height = winfo_width
+
+
+def random_walk(grid, start, steps, rng):
+    """Yield a sequence of valid neighbouring positions"""
+    y, x = start
+    for _ in range(steps):
+        options = [(ny, nx) for ny, nx in [(y+1, x), (y-1, x), (y, x+1), (y, x-1)]
+                   if grid.in_bounds(nx, ny) and not grid.is_wall(nx, ny)]
+        y, x = rng.choice(options)
+        yield y, x
+
+
+def bench(canvas, renderer_class, size):
+    maze = generate_maze(size, size, 0.7)
+    grid = MazeGrid.from_maze(maze)
+    renderer = renderer_class(canvas, 4)
+    path_taken = Trail(grid.width, grid.height)
+    path_taken.add(maze.entrance)
+    renderer.build(grid, path_taken, maze.entrance)
+
+    walk = list(random_walk(grid, maze.entrance, MOVES, random.Random(size)))
+    before = getattr(canvas, 'commands', 0)
+    start = time.perf_counter()
+    for pos in walk:
+        if path_taken.add(pos):
+            renderer.mark_visited(pos)
+        renderer.move_player(pos)
+    if isinstance(canvas, tk.Canvas):
+        canvas.update_idletasks()
+    elapsed = time.perf_counter() - start
+    commands = getattr(canvas, 'commands', 0) - before
+    return elapsed / MOVES * 1e6, commands / MOVES
+
+
+def main():
+    try:
+        root = tk.Tk()
+        canvas = tk.Canvas(root)
+        canvas.pack()
+        backend = 'tk'
+    except tk.TclError:
+        root = None
+        canvas = CountingCanvas()
+        backend = 'counting'
+
+    print(f"backend: {backend}")
+    print(f"{'renderer':>9} {'size':>6} {'us/move':>10} {'cmds/move':>10}")
+    for name, renderer_class, sizes in [('full', MazeRenderer, SIZES),
+                                        ('viewport', TiledMazeRenderer, VIEWPORT_SIZES)]:
+        for size in sizes:
+            us_per_move, commands_per_move = bench(canvas, renderer_class, size)
+            print(f"{name:>9} {size:>6} {us_per_move:>10.1f} {commands_per_move:>10.2f}")
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Shortest-path timings: the original path-copying BFS against the
+parent-pointer solver and the cached distance field.
+
+Run with:
+    python benchmarks/bench_shortest_path.py
+"""
+
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze import generate_maze, Cell
+from maze_grid import MazeGrid
+from maze_solvers import bfs_shortest_path, descend, distance_field
+
+SIZES = [101, 501]
+COMPLEXITIES = [0.7, 0.1]
+
+
+def legacy_find_shortest_path(maze):
+    """The original MazeGame.find_shortest_path, storing a path copy per queue entry"""
+    queue = deque([(maze.entrance, [maze.entrance])])
+    visited = {maze.entrance}
+
+    while queue:
+        current, path = queue.popleft()
+        if current == maze.exit:
+            return path
+
+        y, x = current
+        for ny, nx in [(y+1, x), (y-1, x), (y, x+1), (y, x-1)]:
+            if (0 <= ny < maze.height and 0 <= nx < maze.width and
+                    (ny, nx) not in visited and maze.grid[ny][nx] != Cell.WALL):
+                visited.add((ny, nx))
+                queue.append(((ny, nx), path + [(ny, nx)]))
+
+    return []
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'size':>6} {'cplx':>5} {'legacy ms':>10} {'parent ms':>10} "
+          f"{'field ms':>10} {'descend ms':>11} {'length':>7}")
+    for size in SIZES:
+        for complexity in COMPLEXITIES:
+            maze = generate_maze(size, size, complexity)
+            grid = MazeGrid.from_maze(maze)
+            legacy, legacy_ms = timed(legacy_find_shortest_path, maze)
+            path, parent_ms = timed(bfs_shortest_path, grid, maze.entrance, maze.exit)
+            field, field_ms = timed(distance_field, grid, maze.exit)
+            descended, descend_ms = timed(descend, grid, field, maze.entrance)
+            assert len(legacy) == len(path) == len(descended)
+            print(f"{size:>6} {complexity:>5} {legacy_ms:>10.1f} {parent_ms:>10.1f} "
+                  f"{field_ms:>10.1f} {descend_ms:>11.2f} {len(path) - 1:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the pytest-benchmark suite.
+
+Run with:
+    python -m pytest benchmarks --benchmark-json=benchmark.json
+
+Benchmark modules skip themselves when pytest-benchmark is not installed,
+and the maze generation benchmarks when the maze generator is missing. Benchmarks that need a
+real Tk canvas use the tk_root fixture, which starts a virtual display via
+pyvirtualdisplay when there is no display and that package is available,
+and skips otherwise.
+"""
+
+import os
+import sys
+import tkinter as tk
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def display():
+    """Make sure an X display is available, starting a virtual one if needed"""
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        yield None
+        return
+
+    try:
+        from pyvirtualdisplay import Display
+    except ImportError:
+        pytest.skip("no display and pyvirtualdisplay is not installed")
+
+    virtual = Display(visible=False, size=(1280, 1024))
+    try:
+        virtual.start()
+    except Exception as e:  # Xvfb missing or failed to start
+        pytest.skip(f"could not start a virtual display: {e}")
+    try:
+        yield virtual
+    finally:
+        virtual.stop()
+
+
+@pytest.fixture
+def tk_root(display):
+    """A withdrawn Tk root, destroyed after the benchmark"""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk is not usable here: {e}")
+    root.withdraw()
+    try:
+        yield root
+    finally:
+        root.destroy()
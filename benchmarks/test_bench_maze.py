@@ -0,0 +1,277 @@
+"""
+Maze game hot paths: generation, shortest path and per-move redraw.
+
+Only test_generate_maze needs the maze generator; everything else runs on
+mazes carved here from a seed, so it also runs where maze is missing.
+"""
+
+import io
+import random
+import tkinter as tk
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from maze_batch import GeneratedMaze, generate_compact, generate_seeded_maze
+from maze_grid import ENTRANCE, EXIT, PATH, WALL, MazeGrid
+from maze_render import BitmapMazeRenderer, MazeRenderer, TiledMazeRenderer, rasterize_grid
+from maze_solvers import SOLVERS, DescentPath, bfs_shortest_path, descend, distance_field
+from maze_trail import Trail, key_target
+from replay import MAZE_KEYS, MazeRecording, play_maze, read_recording
+
+SIZES = [21, 51, 101, 201]
+COMPLEXITIES = [0.1, 0.7]
+SEED = 1234
+
+
+def carve_maze(size: int, seed: int, loops: float = 0.05) -> GeneratedMaze:
+    """
+    Depth-first carved size x size maze (size odd), entrance top left and
+    exit bottom right, with a fraction of the inner walls knocked out so
+    there is more than one route.
+    """
+    rng = random.Random(seed)
+    grid = MazeGrid(size, size, WALL)
+    grid.set(1, 1, PATH)
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < x + dx < size - 1 and 0 < y + dy < size - 1
+                   and grid.is_wall(x + dx, y + dy)]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        grid.set((x + nx) // 2, (y + ny) // 2, PATH)
+        grid.set(nx, ny, PATH)
+        stack.append((nx, ny))
+    for _ in range(int(loops * size * size / 4)):
+        grid.set(rng.randrange(1, size - 1), rng.randrange(1, size - 1), PATH)
+    grid.set(0, 1, ENTRANCE)
+    grid.set(size - 1, size - 2, EXIT)
+    return GeneratedMaze(seed, grid, (1, 0), (size - 2, size - 1))
+
+
+def grid_from_rows(*rows: str) -> MazeGrid:
+    """Hand-drawn grid: '#' is a wall, anything else open"""
+    grid = MazeGrid(len(rows[0]), len(rows))
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == '#':
+                grid.set(x, y, WALL)
+    return grid
+
+
+def assert_walkable(grid, path):
+    """Every step of path is an open cell next to the previous one"""
+    for (y1, x1), (y2, x2) in zip(path, path[1:]):
+        assert abs(y1 - y2) + abs(x1 - x2) == 1
+    assert not any(grid.is_wall(x, y) for y, x in path)
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size}x{size}")
+def generated(request):
+    return carve_maze(request.param, SEED)
+
+
+@pytest.mark.parametrize('complexity', COMPLEXITIES)
+@pytest.mark.parametrize('size', SIZES)
+def test_generate_maze(benchmark, size, complexity):
+    pytest.importorskip('maze')
+    benchmark.group = f"generate_maze {size}x{size}"
+    benchmark.extra_info.update(size=size, complexity=complexity, seed=SEED)
+    maze = benchmark(generate_seeded_maze, size, size, complexity, SEED)
+    assert maze.width == size
+
+
+def test_find_shortest_path(benchmark, generated):
+    """Cold solve as MazeGame does it: distance field from the exit, then descend"""
+    grid = generated.grid
+    benchmark.group = f"shortest_path {grid.width}x{grid.height}"
+
+    def solve():
+        return descend(grid, distance_field(grid, generated.exit), generated.entrance)
+
+    path = benchmark(solve)
+    assert path[0] == generated.entrance and path[-1] == generated.exit
+
+
+def test_bfs_shortest_path(benchmark, generated):
+    grid = generated.grid
+    benchmark.group = f"shortest_path {grid.width}x{grid.height}"
+    path = benchmark(bfs_shortest_path, grid, generated.entrance, generated.exit)
+    assert path[-1] == generated.exit
+
+
+@pytest.mark.parametrize('solver', list(SOLVERS))
+def test_solver(benchmark, generated, solver):
+    grid = generated.grid
+    benchmark.group = f"solvers {grid.width}x{grid.height}"
+    stats = {}
+    SOLVERS[solver](grid, generated.entrance, generated.exit, stats)
+    benchmark.extra_info['expanded'] = stats['expanded']
+    path = benchmark(SOLVERS[solver], grid, generated.entrance, generated.exit)
+    assert path[0] == generated.entrance and path[-1] == generated.exit
+    assert len(path) == len(bfs_shortest_path(grid, generated.entrance, generated.exit))
+    assert_walkable(grid, path)
+
+
+@pytest.mark.parametrize('solver', list(SOLVERS))
+def test_solver_unreachable(solver):
+    grid = grid_from_rows(
+        '.....',
+        '#####',
+        '.....',
+    )
+    assert SOLVERS[solver](grid, (0, 0), (2, 4)) == []
+
+
+@pytest.mark.parametrize('solver', list(SOLVERS))
+def test_solver_start_is_goal(solver):
+    grid = grid_from_rows(
+        '...',
+        '.#.',
+        '...',
+    )
+    assert SOLVERS[solver](grid, (2, 1), (2, 1)) == [(2, 1)]
+
+
+@pytest.mark.parametrize('solver', list(SOLVERS))
+def test_solver_corridor(solver):
+    """A 1-wide corridor with a dead-end branch has exactly one route"""
+    grid = grid_from_rows(
+        '#######',
+        '....#.#',
+        '###.#.#',
+        '#.....#',
+        '#.###..',
+    )
+    path = SOLVERS[solver](grid, (1, 0), (4, 6))
+    assert path == [(1, 0), (1, 1), (1, 2), (1, 3), (2, 3), (3, 3), (3, 4), (3, 5), (4, 5), (4, 6)]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_descent_path_follows_walk(seed):
+    """
+    The hint path kept up to date from reported changes matches a fresh
+    descend() after every move: steps, backtracking and jumps off the path.
+    """
+    maze = carve_maze(21, seed)
+    grid = maze.grid
+    distances = distance_field(grid, maze.exit)
+    open_cells = [(y, x) for y in range(grid.height) for x in range(grid.width)
+                  if not grid.is_wall(x, y)]
+    rng = random.Random(seed)
+    hint = DescentPath(grid, distances)
+    shown = set()
+    pos = maze.entrance
+    for move in range(400):
+        if move % 25 == 24:
+            pos = rng.choice(open_cells)  # Reset or jump, usually far off the path
+        else:
+            y, x = pos
+            pos = rng.choice([(ny, nx) for ny, nx in ((y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1))
+                              if grid.in_bounds(nx, ny) and not grid.is_wall(nx, ny)])
+        added, removed = hint.move_to(pos)
+        assert shown.issuperset(removed) and shown.isdisjoint(added)
+        shown.difference_update(removed)
+        shown.update(added)
+        expected = descend(grid, distances, pos)
+        assert hint.positions() == expected
+        assert shown == set(expected)
+
+
+def test_cached_path_descent(benchmark, generated):
+    """Repeat solve once the exit distance field is cached"""
+    grid = generated.grid
+    benchmark.group = f"shortest_path {grid.width}x{grid.height}"
+    distances = distance_field(grid, generated.exit)
+    path = benchmark(descend, grid, distances, generated.entrance)
+    assert path[-1] == generated.exit
+
+
+@pytest.mark.parametrize('cell_size', [1, 4, 30])
+def test_rasterize_grid(benchmark, generated, cell_size):
+    grid = generated.grid
+    benchmark.group = f"rasterize {grid.width}x{grid.height}"
+    benchmark.extra_info['cell_size'] = cell_size
+    data = benchmark(rasterize_grid, grid, cell_size)
+    assert len(data) > grid.width * grid.height * cell_size * cell_size * 3
+
+
+def test_maze_replay_round_trip():
+    """A maze session with a reset, written to a replay file and read back, ends where it did live"""
+    pytest.importorskip('maze')
+    size, complexity = 21, 0.7
+    maze = generate_compact(size, size, complexity, SEED)
+    recording = MazeRecording(SEED, size, size, complexity)
+    rng = random.Random(SEED)
+    pos = maze.entrance
+    trail = Trail(size, size)
+    trail.add(pos)
+    # Play the way MazeGame.press_key and reset_position do
+    for ms in range(0, 6000, 10):
+        if ms == 3000:
+            recording.reset(ms)
+            pos = maze.entrance
+            trail = Trail(size, size)
+            trail.add(pos)
+            continue
+        keysym = rng.choice(MAZE_KEYS)
+        recording.key(ms, keysym)
+        target = key_target(maze.grid, pos, keysym)
+        if target is not None:
+            pos = target
+            trail.add(pos)
+
+    stream = io.BytesIO()
+    recording.write(stream, end=6000)
+    stream.seek(0)
+    replayed_maze, replayed_pos, replayed_trail = play_maze(read_recording(stream))
+    assert replayed_maze.grid.cells == maze.grid.cells
+    assert replayed_pos == pos
+    assert list(replayed_trail) == list(trail)
+    assert len(trail) > 1
+
+
+@pytest.mark.parametrize('renderer_class', [MazeRenderer, BitmapMazeRenderer],
+                         ids=['vector', 'bitmap'])
+def test_first_frame(benchmark, tk_root, generated, renderer_class):
+    """Time to build the static layer and get it drawn"""
+    grid = generated.grid
+    benchmark.group = f"first_frame {grid.width}x{grid.height}"
+    canvas = tk.Canvas(tk_root)
+    renderer = renderer_class(canvas, 10)
+
+    def first_frame():
+        renderer.build(grid, [generated.entrance], generated.entrance)
+        canvas.update_idletasks()
+
+    benchmark(first_frame)
+
+
+@pytest.mark.parametrize('renderer_class', [MazeRenderer, TiledMazeRenderer, BitmapMazeRenderer],
+                         ids=['vector', 'viewport', 'bitmap'])
+def test_render_move(benchmark, tk_root, generated, renderer_class):
+    """Per-move redraw on a real canvas: mark the cell visited and move the player"""
+    grid = generated.grid
+    benchmark.group = f"render_move {grid.width}x{grid.height}"
+    canvas = tk.Canvas(tk_root, width=grid.width * 10, height=grid.height * 10)
+    renderer = renderer_class(canvas, 10)
+    renderer.build(grid, [generated.entrance], generated.entrance)
+
+    rng = random.Random(SEED)
+    position = [generated.entrance]
+
+    def move():
+        y, x = position[0]
+        options = [(ny, nx) for ny, nx in ((y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1))
+                   if grid.in_bounds(nx, ny) and not grid.is_wall(nx, ny)]
+        position[0] = rng.choice(options)
+        renderer.mark_visited(position[0])
+        renderer.move_player(position[0])
+        canvas.update_idletasks()
+
+    benchmark(move)
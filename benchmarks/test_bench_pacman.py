@@ -0,0 +1,201 @@
+"""
+Pacman hot paths: collision checks, ghost AI, a full tick, a render and
+the vectorized multi-board step.
+"""
+
+import io
+import random
+import tkinter as tk
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from pacman_render import PacmanScene
+from pacman_sim import DOT_EATEN, GHOST_COLORS, POWER_DOT_EATEN, Ghost, PacmanSimulation
+from replay import END, RESTART, PacmanRecording, play_pacman, read_recording
+
+GHOST_COUNTS = [4, 40, 400]
+SEED = 1234
+
+
+def populate(sim, ghost_count):
+    """Replace the ghosts with ghost_count ghosts spread over open cells"""
+    if ghost_count == len(sim.ghosts):
+        return
+    open_cells = [(x, y) for y in range(sim.grid_height) for x in range(sim.grid_width)
+                  if not sim.maze.is_wall(x, y)]
+    sim.ghosts = [Ghost(*sim.random.choice(open_cells), GHOST_COLORS[i % len(GHOST_COLORS)])
+                  for i in range(ghost_count)]
+
+
+def make_sim(ghost_count=4, power_mode=False):
+    """Seeded simulation with ghost_count ghosts"""
+    sim = PacmanSimulation(seed=SEED)
+    populate(sim, ghost_count)
+    sim.power_mode = power_mode
+    return sim
+
+
+def autopilot(sim, rng=None):
+    """Pick a random legal heading, keeping the current one most of the time"""
+    rng = rng or sim.random
+    pacman = sim.pacman
+    options = sim.moves[pacman.y * sim.grid_width + pacman.x]
+    if pacman.direction not in options or rng.random() < 0.1:
+        sim.steer(rng.choice(list(options)))
+
+
+def record_session(ticks):
+    """
+    Record an autopilot session the way PacmanGame2 records a player.
+
+    Returns the recording and the live simulation it was recorded from.
+    """
+    sim = PacmanSimulation(seed=SEED)
+    recording = PacmanRecording(SEED, sim.tick_ms)
+    rng = random.Random(SEED)
+    for _ in range(ticks):
+        if sim.game_over:
+            recording.restart(sim.tick)
+            sim.reset()
+        before = sim.pacman.direction
+        autopilot(sim, rng)
+        if sim.pacman.direction != before:
+            recording.steer(sim.tick, sim.pacman.direction)
+        sim.step()
+    recording.log(sim.tick, END)
+    return recording, sim
+
+
+def test_dot_collisions(benchmark):
+    sim = make_sim()
+    benchmark.group = "collisions"
+
+    def check():
+        sim._check_dot_collision()
+        sim._check_power_dot_collision()
+
+    benchmark(check)
+
+
+@pytest.mark.parametrize('ghost_count', GHOST_COUNTS)
+def test_ghost_collision(benchmark, ghost_count):
+    sim = make_sim(ghost_count)
+    # Move Pacman off every ghost so the check stays read-only
+    occupied = {(ghost.x, ghost.y) for ghost in sim.ghosts}
+    sim.pacman.x, sim.pacman.y = next(
+        (x, y) for y in range(sim.grid_height) for x in range(sim.grid_width)
+        if not sim.maze.is_wall(x, y) and (x, y) not in occupied
+    )
+    benchmark.group = "collisions"
+    benchmark.extra_info['ghosts'] = ghost_count
+    benchmark(sim.check_ghost_collision)
+    assert len(sim.ghosts) == ghost_count
+
+
+@pytest.mark.parametrize('power_mode', [False, True], ids=['chase', 'flee'])
+@pytest.mark.parametrize('ghost_count', GHOST_COUNTS)
+def test_move_ghosts(benchmark, ghost_count, power_mode):
+    sim = make_sim(ghost_count, power_mode)
+    benchmark.group = f"move_ghosts {'flee' if power_mode else 'chase'}"
+    benchmark.extra_info['ghosts'] = ghost_count
+    benchmark(sim.move_ghosts)
+
+
+@pytest.mark.parametrize('ghost_count', GHOST_COUNTS)
+def test_full_tick(benchmark, ghost_count):
+    """One simulation step with an autopilot steering; restarts on game over"""
+    sim = make_sim(ghost_count)
+    benchmark.group = "tick"
+    benchmark.extra_info['ghosts'] = ghost_count
+
+    def tick():
+        if sim.game_over:
+            sim.reset()
+            populate(sim, ghost_count)
+        autopilot(sim)
+        sim.step()
+
+    benchmark(tick)
+
+
+def test_replay_throughput(benchmark):
+    """Headless playback of a recorded session at full speed"""
+    recording, _ = record_session(3000)
+    benchmark.group = "replay"
+    benchmark.extra_info['events'] = len(recording)
+    sim, ticks = benchmark(play_pacman, recording)
+    benchmark.extra_info['ticks'] = ticks
+
+
+def test_replay_round_trip():
+    """A session written to a replay file and read back ends exactly where the live one did"""
+    recording, live = record_session(3000)
+    assert any(kind == RESTART for _, kind, _, _ in recording.events())
+    stream = io.BytesIO()
+    recording.write(stream)
+    stream.seek(0)
+    replayed, _ = play_pacman(read_recording(stream))
+    assert replayed.pacman.score == live.pacman.score
+    assert replayed.pacman.lives == live.pacman.lives
+    assert replayed.tick == live.tick
+    assert [(ghost.x, ghost.y) for ghost in replayed.ghosts] == [(ghost.x, ghost.y) for ghost in live.ghosts]
+
+
+def test_render_frame(benchmark, tk_root):
+    sim = make_sim()
+    canvas = tk.Canvas(tk_root, width=sim.grid_width * 20, height=sim.grid_height * 20)
+    scene = PacmanScene(canvas, 20)
+    scene.build_level(sim.maze, sim.dots, sim.power_dots)
+    benchmark.group = "render"
+
+    def frame():
+        if sim.game_over:
+            sim.reset()
+            scene.build_level(sim.maze, sim.dots, sim.power_dots)
+        autopilot(sim)
+        for event in sim.step():
+            if event[0] in (DOT_EATEN, POWER_DOT_EATEN):
+                scene.remove_dot(*event[1])
+        scene.render(sim.pacman, sim.ghosts, sim.power_mode)
+        canvas.update_idletasks()
+
+    benchmark(frame)
+
+
+@pytest.mark.parametrize('num_envs', [64, 1024])
+def test_vec_step(benchmark, num_envs):
+    """One lockstep tick of the NumPy multi-board engine with random actions"""
+    np = pytest.importorskip('numpy')
+    from pacman_vec import NOOP, PacmanVecEnv
+
+    env = PacmanVecEnv(num_envs, seed=SEED)
+    env.reset()
+    actions = np.random.default_rng(SEED).integers(0, NOOP + 1, (256, num_envs))
+    tick = [0]
+
+    def step():
+        env.step(actions[tick[0] % len(actions)])
+        tick[0] += 1
+
+    benchmark.group = "vec_step"
+    benchmark.extra_info['envs'] = num_envs
+    benchmark(step)
+
+
+@pytest.mark.parametrize('actions', [[0, 1, 2], [0, 1, 2, 5], [-1, 0, 0, 0], [0, 1.0, 2, 3]],
+                         ids=['short', 'too-high', 'negative', 'float'])
+def test_vec_rejects_bad_actions(actions):
+    """Bad actions raise before any environment state changes"""
+    pytest.importorskip('numpy')
+    from pacman_vec import PacmanVecEnv
+
+    env = PacmanVecEnv(4, seed=SEED)
+    env.reset()
+    before = {name: getattr(env, name).copy()
+              for name in ('heading', 'ticks', 'move_timer', 'ghost_move_timer', 'pacman')}
+    with pytest.raises(ValueError):
+        env.step(actions)
+    for name, value in before.items():
+        assert (getattr(env, name) == value).all(), name
@@ -0,0 +1,41 @@
+"""
+MazeGrid's shared storage: the zero-copy views solvers and renderers use.
+"""
+
+import pytest
+
+from maze_grid import PATH, WALL, MazeGrid
+
+
+def make_grid():
+    grid = MazeGrid(5, 3)
+    grid.set(1, 0, WALL)
+    grid.set(4, 2, WALL)
+    return grid
+
+
+def test_view_shares_storage():
+    grid = make_grid()
+    view = grid.view()
+    assert view[grid.index(1, 0)] == WALL
+    grid.set(2, 1, WALL)
+    assert view[grid.index(2, 1)] == WALL
+    view[grid.index(1, 0)] = PATH
+    assert not grid.is_wall(1, 0)
+
+
+def test_row_shares_storage():
+    grid = make_grid()
+    assert bytes(grid.row(2)) == bytes([PATH] * 4 + [WALL])
+    grid.row(1)[3] = WALL
+    assert grid.is_wall(3, 1)
+
+
+def test_as_numpy_shares_storage():
+    pytest.importorskip('numpy')
+    grid = make_grid()
+    cells = grid.as_numpy()
+    assert cells.shape == (3, 5)
+    assert cells[0, 1] == WALL and cells[2, 4] == WALL
+    cells[1, 0] = WALL
+    assert grid.is_wall(0, 1)
@@ -0,0 +1,127 @@
+"""
+Pacman level files: parsing, formatting, the stock board and the cache.
+"""
+
+import os
+
+import pytest
+
+from maze_grid import PATH, WALL
+from pacman_level import CLASSIC_LEVEL, classic_board, format_level, load_board, parse_level
+
+SMALL_LEVEL = """\
+name Small
+wrap y
+pacman 1 1
+ghost 3 1 red
+ghost 3 3 gray50
+map
+#####
+#.o.#
+#   #
+#...#
+""" + ' ' * 5 + '\n'  # A bottom row of empty floor, the wrap y tunnel target
+
+
+def assert_same_board(a, b):
+    assert a.grid.width == b.grid.width and a.grid.height == b.grid.height
+    assert a.grid.cells == b.grid.cells
+    assert a._replace(grid=None) == b._replace(grid=None)
+
+
+def legacy_classic_layout():
+    """
+    The board PacmanSimulation.create_maze, create_dots and
+    create_power_dots built before levels moved to files, as
+    (cells, dots, power dots). Rectangles were filled as flat runs of
+    the row-major grid, so boxes reaching past the right edge spill into
+    the next row; levels/classic.txt keeps that.
+    """
+    width, height = 28, 31
+    cells = bytearray([WALL]) * (width * height)
+
+    def fill(x1, y1, x2, y2, value=PATH):
+        for y in range(y1, y2 + 1):
+            start = y * width + x1
+            cells[start:start + x2 - x1 + 1] = bytes([value]) * (x2 - x1 + 1)
+
+    for y in (1, 5, 8, 14, 20, 23, 26, 29):
+        fill(1, y, width - 2, y)
+    for x in (1, 6, 12, 15, 21, 26):
+        fill(x, 1, x, height - 2)
+    fill(11, 11, 16, 14)
+    cells[11 * width + 13] = cells[11 * width + 14] = WALL
+    cells[14 * width] = cells[14 * width + width - 1] = PATH
+    for y1, x1, y2, x2 in ((2, 2, 4, 4), (2, 23, 4, 25), (26, 2, 28, 4), (26, 23, 28, 25)):
+        fill(x1, y1, x2, y2)
+
+    excluded = {(14, 23), (13, 11), (14, 11), (13, 12), (14, 12)}
+    dots = {(x, y) for y in range(height) for x in range(width)
+            if cells[y * width + x] != WALL and (x, y) not in excluded
+            and not (11 <= y <= 14 and 11 <= x <= 16)}
+    power_dots = {(1, 3), (26, 3), (1, 23), (26, 23)}
+    return cells, dots, power_dots
+
+
+def test_classic_matches_legacy_layout():
+    board = classic_board()
+    cells, dots, power_dots = legacy_classic_layout()
+    assert (board.width, board.height) == (28, 31)
+    assert board.grid.cells == cells
+    assert board.wrap_x and not board.wrap_y
+    assert board.pacman_start == (14, 23)
+    assert board.ghost_starts == (((13, 11), 'red'), ((14, 11), 'pink'),
+                                  ((13, 12), 'cyan'), ((14, 12), 'orange'))
+    assert board.power_dots == power_dots
+    # Power-dot cells used to hold a regular dot as well; now they only hold the power dot
+    assert power_dots <= dots
+    assert board.dots == dots - power_dots
+
+
+@pytest.mark.parametrize('text', [SMALL_LEVEL, None], ids=['small', 'classic'])
+def test_format_round_trip(text):
+    board = parse_level(text, 'small') if text else classic_board()
+    assert_same_board(parse_level(format_level(board)), board)
+
+
+def test_trailing_space_rows_are_kept():
+    board = parse_level(SMALL_LEVEL + "\n\n")  # Empty lines after the map are dropped
+    assert board.height == 5
+    assert board.grid.cells[4 * 5:] == bytes([PATH] * 5)
+    # Going up from the top row of a 'wrap y' board lands on the all-space bottom row
+    assert board.moves[0 * 5 + 0][(0, -1)] == (0, 4)
+
+
+@pytest.mark.parametrize('line, message', [
+    ('ghost 3 1', "expected 'ghost x y colour'"),
+    ('ghost 3 one red', "expected 'ghost x y colour'"),
+    ('pacman 1', "expected 'pacman x y'"),
+    ('pacman 1 a', "expected 'pacman x y'"),
+    ('ghost 3 1 12', "'12' is not a colour name"),
+    ('bogus 1', "unknown directive 'bogus'"),
+])
+def test_directive_errors(line, message):
+    text = SMALL_LEVEL.replace('ghost 3 1 red', line)
+    with pytest.raises(ValueError, match=f"^Level line 4: {message}$"):
+        parse_level(text)
+
+
+def test_load_board_cache(tmp_path):
+    path = tmp_path / 'small.txt'
+    path.write_text(SMALL_LEVEL)
+    mtime = path.stat().st_mtime_ns
+    first = load_board(str(path))
+    assert load_board(str(path)) is first
+
+    # Same mtime: the cached board is reused, even though the text changed
+    path.write_text(SMALL_LEVEL.replace('pacman 1 1', 'pacman 2 3'))
+    os.utime(path, ns=(mtime, mtime))
+    assert load_board(str(path)) is first
+
+    # New mtime: parsed again
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+    second = load_board(str(path))
+    assert second is not first
+    assert second.pacman_start == (2, 3)
+    assert load_board(str(path)) is second
+    assert load_board(CLASSIC_LEVEL) is classic_board()
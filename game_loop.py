@@ -0,0 +1,86 @@
+"""
+Fixed-timestep game loop for Tk widgets.
+
+Logic updates run at a fixed rate driven by a time.perf_counter
+accumulator, independently of how often the canvas is redrawn. When a
+frame takes too long, several updates run back to back before the next
+render (frame skip), and the next callback is scheduled for when the
+following update is due instead of a fixed delay, so timing does not
+drift under load.
+"""
+
+import math
+import time
+from typing import Callable
+
+
+class FixedTimestepLoop:
+    """
+    Runs update() every step_ms of real time and render() once per frame.
+
+    Attributes:
+        step_ms (float): Duration of one logic update in milliseconds
+        max_updates (int): Most updates run before a render; any backlog
+            beyond that is dropped rather than replayed
+        frames (int): Frames rendered so far
+        updates (int): Logic updates run so far
+        skipped (int): Updates run without a render in between
+    """
+
+    def __init__(self, widget, update: Callable[[], None], render: Callable[[], None],
+                 step_ms: float = 33, max_updates: int = 5):
+        self.widget = widget
+        self.update = update
+        self.render = render
+        self.step_ms = step_ms
+        self.max_updates = max_updates
+        self.running = False
+        self.after_id = None
+        self.accumulator = 0.0
+        self.last_time = 0.0
+        self.frames = 0
+        self.updates = 0
+        self.skipped = 0
+
+    def start(self):
+        """Start (or restart) the loop from the current time"""
+        self.stop()
+        self.running = True
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+        self.after_id = self.widget.after(0, self._frame)
+
+    def stop(self):
+        """Stop the loop and cancel any scheduled frame"""
+        self.running = False
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _frame(self):
+        self.after_id = None
+        now = time.perf_counter()
+        self.accumulator += (now - self.last_time) * 1000
+        self.last_time = now
+
+        updates = 0
+        while self.accumulator >= self.step_ms and self.running:
+            if updates == self.max_updates:
+                # Too far behind: drop the backlog instead of spiralling
+                self.accumulator = 0.0
+                break
+            self.update()
+            self.accumulator -= self.step_ms
+            updates += 1
+
+        # Nothing to draw if the state did not change
+        if updates:
+            self.skipped += updates - 1
+            self.updates += updates
+            self.render()
+            self.frames += 1
+
+        if self.running:
+            # Wake up when the next update is due
+            delay = max(1, math.ceil(self.step_ms - self.accumulator))
+            self.after_id = self.widget.after(delay, self._frame)
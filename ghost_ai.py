@@ -0,0 +1,154 @@
+"""
+Shared flow fields for ghost targeting.
+
+Instead of running one search per ghost, FlowFields computes a single
+distance field from Pacman's cell (chase) and, in power mode, a single
+flee field, and caches each until Pacman moves to another cell. Any number
+of ghosts then choose their move by comparing at most four field values.
+
+MoveChoices goes one step further for large swarms: per field and Pacman
+cell it remembers the move chosen from each cell, so ghosts sharing a
+cell, or passing through it again before Pacman moves, cost one dict
+lookup.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Direction = Tuple[int, int]
+# Per cell: ((direction, (x, y), flat index), ...) for every legal move
+MoveTargets = Sequence[Tuple[Tuple[Direction, Tuple[int, int], int], ...]]
+
+# Flee field weight: how strongly distance from Pacman is preferred over
+# simply running downhill to a nearby dead end
+FLEE_WEIGHT = -1.2
+
+
+def build_move_targets(moves: List[dict], width: int) -> List[tuple]:
+    """Flatten a MazeGrid.neighbour_table into per-cell move target tuples"""
+    return [
+        tuple((direction, (x, y), y * width + x) for direction, (x, y) in cell.items())
+        for cell in moves
+    ]
+
+
+class MoveChoices(dict):
+    """
+    Lazily filled cell -> chosen move target for one field.
+
+    A cell's entry is the option with the lowest field value (the highest
+    with lowest=False), first in neighbour order on ties, or None if the
+    cell has no moves. Computed the first time a ghost asks for the cell.
+    """
+
+    __slots__ = ('targets', 'field', 'lowest')
+
+    def __init__(self, targets: MoveTargets, field: Sequence[float], lowest: bool = True):
+        super().__init__()
+        self.targets = targets
+        self.field = field
+        self.lowest = lowest
+
+    def __missing__(self, here: int):
+        options = self.targets[here]
+        field = self.field
+        if not options:
+            choice = None
+        elif self.lowest:
+            choice = min(options, key=lambda option: field[option[2]])
+        else:
+            choice = max(options, key=lambda option: field[option[2]])
+        self[here] = choice
+        return choice
+
+
+class FlowFields:
+    """
+    Chase and flee fields over a static move graph, cached per source cell.
+
+    Attributes:
+        unreachable (int): Chase distance used for cells Pacman cannot reach
+    """
+
+    def __init__(self, targets: MoveTargets):
+        self.targets = targets
+        self.size = len(targets)
+        self.unreachable = self.size + 1
+        self._chase_source = None
+        self._chase = None
+        self._flee_source = None
+        self._flee = None
+        # kind -> (source, MoveChoices)
+        self._choices: Dict[str, Tuple[int, MoveChoices]] = {}
+
+    def chase(self, source: int) -> List[int]:
+        """BFS steps from every cell to source (flat index)"""
+        if source != self._chase_source:
+            self._chase = self._bfs(source)
+            self._chase_source = source
+        return self._chase
+
+    def flee(self, source: int) -> List[float]:
+        """
+        Flee field for running away from source; lower is safer.
+
+        Starts from FLEE_WEIGHT * chase distance and relaxes it with
+        Dijkstra, so following it downhill leads away from source without
+        getting trapped in the nearest corner.
+        """
+        if source != self._flee_source:
+            chase = self.chase(source)
+            unreachable = self.unreachable
+            field = [d * FLEE_WEIGHT if d != unreachable else 0.0 for d in chase]
+            heap = [(value, index) for index, value in enumerate(field) if chase[index] != unreachable]
+            heapq.heapify(heap)
+            targets = self.targets
+            while heap:
+                value, index = heapq.heappop(heap)
+                if value > field[index]:
+                    continue
+                step = value + 1
+                for _, _, neighbour in targets[index]:
+                    if step < field[neighbour]:
+                        field[neighbour] = step
+                        heapq.heappush(heap, (step, neighbour))
+            self._flee = field
+            self._flee_source = source
+        return self._flee
+
+    def toward(self, source: int) -> MoveChoices:
+        """Per-cell move one step closer to source"""
+        return self._move_choices('toward', source, self.chase, True)
+
+    def away(self, source: int) -> MoveChoices:
+        """Per-cell move one step further from source along the chase field"""
+        return self._move_choices('away', source, self.chase, False)
+
+    def escape(self, source: int) -> MoveChoices:
+        """Per-cell move downhill on the flee field"""
+        return self._move_choices('escape', source, self.flee, True)
+
+    def _move_choices(self, kind: str, source: int, field, lowest: bool) -> MoveChoices:
+        cached: Optional[Tuple[int, MoveChoices]] = self._choices.get(kind)
+        if cached is None or cached[0] != source:
+            cached = self._choices[kind] = (source, MoveChoices(self.targets, field(source), lowest))
+        return cached[1]
+
+    def _bfs(self, source: int) -> List[int]:
+        # Moves between open cells are symmetric (tunnel wraps included), so
+        # distances from the source equal distances to it
+        distances = [self.unreachable] * self.size
+        distances[source] = 0
+        frontier = [source]
+        targets = self.targets
+        step = 0
+        while frontier:
+            step += 1
+            next_frontier = []
+            for index in frontier:
+                for _, _, neighbour in targets[index]:
+                    if distances[neighbour] > step:
+                        distances[neighbour] = step
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return distances
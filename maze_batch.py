@@ -0,0 +1,135 @@
+"""
+Seeded and batch maze generation.
+
+generate_seeded_maze() makes maze.generate_maze reproducible by running it
+with the random module seeded from an integer and restoring the previous
+random state afterwards. Python's Mersenne Twister gives the same sequence
+for the same seed on every platform, so a (width, height, complexity,
+seed) tuple identifies a maze across machines.
+
+generate_batch() fans seeds out over a process pool, and write_mazes() /
+read_mazes() stream results to and from a compact binary file.
+
+Command line:
+    python maze_batch.py --count 1000 --width 51 --height 51 --out mazes.bin
+"""
+
+import argparse
+import random
+import struct
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple
+from maze_grid import MazeGrid
+
+Position = Tuple[int, int]
+
+FILE_MAGIC = b'MAZB\x01'
+RECORD_HEADER = struct.Struct('<qIIIIII')  # seed, width, height, entrance y/x, exit y/x
+
+
+class GeneratedMaze(NamedTuple):
+    """A generated maze in compact form, with its seed and endpoints as (y, x)"""
+    seed: int
+    grid: MazeGrid
+    entrance: Position
+    exit: Position
+
+
+def generate_seeded_maze(width: int, height: int, complexity: float, seed: int):
+    """
+    Run maze.generate_maze with the random module seeded from seed.
+
+    Returns:
+        maze.Maze: The generated maze; the global random state is unchanged
+    """
+    from maze import generate_maze
+
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return generate_maze(width, height, complexity)
+    finally:
+        random.setstate(state)
+
+
+def generate_compact(width: int, height: int, complexity: float, seed: int) -> GeneratedMaze:
+    """Generate a seeded maze and convert it to a picklable GeneratedMaze"""
+    maze = generate_seeded_maze(width, height, complexity, seed)
+    return GeneratedMaze(seed, MazeGrid.from_maze(maze), maze.entrance, maze.exit)
+
+
+def _generate_job(args: Tuple[int, int, float, int]) -> GeneratedMaze:
+    return generate_compact(*args)
+
+
+def generate_batch(seeds: Iterable[int], width: int, height: int, complexity: float,
+                   workers: Optional[int] = None, chunksize: int = 16) -> Iterator[GeneratedMaze]:
+    """
+    Generate one maze per seed, in seed order.
+
+    Args:
+        seeds: Seeds to generate
+        width, height, complexity: Passed to generate_maze
+        workers: Worker processes; None uses every core, 1 runs in-process
+        chunksize: Seeds sent to a worker at a time
+
+    Yields:
+        GeneratedMaze: Results in the same order as seeds
+    """
+    jobs = ((width, height, complexity, seed) for seed in seeds)
+    if workers == 1:
+        yield from map(_generate_job, jobs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor  # Slow import; kept off the game's startup path
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generate_job, jobs, chunksize=chunksize)
+
+
+def write_mazes(stream: BinaryIO, mazes: Iterable[GeneratedMaze]) -> int:
+    """Write mazes to a binary stream as they arrive; returns the count written"""
+    stream.write(FILE_MAGIC)
+    count = 0
+    for item in mazes:
+        grid = item.grid
+        stream.write(RECORD_HEADER.pack(item.seed, grid.width, grid.height,
+                                        *item.entrance, *item.exit))
+        stream.write(grid.cells)
+        count += 1
+    return count
+
+
+def read_mazes(stream: BinaryIO) -> Iterator[GeneratedMaze]:
+    """Read mazes written by write_mazes, one record at a time"""
+    if stream.read(len(FILE_MAGIC)) != FILE_MAGIC:
+        raise ValueError("Not a maze batch file")
+
+    while True:
+        header = stream.read(RECORD_HEADER.size)
+        if not header:
+            return
+        seed, width, height, ey, ex, xy, xx = RECORD_HEADER.unpack(header)
+        grid = MazeGrid(width, height)
+        grid.cells = bytearray(stream.read(width * height))
+        yield GeneratedMaze(seed, grid, (ey, ex), (xy, xx))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded mazes in bulk")
+    parser.add_argument('--count', type=int, default=100, help="number of mazes")
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--width', type=int, default=21)
+    parser.add_argument('--height', type=int, default=21)
+    parser.add_argument('--complexity', type=float, default=0.7)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--out', required=True, help="output file")
+    args = parser.parse_args()
+
+    seeds = range(args.seed, args.seed + args.count)
+    mazes = generate_batch(seeds, args.width, args.height, args.complexity, args.workers)
+    with open(args.out, 'wb') as stream:
+        count = write_mazes(stream, mazes)
+    print(f"Wrote {count} mazes to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
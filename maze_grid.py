@@ -0,0 +1,119 @@
+"""
+Compact grid storage shared by the maze game and Pacman.
+
+A MazeGrid keeps one byte per cell in a flat bytearray indexed by
+y * width + x, instead of a list of lists of enum members or bools.
+Solvers and renderers can share the same storage through view() or,
+when NumPy is installed, as_numpy().
+"""
+
+from typing import Dict, List, Tuple
+
+# Cell codes
+PATH = 0
+WALL = 1
+ENTRANCE = 2
+EXIT = 3
+
+# (dx, dy) steps in the order neighbour tables list them
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class MazeGrid:
+    """
+    Flat byte-per-cell grid.
+
+    Attributes:
+        width (int): Number of columns
+        height (int): Number of rows
+        cells (bytearray): Cell codes indexed by y * width + x
+    """
+
+    __slots__ = ('width', 'height', 'cells')
+
+    def __init__(self, width: int, height: int, fill: int = PATH):
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+
+    @classmethod
+    def from_maze(cls, maze) -> 'MazeGrid':
+        """Convert a maze.Maze (grid of Cell members) into a compact grid"""
+        from maze import Cell
+
+        codes = {Cell.WALL: WALL, Cell.ENTRANCE: ENTRANCE, Cell.EXIT: EXIT}
+        grid = cls(maze.width, maze.height)
+        grid.cells = bytearray(codes.get(cell, PATH) for row in maze.grid for cell in row)
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of a cell"""
+        return y * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int):
+        self.cells[y * self.width + x] = value
+
+    def is_wall(self, x: int, y: int) -> bool:
+        return self.cells[y * self.width + x] == WALL
+
+    def neighbour_table(self, wrap_x: bool = False,
+                        wrap_y: bool = False) -> List[Dict[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Legal moves out of every cell, computed once for a static grid.
+
+        Entries exist for wall cells too, since actors may start inside
+        one (e.g. the Pacman ghost house door).
+
+        Args:
+            wrap_x: Moving off the left/right edge wraps around (tunnels)
+            wrap_y: Moving off the top/bottom edge wraps around
+
+        Returns:
+            List: Indexed by y * width + x; each entry maps a (dx, dy)
+            direction to the (x, y) it leads to, with wrapping resolved
+        """
+        width, height, cells = self.width, self.height, self.cells
+        table = []
+        for y in range(height):
+            for x in range(width):
+                moves = {}
+                for dx, dy in DIRECTIONS:
+                    nx, ny = x + dx, y + dy
+                    if wrap_x:
+                        nx %= width
+                    if wrap_y:
+                        ny %= height
+                    if 0 <= nx < width and 0 <= ny < height and cells[ny * width + nx] != WALL:
+                        moves[(dx, dy)] = (nx, ny)
+                table.append(moves)
+        return table
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the cell storage"""
+        return memoryview(self.cells)
+
+    def row(self, y: int) -> memoryview:
+        """Zero-copy view of one row"""
+        return memoryview(self.cells)[y * self.width:(y + 1) * self.width]
+
+    def as_numpy(self):
+        """
+        Zero-copy (height, width) uint8 NumPy view of the grid.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy
+
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height, self.width)
+
+    def copy(self) -> 'MazeGrid':
+        grid = MazeGrid(self.width, self.height)
+        grid.cells = bytearray(self.cells)
+        return grid
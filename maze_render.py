@@ -0,0 +1,613 @@
+"""
+Retained-mode canvas renderers for the maze game.
+
+MazeRenderer creates the static wall/floor layer once per maze and every
+cell keeps its canvas item ID in a flat index, so a move only touches the
+cells that actually changed instead of rebuilding the whole canvas.
+
+TiledMazeRenderer is the viewport variant for mazes larger than the
+window: the maze is split into square tiles and only the tiles around the
+camera have canvas items, so item count and draw cost stay bounded by the
+window size rather than the maze size.
+
+BitmapMazeRenderer rasterizes the static layer into a single PhotoImage
+(one image item instead of one rectangle per cell) at a zoom level chosen
+to fit the window; the solution and player are canvas overlays and the
+visited trail is drawn as one rectangle per horizontal run of cells.
+
+All renderers can overlay a hint path as small markers, one per cell,
+updated with the cells added to and removed from the path.
+"""
+
+import math
+import tkinter as tk
+from typing import Dict, Iterable, List, Optional, Tuple
+from maze_grid import MazeGrid, PATH, WALL, ENTRANCE, EXIT
+from maze_trail import Trail
+
+Position = Tuple[int, int]
+
+# Pixel colours of the rasterized static layer, matching MazeRenderer's
+# Tk colour names (Tk's 'green' is #008000 and 'gray' is #bebebe)
+OUTLINE = 4
+PIXEL_COLORS = {
+    PATH: (255, 255, 255),
+    WALL: (0, 0, 0),
+    ENTRANCE: (0, 128, 0),
+    EXIT: (255, 0, 0),
+    OUTLINE: (190, 190, 190),
+}
+# Cells smaller than this are rasterized without grid lines
+OUTLINE_MIN_CELL = 6
+
+
+def _channel_table(channel: int) -> bytes:
+    table = bytearray(256)
+    for code, rgb in PIXEL_COLORS.items():
+        table[code] = rgb[channel]
+    return bytes(table)
+
+
+_CHANNEL_TABLES = tuple(_channel_table(channel) for channel in range(3))
+
+
+def _codes_to_rgb(codes: bytes) -> bytearray:
+    pixels = bytearray(3 * len(codes))
+    for channel, table in enumerate(_CHANNEL_TABLES):
+        pixels[channel::3] = codes.translate(table)
+    return pixels
+
+
+def rasterize_grid(grid: MazeGrid, cell_size: int) -> bytes:
+    """
+    Render a grid as binary PPM data with cell_size x cell_size pixels per cell.
+
+    Each maze row is expanded and colour-mapped with bytes.translate and
+    slice assignment, then repeated cell_size times, so the cost is a few
+    C-level operations per row rather than Python work per pixel.
+    """
+    width = grid.width * cell_size
+    outline = cell_size >= OUTLINE_MIN_CELL
+    chunks = [b'P6 %d %d 255\n' % (width, grid.height * cell_size)]
+    outline_row = _codes_to_rgb(bytes([OUTLINE]) * width)
+
+    for y in range(grid.height):
+        codes = bytes(grid.row(y))
+        if cell_size > 1:
+            expanded = bytearray(width)
+            for offset in range(cell_size):
+                expanded[offset::cell_size] = codes
+            if outline:
+                expanded[0::cell_size] = bytes([OUTLINE]) * grid.width
+            codes = bytes(expanded)
+        pixels = _codes_to_rgb(codes)
+        if outline:
+            chunks.append(outline_row)
+            chunks.append(pixels * (cell_size - 1))
+        else:
+            chunks.append(pixels * cell_size)
+    return b''.join(chunks)
+
+
+class MazeRenderer:
+    """Keeps canvas items for a maze alive and recolors them in place"""
+
+    CELL_COLORS = {
+        WALL: 'black',
+        ENTRANCE: 'green',
+        EXIT: 'red',
+    }
+    FLOOR_COLOR = 'white'
+    VISITED_COLOR = 'light blue'
+    SOLUTION_COLOR = 'pink'
+    STRIPE_COLOR = 'red'
+    OUTLINE_COLOR = 'gray'
+    HINT_COLOR = 'orange'
+
+    def __init__(self, canvas: tk.Canvas, cell_size: int):
+        self.canvas = canvas
+        self.cell_size = cell_size
+        self.grid = None
+        self.cell_items: List[int] = []
+        self.player_item: Optional[int] = None
+        self.hint_items: Dict[Position, int] = {}
+
+    def build(self, grid: MazeGrid, path_taken: Iterable[Position], current_pos: Position):
+        """Create the static layer for a new maze (once per generated maze)"""
+        self.grid = grid
+        self.canvas.delete('all')
+        self.hint_items = {}
+        self.canvas.config(width=grid.width * self.cell_size,
+                           height=grid.height * self.cell_size,
+                           scrollregion=(0, 0, grid.width * self.cell_size,
+                                         grid.height * self.cell_size))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+
+        self.cell_items = []
+        for y in range(grid.height):
+            for x in range(grid.width):
+                x1, y1, x2, y2 = self._cell_bbox(y, x)
+                self.cell_items.append(self.canvas.create_rectangle(
+                    x1, y1, x2, y2, fill=self.base_color((y, x)),
+                    outline=self.OUTLINE_COLOR))
+
+        for pos in path_taken:
+            self.mark_visited(pos)
+
+        x1, y1, x2, y2 = self._player_bbox(current_pos)
+        self.player_item = self.canvas.create_oval(x1, y1, x2, y2, fill='blue')
+
+    def base_color(self, pos: Position) -> str:
+        """Color of a cell in the static layer"""
+        y, x = pos
+        return self.CELL_COLORS.get(self.grid.get(x, y), self.FLOOR_COLOR)
+
+    def mark_visited(self, pos: Position):
+        """Recolor a single cell as part of the path taken"""
+        y, x = pos
+        self.canvas.itemconfigure(self.cell_items[y * self.grid.width + x],
+                                  fill=self.VISITED_COLOR)
+
+    def restore(self, positions: Iterable[Position]):
+        """Recolor cells back to their static color"""
+        for y, x in positions:
+            self.canvas.itemconfigure(self.cell_items[y * self.grid.width + x],
+                                      fill=self.base_color((y, x)))
+
+    def move_player(self, pos: Position):
+        """Move the player marker without recreating it"""
+        self.canvas.coords(self.player_item, *self._player_bbox(pos))
+
+    def refresh(self):
+        """Called when the canvas is resized; the full layer needs no update"""
+
+    def zoom(self, step: int):
+        """Change the zoom level; the vector layers have a fixed cell size"""
+
+    def show_shortest_path(self, path: List[Position], path_taken):
+        """Overlay the shortest path, striping cells the player also visited"""
+        for pos in path:
+            self._draw_solution_cell(pos, self._is_striped(pos, path_taken))
+        self.canvas.tag_raise(self.player_item)
+
+    def _is_striped(self, pos: Position, path_taken) -> bool:
+        y, x = pos
+        return pos in path_taken and self.grid.get(x, y) != EXIT  # Always show on exit
+
+    def _draw_solution_cell(self, pos: Position, striped: bool, tags=('solution',)):
+        x1, y1, x2, y2 = self._cell_bbox(*pos)
+        if not striped:
+            self.canvas.create_rectangle(x1, y1, x2, y2, fill=self.SOLUTION_COLOR,
+                                         outline=self.OUTLINE_COLOR, tags=tags)
+            return
+        # Draw diagonal stripes for overlapping paths
+        stripe_width = 4
+        for i in range(0, self.cell_size, stripe_width * 2):
+            self.canvas.create_polygon(
+                x1 + i, y1,
+                min(x1 + i + stripe_width, x2), y1,
+                min(x1 + i + stripe_width, x2), y2,
+                x1 + i, y2,
+                fill=self.STRIPE_COLOR, outline='', tags=tags)
+
+    def clear_shortest_path(self):
+        """Remove the shortest path overlay"""
+        self.canvas.delete('solution')
+
+    def update_hint(self, added: Iterable[Position], removed: Iterable[Position]):
+        """Delete the hint markers of removed cells and draw markers for added ones"""
+        items = [self.hint_items.pop(pos) for pos in removed if pos in self.hint_items]
+        if items:
+            self.canvas.delete(*items)
+        for pos in added:
+            self._draw_hint_cell(pos)
+        self.canvas.tag_raise(self.player_item)
+
+    def clear_hint(self):
+        """Remove the hint overlay"""
+        self.canvas.delete('hint')
+        self.hint_items = {}
+
+    def _draw_hint_cell(self, pos: Position, tags=('hint',)):
+        x1, y1, x2, y2 = self._cell_bbox(*pos)
+        inset = self.cell_size // 3
+        self.hint_items[pos] = self.canvas.create_rectangle(
+            x1 + inset, y1 + inset, x2 - inset, y2 - inset,
+            fill=self.HINT_COLOR, outline='', tags=tags)
+
+    def _view_size(self) -> Tuple[int, int]:
+        # Before the canvas is mapped winfo_* report 1; use the requested size
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            width = int(self.canvas.cget('width'))
+            height = int(self.canvas.cget('height'))
+        return width, height
+
+    def _scroll_to(self, pos: Position) -> Tuple[float, float, int, int]:
+        """
+        Scroll the canvas so pos is centred, clamped to the maze.
+
+        Returns:
+            (left, top, view_width, view_height) of the visible region in pixels
+        """
+        y, x = pos
+        size = self.cell_size
+        view_width, view_height = self._view_size()
+        total_width, total_height = self.grid.width * size, self.grid.height * size
+
+        left = min(max(0, x * size + size / 2 - view_width / 2), max(0, total_width - view_width))
+        top = min(max(0, y * size + size / 2 - view_height / 2), max(0, total_height - view_height))
+        self.canvas.xview_moveto(left / total_width)
+        self.canvas.yview_moveto(top / total_height)
+        return left, top, view_width, view_height
+
+    def _cell_bbox(self, y: int, x: int) -> Tuple[int, int, int, int]:
+        x1, y1 = x * self.cell_size, y * self.cell_size
+        return x1, y1, x1 + self.cell_size, y1 + self.cell_size
+
+    def _player_bbox(self, pos: Position) -> Tuple[int, int, int, int]:
+        x1, y1, x2, y2 = self._cell_bbox(*pos)
+        return x1 + 4, y1 + 4, x2 - 4, y2 - 4
+
+
+class TiledMazeRenderer(MazeRenderer):
+    """
+    Camera-following viewport renderer for large mazes.
+
+    Features:
+        - Maze split into tile_cells x tile_cells tiles
+        - Canvas items only for visible tiles plus a margin
+        - Tiles loaded and unloaded as the camera moves
+        - Visited cells, the solution and the hint survive unloading
+    """
+
+    def __init__(self, canvas: tk.Canvas, cell_size: int, tile_cells: int = 16,
+                 margin_tiles: int = 1, view_cells: Tuple[int, int] = (41, 25)):
+        super().__init__(canvas, cell_size)
+        self.tile_cells = tile_cells
+        self.margin_tiles = margin_tiles
+        self.view_cells = view_cells
+        # (tile x, tile y) -> cell item IDs in row-major order within the tile
+        self.tiles: Dict[Tuple[int, int], List[int]] = {}
+        self.loaded_range = None
+        self.visited: Optional[Trail] = None
+        # (tile x, tile y) -> [(pos, striped), ...] for the solution overlay
+        self.solution: Dict[Tuple[int, int], List[Tuple[Position, bool]]] = {}
+        # Every hint cell; hint_items only holds markers in loaded tiles
+        self.hint: Optional[Trail] = None
+        self.player_pos: Optional[Position] = None
+
+    def build(self, grid: MazeGrid, path_taken: Iterable[Position], current_pos: Position):
+        """Reset the viewport for a new maze and load the tiles around the player"""
+        self.grid = grid
+        self.canvas.delete('all')
+        self.tiles = {}
+        self.loaded_range = None
+        self.visited = Trail.from_positions(grid.width, grid.height, path_taken)
+        self.solution = {}
+        self.hint = Trail(grid.width, grid.height)
+        self.hint_items = {}
+
+        size = self.cell_size
+        view_width, view_height = self.view_cells
+        self.canvas.config(width=min(grid.width, view_width) * size,
+                           height=min(grid.height, view_height) * size,
+                           scrollregion=(0, 0, grid.width * size, grid.height * size))
+
+        self.player_item = self.canvas.create_oval(*self._player_bbox(current_pos), fill='blue')
+        self.player_pos = current_pos
+        self.follow(current_pos)
+
+    def refresh(self):
+        """Re-centre and reload tiles after the canvas was resized"""
+        if self.grid is not None and self.player_pos is not None:
+            self.follow(self.player_pos)
+
+    def follow(self, pos: Position):
+        """Scroll so pos is centred and update the loaded tiles"""
+        self._update_tiles(*self._scroll_to(pos))
+
+    def mark_visited(self, pos: Position):
+        self.visited.add(pos)
+        item = self._item(pos)
+        if item is not None:
+            self.canvas.itemconfigure(item, fill=self.VISITED_COLOR)
+
+    def restore(self, positions: Iterable[Position]):
+        for pos in positions:
+            self.visited.discard(pos)
+            item = self._item(pos)
+            if item is not None:
+                self.canvas.itemconfigure(item, fill=self.base_color(pos))
+
+    def move_player(self, pos: Position):
+        self.canvas.coords(self.player_item, *self._player_bbox(pos))
+        self.player_pos = pos
+        self.follow(pos)
+
+    def show_shortest_path(self, path: List[Position], path_taken):
+        """Record the overlay per tile and draw it for the tiles currently loaded"""
+        self.solution = {}
+        n = self.tile_cells
+        for pos in path:
+            y, x = pos
+            self.solution.setdefault((x // n, y // n), []).append(
+                (pos, self._is_striped(pos, path_taken)))
+        for key in self.tiles:
+            self._draw_tile_solution(key)
+        self.canvas.tag_raise(self.player_item)
+
+    def clear_shortest_path(self):
+        super().clear_shortest_path()
+        self.solution = {}
+
+    def update_hint(self, added: Iterable[Position], removed: Iterable[Position]):
+        """Track every hint cell, drawing markers only in loaded tiles"""
+        removed = list(removed)
+        for pos in removed:
+            self.hint.discard(pos)
+        loaded = []
+        for pos in added:
+            self.hint.add(pos)
+            if self._tile_key(pos) in self.tiles:
+                loaded.append(pos)
+        super().update_hint(loaded, removed)
+
+    def clear_hint(self):
+        super().clear_hint()
+        if self.grid is not None:
+            self.hint = Trail(self.grid.width, self.grid.height)
+
+    def _update_tiles(self, left: float, top: float, view_width: int, view_height: int):
+        span = self.tile_cells * self.cell_size
+        margin = self.margin_tiles
+        last_x = math.ceil(self.grid.width / self.tile_cells) - 1
+        last_y = math.ceil(self.grid.height / self.tile_cells) - 1
+        tx1 = max(0, int(left // span) - margin)
+        ty1 = max(0, int(top // span) - margin)
+        tx2 = min(last_x, int((left + view_width) // span) + margin)
+        ty2 = min(last_y, int((top + view_height) // span) + margin)
+        if (tx1, ty1, tx2, ty2) == self.loaded_range:
+            return
+        self.loaded_range = (tx1, ty1, tx2, ty2)
+
+        unloaded = [key for key in self.tiles
+                    if not (tx1 <= key[0] <= tx2 and ty1 <= key[1] <= ty2)]
+        for key in unloaded:
+            self.canvas.delete(self._tile_tag(key))
+            del self.tiles[key]
+        if unloaded and self.hint_items:
+            # Their hint markers went with the tile tags
+            self.hint_items = {pos: item for pos, item in self.hint_items.items()
+                               if self._tile_key(pos) in self.tiles}
+
+        for ty in range(ty1, ty2 + 1):
+            for tx in range(tx1, tx2 + 1):
+                if (tx, ty) not in self.tiles:
+                    self._load_tile((tx, ty))
+        self.canvas.tag_raise(self.player_item)
+
+    def _load_tile(self, key: Tuple[int, int]):
+        tx, ty = key
+        n = self.tile_cells
+        tag = self._tile_tag(key)
+        items = []
+        hint = []
+        for y in range(ty * n, min((ty + 1) * n, self.grid.height)):
+            for x in range(tx * n, min((tx + 1) * n, self.grid.width)):
+                pos = (y, x)
+                fill = self.VISITED_COLOR if pos in self.visited else self.base_color(pos)
+                items.append(self.canvas.create_rectangle(
+                    *self._cell_bbox(y, x), fill=fill, outline=self.OUTLINE_COLOR, tags=tag))
+                if pos in self.hint:
+                    hint.append(pos)
+        self.tiles[key] = items
+        self._draw_tile_solution(key)
+        for pos in hint:
+            self._draw_hint_cell(pos)
+
+    def _draw_hint_cell(self, pos: Position, tags=('hint',)):
+        super()._draw_hint_cell(pos, tags + (self._tile_tag(self._tile_key(pos)),))
+
+    def _draw_tile_solution(self, key: Tuple[int, int]):
+        tags = ('solution', self._tile_tag(key))
+        for pos, striped in self.solution.get(key, ()):
+            self._draw_solution_cell(pos, striped, tags)
+
+    def _tile_key(self, pos: Position) -> Tuple[int, int]:
+        y, x = pos
+        return x // self.tile_cells, y // self.tile_cells
+
+    def _item(self, pos: Position) -> Optional[int]:
+        """Canvas item of a cell, or None if its tile is not loaded"""
+        y, x = pos
+        n = self.tile_cells
+        tx, ty = x // n, y // n
+        items = self.tiles.get((tx, ty))
+        if items is None:
+            return None
+        tile_width = min(n, self.grid.width - tx * n)
+        return items[(y - ty * n) * tile_width + (x - tx * n)]
+
+    @staticmethod
+    def _tile_tag(key: Tuple[int, int]) -> str:
+        return f"tile_{key[0]}_{key[1]}"
+
+
+class BitmapMazeRenderer(MazeRenderer):
+    """
+    Static layer as one PhotoImage with automatic level of detail.
+
+    Features:
+        - Walls, entrance and exit rasterized into a single image item
+        - Cell size picked from ZOOM_LEVELS to fit the window
+        - Manual zoom in/out, rebuilding the image at the new level
+        - Solution, hint and player drawn as overlays
+        - Visited trail drawn as merged horizontal runs, touching only
+          the run a new cell joins
+        - Camera follows the player when the image exceeds the window
+    """
+
+    ZOOM_LEVELS = (1, 2, 3, 4, 6, 8, 12, 16, 20, 30)
+
+    def __init__(self, canvas: tk.Canvas, cell_size: int,
+                 max_view: Tuple[int, int] = (1200, 800), max_image_pixels: int = 16_000_000):
+        super().__init__(canvas, cell_size)
+        self.max_cell_size = cell_size
+        self.max_view = max_view
+        self.max_image_pixels = max_image_pixels
+        self.zoom_index = 0
+        self.image = None
+        self.image_item: Optional[int] = None
+        self.visited: Optional[Trail] = None
+        # Trail runs per row: y -> {x_start: (x_end_exclusive, item)}
+        self.runs: Dict[int, Dict[int, Tuple[int, int]]] = {}
+        # (y, x_end_exclusive) -> x_start, to find the run a cell extends
+        self.run_ends: Dict[Position, int] = {}
+        self.solution = None
+        self.player_pos: Optional[Position] = None
+
+    def build(self, grid: MazeGrid, path_taken: Iterable[Position], current_pos: Position):
+        """Pick a zoom level for the maze and draw it"""
+        self.grid = grid
+        self.visited = Trail.from_positions(grid.width, grid.height, path_taken)
+        self.solution = None
+        self.hint_items = {}
+        self.zoom_index = self.auto_zoom(grid)
+        self._draw(current_pos)
+
+    def auto_zoom(self, grid: MazeGrid) -> int:
+        """Index of the largest zoom level whose image fits in max_view"""
+        max_width, max_height = self.max_view
+        best = 0
+        for index, size in enumerate(self.ZOOM_LEVELS):
+            if size <= self.max_cell_size and grid.width * size <= max_width \
+                    and grid.height * size <= max_height:
+                best = index
+        return best
+
+    def zoom(self, step: int):
+        """Move step zoom levels in (positive) or out, keeping the image size bounded"""
+        if self.grid is None:
+            return
+        index = min(max(0, self.zoom_index + step), len(self.ZOOM_LEVELS) - 1)
+        size = self.ZOOM_LEVELS[index]
+        if self.grid.width * self.grid.height * size * size > self.max_image_pixels:
+            return
+        if index != self.zoom_index:
+            self.zoom_index = index
+            self._draw(self.player_pos)
+
+    def refresh(self):
+        if self.grid is not None and self.player_pos is not None:
+            self._scroll_to(self.player_pos)
+
+    def mark_visited(self, pos: Position):
+        """Add a cell to the trail, extending or joining neighbouring runs"""
+        if not self.visited.add(pos):
+            return
+        y, x = pos
+        row = self.runs.setdefault(y, {})
+        left_start = self.run_ends.pop((y, x), None)
+        right = row.pop(x + 1, None)
+
+        if left_start is not None:
+            item = row[left_start][1]
+            start = left_start
+            end = x + 1
+            if right is not None:
+                # Cell bridges two runs: grow the left one, drop the right one
+                end = right[0]
+                self.canvas.delete(right[1])
+            self.canvas.coords(item, *self._run_bbox(y, start, end))
+        elif right is not None:
+            start, (end, item) = x, right
+            self.canvas.coords(item, *self._run_bbox(y, start, end))
+        else:
+            start, end = x, x + 1
+            item = self._create_run_item(y, start, end)
+
+        row[start] = (end, item)
+        self.run_ends[(y, end)] = start
+
+    def restore(self, positions: Iterable[Position]):
+        """Remove cells from the trail, redrawing the runs of affected rows"""
+        rows = set()
+        for pos in positions:
+            self.visited.discard(pos)
+            rows.add(pos[0])
+        for y in rows:
+            self._redraw_row(y)
+
+    def move_player(self, pos: Position):
+        self.canvas.coords(self.player_item, *self._player_bbox(pos))
+        self.player_pos = pos
+        self._scroll_to(pos)
+
+    def show_shortest_path(self, path: List[Position], path_taken):
+        self.solution = (path, path_taken)
+        super().show_shortest_path(path, path_taken)
+
+    def clear_shortest_path(self):
+        super().clear_shortest_path()
+        self.solution = None
+
+    def _draw(self, current_pos: Position):
+        """Rebuild the image and overlays at the current zoom level"""
+        grid = self.grid
+        size = self.cell_size = self.ZOOM_LEVELS[self.zoom_index]
+        max_width, max_height = self.max_view
+        hint = list(self.hint_items)
+        self.canvas.delete('all')
+        self.hint_items = {}
+        self.canvas.config(width=min(grid.width * size, max_width),
+                           height=min(grid.height * size, max_height),
+                           scrollregion=(0, 0, grid.width * size, grid.height * size))
+
+        self.image = tk.PhotoImage(master=self.canvas, data=rasterize_grid(grid, size), format='PPM')
+        self.image_item = self.canvas.create_image(0, 0, anchor='nw', image=self.image)
+
+        self.runs = {}
+        self.run_ends = {}
+        for y in range(grid.height):
+            self._draw_row(y, restack=False)
+        self.player_item = self.canvas.create_oval(*self._player_bbox(current_pos), fill='blue')
+        if self.solution is not None:
+            super().show_shortest_path(*self.solution)
+        for pos in hint:
+            self._draw_hint_cell(pos)
+        self.move_player(current_pos)
+
+    def _draw_row(self, y: int, restack: bool = True):
+        row = {}
+        for start, end in self.visited.row_runs(y):
+            row[start] = (end, self._create_run_item(y, start, end, restack))
+            self.run_ends[(y, end)] = start
+        if row:
+            self.runs[y] = row
+
+    def _redraw_row(self, y: int):
+        for start, (end, item) in self.runs.pop(y, {}).items():
+            self.canvas.delete(item)
+            del self.run_ends[(y, end)]
+        self._draw_row(y)
+
+    def _create_run_item(self, y: int, start: int, end: int, restack: bool = True) -> int:
+        outline = self.OUTLINE_COLOR if self.cell_size >= OUTLINE_MIN_CELL else ''
+        item = self.canvas.create_rectangle(*self._run_bbox(y, start, end),
+                                            fill=self.VISITED_COLOR, outline=outline)
+        if restack:
+            # Keep the trail directly on the image, under every overlay
+            self.canvas.tag_raise(item, self.image_item)
+        return item
+
+    def _run_bbox(self, y: int, start: int, end: int) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return start * size, y * size, end * size, (y + 1) * size
+
+    def _player_bbox(self, pos: Position) -> Tuple[int, int, int, int]:
+        x1, y1, x2, y2 = self._cell_bbox(*pos)
+        inset = self.cell_size // 7
+        return x1 + inset, y1 + inset, x2 - inset, y2 - inset
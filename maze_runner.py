@@ -1,16 +1,58 @@
+import time
+_IMPORT_START = time.perf_counter()  # Origin of the GAMES_STARTUP report
+
+import random
 import tkinter as tk
 from tkinter import ttk
-from maze import generate_maze, Cell
+from background import BackgroundTask
+from maze_batch import generate_compact
+from maze_render import BitmapMazeRenderer, MazeRenderer, TiledMazeRenderer
+from maze_trail import Trail, key_target
+from replay import END, KEY, MAZE_KEYS, RESET, MazeRecording
+from startup import StartupTimer, after_first_paint, startup_requested
 from typing import Tuple, List
-from collections import deque
+
+# maze_solvers and profiler are imported where first used, after the
+# window is up
+_IMPORT_END = time.perf_counter()
+
+# Larger mazes draw the static layer as one zoomable image instead of
+# one canvas rectangle per cell
+VECTOR_MAX_CELLS = 51 * 51
 
 class MazeGame(tk.Tk):
-    def __init__(self):
-        super().__init__()C
+    def __init__(self, replay=None, speed=1):
+        """
+        Args:
+            replay: Optional MazeRecording to play back instead of taking input
+            speed: Playback speed multiplier for replay
+        """
+        super().__init__()
+        
+        mode = startup_requested()
+        self.startup = StartupTimer("Maze Game", _IMPORT_START, _IMPORT_END,
+                                    exit_after=mode == 'exit') if mode else None
         
         self.title("Maze Game")
+        self.maze = None
         self.current_pos = None
-        self.path_taken = set()
+        self.path_taken = None
+        self.steps_taken = 0
+        self.shortest_path = None
+        self.game_finished = False
+        self.exit_distances = None
+        self.hint = None
+        self.generation = None
+        self.generation_params = None
+        self.solver = None
+        
+        # Session recording (F5 saves) and replay playback
+        self.recording = None
+        self.recording_start = 0.0
+        self.replay = replay
+        self.replay_speed = speed
+        self.replay_events = None
+        self.replay_pending = None
         
         # Control panel
         self.control_frame = ttk.Frame(self)
@@ -30,167 +72,358 @@ class MazeGame(tk.Tk):
         self.complexity_var = tk.StringVar(value="0.7")
         ttk.Entry(self.control_frame, textvariable=self.complexity_var, width=5).grid(row=0, column=5)
         
+        # Seed control (blank = random seed)
+        ttk.Label(self.control_frame, text="Seed:").grid(row=0, column=6, padx=5)
+        self.seed_var = tk.StringVar(value="")
+        ttk.Entry(self.control_frame, textvariable=self.seed_var, width=10).grid(row=0, column=7)
+        
         # Generate button
         ttk.Button(self.control_frame, text="Generate New Maze", 
-                  command=self.generate_new_maze).grid(row=0, column=6, padx=10)
+                  command=self.generate_new_maze).grid(row=0, column=8, padx=10)
         
         # Reset button
         ttk.Button(self.control_frame, text="Reset Position", 
-                  command=self.reset_position).grid(row=0, column=7, padx=10)
+                  command=self.reset_position).grid(row=0, column=9, padx=10)
+        
+        # Camera-following tiled viewport
+        self.viewport_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.control_frame, text="Viewport", variable=self.viewport_var,
+                        command=self.draw_maze).grid(row=0, column=10, padx=5)
+        
+        # Live shortest path from the player to the exit (H toggles)
+        self.hint_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.control_frame, text="Hint", variable=self.hint_var,
+                        command=self.toggle_hint).grid(row=0, column=11, padx=5)
+        
+        # Background work indicator
+        self.status_frame = ttk.Frame(self)
+        self.status_frame.pack()
+        self.progress = ttk.Progressbar(self.status_frame, mode='indeterminate', length=150)
+        self.progress.grid(row=0, column=0, padx=5)
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self.status_frame, textvariable=self.status_var, width=30).grid(row=0, column=1, padx=5)
+        self.cancel_button = ttk.Button(self.status_frame, text="Cancel", 
+                                        command=self.cancel_generation, state='disabled')
+        self.cancel_button.grid(row=0, column=2, padx=5)
         
         # Canvas for maze
         self.cell_size = 30
         self.canvas = tk.Canvas(self, bg='white')
         self.canvas.pack(padx=10, pady=10, expand=True, fill=tk.BOTH)
+        self.full_renderer = MazeRenderer(self.canvas, self.cell_size)
+        self.viewport_renderer = TiledMazeRenderer(self.canvas, self.cell_size)
+        self.bitmap_renderer = BitmapMazeRenderer(self.canvas, self.cell_size)
+        self.renderer = self.full_renderer
+        self.canvas.bind('<Configure>', lambda event: self.renderer.refresh())
         
-        # Bind arrow keys
-        self.bind('<KeyPress>', self.handle_movement)
+        # Bind arrow keys (looked up per event so the profiler can wrap the handler)
+        self.bind('<KeyPress>', lambda event: self.handle_movement(event))
         
-        # Generate initial maze
-        self.generate_new_maze()
+        # Opt-in instrumentation (F3 toggles, F4 dumps a trace), created on first use
+        self.profiler = None
+        self.profiler_overlay = None
+        
+        # Generate the initial maze (the recorded one when replaying) once
+        # the window is on screen
+        if replay is not None:
+            self.width_var.set(str(replay.width))
+            self.height_var.set(str(replay.height))
+            self.complexity_var.set(str(replay.complexity))
+            self.seed_var.set(str(replay.seed))
+        after_first_paint(self, self.on_window_shown)
         
         # Set focus to receive key events
         self.focus_set()
-        
-        # Add attributes for shortest path
-        self.shortest_path = None
-        self.game_finished = False
+        if self.startup is not None:
+            self.startup.mark('window built')
+
+    def on_window_shown(self):
+        """Rest of startup, deferred until the empty window has been drawn"""
+        if self.startup is not None:
+            self.startup.mark('window shown')
+        from profiler import profiling_requested, toggle_profiler
+        if profiling_requested():
+            toggle_profiler(self)
+        self.generate_new_maze()
 
     def generate_new_maze(self):
-        """Generate and display a new maze"""
+        """Start generating a new maze in the background"""
         try:
             width = int(self.width_var.get())
             height = int(self.height_var.get())
             complexity = float(self.complexity_var.get())
+            seed_text = self.seed_var.get().strip()
+            seed = int(seed_text) if seed_text else random.randrange(2**31)
         except ValueError:
             print("Invalid input values")
             return
         
-        self.maze = generate_maze(width, height, complexity)
+        if self.generation is not None:
+            self.generation.cancel()
+        self.generation_params = (width, height, complexity)
+        self.generation = BackgroundTask(
+            self, generate_compact, width, height, complexity, seed,
+            on_done=self.on_maze_generated, on_error=self.on_generation_failed
+        ).start()
+        self.cancel_button.config(state='normal')
+        self.set_busy(f"Generating {width}x{height} maze...")
+
+    def on_maze_generated(self, result):
+        """Install a maze produced by the generation worker"""
+        # Timed here rather than by instrument_frame: a generation already
+        # running when F3 is pressed holds the unwrapped bound method
+        profiler = self.profiler
+        timed = profiler is not None and profiler.enabled
+        if timed:
+            profiler.begin_frame()
+        try:
+            self.install_maze(result)
+        finally:
+            if timed:
+                profiler.end_frame()
+
+    def install_maze(self, result):
+        self.generation = None
+        self.cancel_button.config(state='disabled')
+        self.set_idle()
+        
+        self.maze = result
+        self.maze_grid = result.grid
+        self.maze_seed = result.seed
+        self.title(f"Maze Game - seed {result.seed}")
         self.current_pos = self.maze.entrance
-        self.path_taken = {self.current_pos}
+        self.path_taken = Trail(self.maze_grid.width, self.maze_grid.height)
+        self.path_taken.add(self.current_pos)
+        self.steps_taken = 0
         self.game_finished = False
         self.shortest_path = None
+        self.exit_distances = None
+        self.hint = None
         self.draw_maze()
+        if self.startup is not None:
+            self.startup.first_frame(self)
+        
+        self.recording = MazeRecording(result.seed, *self.generation_params)
+        self.recording_start = time.perf_counter()
+        if self.replay is not None:
+            self.replay_events = self.replay.events()
+            self.schedule_replay(0)
+        
+        # Solve in the background so victory is instant
+        from maze_solvers import distance_field
+        if self.solver is not None:
+            self.solver.cancel()
+        self.solver = BackgroundTask(
+            self, distance_field, self.maze_grid, self.maze.exit,
+            on_done=self.on_maze_solved, on_error=self.on_solve_failed
+        ).start()
+
+    def on_generation_failed(self, error: str):
+        self.generation = None
+        self.cancel_button.config(state='disabled')
+        self.set_idle()
+        print(error)
+
+    def on_maze_solved(self, distances):
+        """Store the distance field computed by the solver worker"""
+        self.solver = None
+        self.exit_distances = distances
+        self.update_hint()
+        if self.game_finished and self.shortest_path is None:
+            self.finish_game()
+
+    def on_solve_failed(self, error: str):
+        self.solver = None
+        print(error)
+        if self.game_finished and self.shortest_path is None:
+            self.finish_game()  # Falls back to solving inline
+
+    def cancel_generation(self):
+        """Cancel an in-flight maze generation, keeping the current maze"""
+        if self.generation is not None:
+            self.generation.cancel()
+            self.generation = None
+        self.cancel_button.config(state='disabled')
+        self.set_idle()
+
+    def set_busy(self, message: str):
+        self.status_var.set(message)
+        self.progress.start(10)
+
+    def set_idle(self):
+        self.status_var.set("")
+        self.progress.stop()
 
     def draw_maze(self):
-        """Draw the maze on the canvas"""
-        width = self.maze.width * self.cell_size
-        height = self.maze.height * self.cell_size
-        
-        self.canvas.delete('all')
-        self.canvas.config(width=width, height=height)
-        
-        # Draw base maze
-        for y in range(self.maze.height):
-            for x in range(self.maze.width):
-                cell = self.maze.grid[y][x]
-                x1, y1 = x * self.cell_size, y * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                
-                if cell == Cell.WALL:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='black', outline='gray')
-                elif cell == Cell.ENTRANCE:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='green', outline='gray')
-                elif cell == Cell.EXIT:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='red', outline='gray')
-                else:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='white', outline='gray')
-        # Draw path taken first
-
-        for pos in self.path_taken:
-            y, x = pos
-            x1, y1 = x * self.cell_size, y * self.cell_size
-            x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill='light blue', outline='gray')
-        
-        # Draw shortest path on top with transparency effect
-        if self.game_finished and self.shortest_path:
-            for pos in self.shortest_path:
-                if pos not in self.path_taken or pos == self.maze.exit:  # Always show on exit
-                    y, x = pos
-                    x1, y1 = x * self.cell_size, y * self.cell_size
-                    x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                    # Draw full pink square
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill='pink', outline='gray')
-                else:
-                    # Draw striped pattern for overlapping paths
-                    y, x = pos
-                    x1, y1 = x * self.cell_size, y * self.cell_size
-                    x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                    # Draw diagonal stripes
-                    stripe_width = 4
-                    for i in range(0, self.cell_size, stripe_width * 2):
-                        self.canvas.create_polygon(
-                            x1 + i, y1,
-                            min(x1 + i + stripe_width, x2), y1,
-                            min(x1 + i + stripe_width, x2), y2,
-                            x1 + i, y2,
-                            fill='red', outline='')
-        
-        # Draw current position on top of everything
-        y, x = self.current_pos
-        x1, y1 = x * self.cell_size, y * self.cell_size
-        x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-        self.canvas.create_oval(x1+4, y1+4, x2-4, y2-4, fill='blue')
+        """Build the static maze layer with the renderer suited to its size"""
+        if self.maze is None:
+            return
+        if self.viewport_var.get():
+            self.renderer = self.viewport_renderer
+        elif self.maze_grid.width * self.maze_grid.height > VECTOR_MAX_CELLS:
+            self.renderer = self.bitmap_renderer
+        else:
+            self.renderer = self.full_renderer
+        self.renderer.build(self.maze_grid, self.path_taken, self.current_pos)
+        if self.shortest_path:
+            self.renderer.show_shortest_path(self.shortest_path, self.path_taken)
+        if self.hint is not None:
+            self.renderer.update_hint(self.hint.positions(), ())
+
+    def update_position(self, new_pos: Tuple[int, int]):
+        """Recolor only the cells affected by a move"""
+        self.current_pos = new_pos
+        self.steps_taken += 1
+        if self.path_taken.add(new_pos):
+            self.renderer.mark_visited(new_pos)
+        self.renderer.move_player(new_pos)
+        self.update_hint()
         
         # Check if reached exit
         if self.current_pos == self.maze.exit and not self.game_finished:
             self.game_finished = True
-            self.shortest_path = self.find_shortest_path()
-            self.show_victory_message()
-            self.draw_maze()  # Redraw to show shortest path
+            if self.solver is None:
+                self.finish_game()
+            # Otherwise on_maze_solved finishes once the worker reports back
+
+    def finish_game(self):
+        """Show the shortest path and the victory message"""
+        self.shortest_path = self.find_shortest_path()
+        self.renderer.show_shortest_path(self.shortest_path, self.path_taken)
+        self.show_victory_message()
+
+    def toggle_hint(self):
+        """Show or hide the hint path, following the Hint checkbox"""
+        if self.hint_var.get():
+            self.update_hint()
+        else:
+            self.hint = None
+            self.renderer.clear_hint()
+
+    def update_hint(self):
+        """
+        Bring the hint path up to date with the player's position.
+
+        Waits for the solver worker's distance field; each update then only
+        descends from the new position until it joins the previous path.
+        """
+        if self.maze is None or not self.hint_var.get() or self.exit_distances is None:
+            return
+        if self.hint is None:
+            from maze_solvers import DescentPath
+            self.hint = DescentPath(self.maze_grid, self.exit_distances)
+        added, removed = self.hint.move_to(self.current_pos)
+        self.renderer.update_hint(added, removed)
+
+    def get_exit_distances(self):
+        """Distance-from-exit field, computed once per generated maze"""
+        if self.exit_distances is None:
+            from maze_solvers import distance_field
+            self.exit_distances = distance_field(self.maze_grid, self.maze.exit)
+        return self.exit_distances
+
+    def distance_to_exit(self, pos: Tuple[int, int]) -> int:
+        """Shortest number of steps from pos to the exit, or -1 if unreachable"""
+        y, x = pos
+        return self.get_exit_distances()[self.maze_grid.index(x, y)]
 
     def find_shortest_path(self) -> List[Tuple[int, int]]:
-        """Find shortest path from entrance to exit using BFS"""
-        queue = deque([(self.maze.entrance, [self.maze.entrance])])
-        visited = {self.maze.entrance}
-        
-        while queue:
-            current, path = queue.popleft()
-            if current == self.maze.exit:
-                return path
-            
-            y, x = current
-            for ny, nx in [(y+1, x), (y-1, x), (y, x+1), (y, x-1)]:
-                if (0 <= ny < self.maze.height and 0 <= nx < self.maze.width and 
-                    (ny, nx) not in visited and self.maze.grid[ny][nx] != Cell.WALL):
-                    visited.add((ny, nx))
-                    queue.append(((ny, nx), path + [(ny, nx)]))
-        
-        return []
+        """Find shortest path from entrance to exit using the cached distance field"""
+        from maze_solvers import descend
+        return descend(self.maze_grid, self.get_exit_distances(), self.maze.entrance)
+
+    def install_profiling(self):
+        """Time each key press and maze rebuild as a frame, split into phases"""
+        profiler = self.profiler
+        profiler.instrument_frame(self, 'handle_movement')
+        profiler.instrument(self, 'update_position', 'move')
+        profiler.instrument(self, 'draw_maze')
+        profiler.instrument(self, 'find_shortest_path', 'solve')
+        profiler.instrument(self, 'update_hint', 'hint')
+        for renderer in (self.full_renderer, self.viewport_renderer, self.bitmap_renderer):
+            profiler.instrument(renderer, 'mark_visited', 'draw')
+            profiler.instrument(renderer, 'move_player', 'draw')
+            profiler.instrument(renderer, 'show_shortest_path', 'draw')
+            profiler.instrument(renderer, 'update_hint', 'draw')
+        profiler.instrument_canvas(self.canvas)
 
     def handle_movement(self, event):
         """Handle arrow key movement"""
-        y, x = self.current_pos
-        new_pos = None
-        
-        if event.keysym == 'Up' and y > 0:
-            new_pos = (y-1, x)
-        elif event.keysym == 'Down' and y < self.maze.height-1:
-            new_pos = (y+1, x)
-        elif event.keysym == 'Left' and x > 0:
-            new_pos = (y, x-1)
-        elif event.keysym == 'Right' and x < self.maze.width-1:
-            new_pos = (y, x+1)
-            
-        if new_pos and self.is_valid_move(new_pos):
-            self.current_pos = new_pos
-            self.path_taken.add(new_pos)
-            self.draw_maze()
-
-    def is_valid_move(self, pos: Tuple[int, int]) -> bool:
-        """Check if the move is valid (not a wall)"""
-        y, x = pos
-        return self.maze.grid[y][x] != Cell.WALL
+        if event.keysym == 'F3':
+            from profiler import toggle_profiler
+            toggle_profiler(self)
+            return
+        if event.keysym == 'F4':
+            from profiler import dump_trace
+            print("Trace written to", dump_trace(self, 'maze'))
+            return
+        if self.maze is None:
+            return
+        if event.keysym == 'F5':
+            self.save_recording()
+            return
+        if event.keysym in ('h', 'H'):
+            self.hint_var.set(not self.hint_var.get())
+            self.toggle_hint()
+            return
+        if event.keysym in ('plus', 'equal', 'KP_Add'):
+            self.renderer.zoom(1)
+            return
+        if event.keysym in ('minus', 'KP_Subtract'):
+            self.renderer.zoom(-1)
+            return
+        if self.replay is None and event.keysym in MAZE_KEYS:
+            self.press_key(event.keysym)
+
+    def press_key(self, keysym: str):
+        """Apply and record an arrow key press"""
+        self.recording.key(self.recording_ms(), keysym)
+        new_pos = key_target(self.maze_grid, self.current_pos, keysym)
+        if new_pos is not None:
+            self.update_position(new_pos)
+
+    def recording_ms(self) -> int:
+        return int((time.perf_counter() - self.recording_start) * 1000)
+
+    def save_recording(self):
+        """Write the session so far to a replay file"""
+        path = f"maze-{self.maze_seed}-{int(time.time())}.replay"
+        print("Replay written to", self.recording.save(path, self.recording_ms()))
+
+    def schedule_replay(self, now_ms: int):
+        """Queue the next recorded input relative to the recording time now_ms"""
+        self.replay_pending = next(self.replay_events, None)
+        if self.replay_pending is None or self.replay_pending[1] == END:
+            self.title(f"Maze Game - seed {self.maze_seed} - replay finished")
+            return
+        delay = max(0, self.replay_pending[0] - now_ms) / self.replay_speed
+        self.after(int(delay), self.play_replay_event)
+
+    def play_replay_event(self):
+        """Apply the queued recorded input and schedule the next one"""
+        ms, kind, a, _ = self.replay_pending
+        if kind == KEY:
+            self.press_key(MAZE_KEYS[a])
+        elif kind == RESET:
+            self.reset_position()
+        self.schedule_replay(ms)
 
     def reset_position(self):
         """Reset player position to entrance"""
+        if self.maze is None:
+            return
+        self.recording.reset(self.recording_ms())
+        self.renderer.clear_shortest_path()
+        self.renderer.restore(self.path_taken)
         self.current_pos = self.maze.entrance
-        self.path_taken = {self.current_pos}
+        self.path_taken = Trail(self.maze_grid.width, self.maze_grid.height)
+        self.path_taken.add(self.current_pos)
+        self.steps_taken = 0
         self.game_finished = False
         self.shortest_path = None
-        self.draw_maze()
+        self.renderer.mark_visited(self.current_pos)
+        self.renderer.move_player(self.current_pos)
+        self.update_hint()
 
     def show_victory_message(self):
         """Show victory message with path comparison"""
@@ -198,8 +431,8 @@ class MazeGame(tk.Tk):
         victory_window.title("Victory!")
         
         # Calculate path efficiency
-        shortest_length = len(self.shortest_path) - 1  # -1 because path includes start position
-        your_length = len(self.path_taken) - 1  # -1 for the same reason
+        shortest_length = self.distance_to_exit(self.maze.entrance)
+        your_length = self.steps_taken  # Every move, including backtracking
         difference = your_length - shortest_length
         efficiency = (shortest_length / your_length) * 100 if your_length > 0 else 0
         
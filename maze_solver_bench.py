@@ -0,0 +1,93 @@
+"""
+Compare the maze solvers on seeded mazes.
+
+Generates N seeded mazes with maze_batch and runs every solver from
+maze_solvers.SOLVERS on each, from the entrance to the exit. Reports per
+algorithm the wall time, nodes expanded and peak memory, and checks that
+all solvers agree on the path length.
+
+Wall time and peak memory are measured in separate passes, since
+tracemalloc slows allocation-heavy code down considerably.
+
+Command line:
+    python maze_solver_bench.py --count 20 --width 501 --height 501
+    python maze_solver_bench.py --solvers astar,bidirectional --complexity 0.1
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List
+from maze_batch import generate_batch
+from maze_solvers import SOLVERS
+
+
+def measure(solver, maze) -> Dict[str, float]:
+    """Run solver once on maze for timing, then again under tracemalloc"""
+    grid, start, goal = maze.grid, maze.entrance, maze.exit
+    stats = {}
+    begin = time.perf_counter()
+    path = solver(grid, start, goal, stats)
+    elapsed = time.perf_counter() - begin
+
+    tracemalloc.start()
+    try:
+        solver(grid, start, goal)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ms': elapsed * 1000,
+        'expanded': stats.get('expanded', 0),
+        'peak_kib': peak / 1024,
+        'length': len(path),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare maze solvers on seeded mazes")
+    parser.add_argument('--count', type=int, default=10, help="number of mazes")
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--width', type=int, default=201)
+    parser.add_argument('--height', type=int, default=201)
+    parser.add_argument('--complexity', type=float, default=0.7)
+    parser.add_argument('--solvers', default=','.join(SOLVERS),
+                        help=f"comma-separated subset of {', '.join(SOLVERS)}")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="generator processes (default: all cores)")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.solvers.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SOLVERS]
+    if unknown:
+        parser.error(f"unknown solver(s): {', '.join(unknown)}")
+
+    seeds = range(args.seed, args.seed + args.count)
+    results: Dict[str, List[Dict[str, float]]] = {name: [] for name in names}
+    mismatches = 0
+    for maze in generate_batch(seeds, args.width, args.height, args.complexity, args.workers):
+        lengths = set()
+        for name in names:
+            result = measure(SOLVERS[name], maze)
+            results[name].append(result)
+            lengths.add(result['length'])
+        if len(lengths) > 1:
+            mismatches += 1
+            print(f"seed {maze.seed}: path lengths differ {sorted(lengths)}")
+
+    print(f"{args.count} mazes of {args.width}x{args.height}, complexity {args.complexity}")
+    print(f"{'solver':<14} {'mean ms':>9} {'median ms':>10} {'expanded':>10} {'peak KiB':>10}")
+    for name in names:
+        runs = results[name]
+        times = [run['ms'] for run in runs]
+        print(f"{name:<14} {statistics.mean(times):9.2f} {statistics.median(times):10.2f} "
+              f"{statistics.mean(run['expanded'] for run in runs):10.0f} "
+              f"{max(run['peak_kib'] for run in runs):10.1f}")
+    if mismatches:
+        print(f"{mismatches} maze(s) with disagreeing path lengths")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""
+Shortest-path solvers for the maze game.
+
+Searches run directly on a MazeGrid's flat cell storage and address cells
+by flat index (y * width + x). Parent pointers and distances live in flat
+arrays instead of copying partial paths into every queue entry, so memory
+stays O(V) regardless of path length. Positions are (y, x) tuples, as in
+MazeGame.
+
+DescentPath keeps the path from a moving position to the exit up to date
+for the maze game's hint, touching only the cells that change.
+
+Every solver in SOLVERS has the signature
+solver(grid, start, goal, stats=None) -> path and, when given a stats
+dict, stores the number of nodes it expanded under 'expanded'. Compare
+them with maze_solver_bench.py.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+from maze_grid import MazeGrid, WALL
+
+Position = Tuple[int, int]
+
+UNREACHABLE = -1
+
+
+def _neighbours(index: int, width: int, size: int):
+    """Flat indices of the four orthogonal neighbours inside the grid"""
+    x = index % width
+    if index + width < size:
+        yield index + width
+    if index >= width:
+        yield index - width
+    if x + 1 < width:
+        yield index + 1
+    if x > 0:
+        yield index - 1
+
+
+def _downhill(current: int, distances: array, width: int, size: int) -> int:
+    """The neighbour of current one step closer to the distance field's source"""
+    target = distances[current] - 1
+    for nxt in _neighbours(current, width, size):
+        if distances[nxt] == target:
+            return nxt
+    raise ValueError("distance field is inconsistent")
+
+
+def _parent_path(parent: array, source: int, target: int, width: int) -> List[Position]:
+    """Rebuild the path once, walking parents back from target to source"""
+    path = []
+    current = target
+    while current != source:
+        path.append(divmod(current, width))
+        current = parent[current]
+    path.append(divmod(source, width))
+    path.reverse()
+    return path
+
+
+def bfs_shortest_path(grid: MazeGrid, start: Position, goal: Position,
+                      stats: Optional[dict] = None) -> List[Position]:
+    """
+    Find the shortest path between two cells with parent-pointer BFS.
+
+    Returns:
+        List[Position]: (y, x) cells from start to goal inclusive,
+        or an empty list if the goal is unreachable
+    """
+    width = grid.width
+    size = width * grid.height
+    cells = grid.cells
+
+    source = start[0] * width + start[1]
+    target = goal[0] * width + goal[1]
+    parent = array('i', [UNREACHABLE]) * size
+    parent[source] = source
+    queue = deque([source])
+    expanded = 0
+
+    while queue:
+        current = queue.popleft()
+        expanded += 1
+        if current == target:
+            break
+        for nxt in _neighbours(current, width, size):
+            if cells[nxt] != WALL and parent[nxt] == UNREACHABLE:
+                parent[nxt] = current
+                queue.append(nxt)
+    else:
+        current = None
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if current != target:
+        return []
+    return _parent_path(parent, source, target, width)
+
+
+def astar_shortest_path(grid: MazeGrid, start: Position, goal: Position,
+                        stats: Optional[dict] = None) -> List[Position]:
+    """
+    A* search with the Manhattan distance heuristic.
+
+    Ties on f = g + h are broken towards the deeper node, which keeps the
+    open set small in corridors. The heuristic is consistent on a 4-way
+    grid, so each cell is expanded at most once.
+    """
+    width = grid.width
+    size = width * grid.height
+    cells = grid.cells
+    goal_y, goal_x = goal
+
+    source = start[0] * width + start[1]
+    target = goal_y * width + goal_x
+    cost = array('i', [UNREACHABLE]) * size
+    parent = array('i', [UNREACHABLE]) * size
+    cost[source] = 0
+    parent[source] = source
+    heap = [(abs(start[0] - goal_y) + abs(start[1] - goal_x), 0, source)]
+    expanded = 0
+    found = False
+
+    while heap:
+        _, negative_cost, current = heapq.heappop(heap)
+        if -negative_cost != cost[current]:
+            continue  # Stale entry
+        expanded += 1
+        if current == target:
+            found = True
+            break
+        step = cost[current] + 1
+        for nxt in _neighbours(current, width, size):
+            if cells[nxt] != WALL and (cost[nxt] == UNREACHABLE or step < cost[nxt]):
+                cost[nxt] = step
+                parent[nxt] = current
+                y, x = divmod(nxt, width)
+                heapq.heappush(heap, (step + abs(y - goal_y) + abs(x - goal_x), -step, nxt))
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if not found:
+        return []
+    return _parent_path(parent, source, target, width)
+
+
+def bidirectional_bfs(grid: MazeGrid, start: Position, goal: Position,
+                      stats: Optional[dict] = None) -> List[Position]:
+    """
+    BFS from both ends at once, always growing the smaller frontier by a
+    whole layer.
+
+    The search stops after the first layer in which the two sides meet;
+    the best meeting cell of that layer lies on a shortest path, which is
+    rebuilt by descending both distance fields from it.
+    """
+    width = grid.width
+    size = width * grid.height
+    cells = grid.cells
+
+    source = start[0] * width + start[1]
+    target = goal[0] * width + goal[1]
+    if source == target:
+        if stats is not None:
+            stats['expanded'] = 0
+        return [start]
+
+    forward = array('i', [UNREACHABLE]) * size
+    backward = array('i', [UNREACHABLE]) * size
+    forward[source] = 0
+    backward[target] = 0
+    forward_frontier = [source]
+    backward_frontier = [target]
+    expanded = 0
+    meeting = None
+    best = size * 2
+
+    while forward_frontier and backward_frontier and meeting is None:
+        grow_forward = len(forward_frontier) <= len(backward_frontier)
+        if grow_forward:
+            frontier, distances, other = forward_frontier, forward, backward
+        else:
+            frontier, distances, other = backward_frontier, backward, forward
+
+        next_frontier = []
+        for current in frontier:
+            expanded += 1
+            step = distances[current] + 1
+            for nxt in _neighbours(current, width, size):
+                if cells[nxt] != WALL and distances[nxt] == UNREACHABLE:
+                    distances[nxt] = step
+                    next_frontier.append(nxt)
+                    if other[nxt] != UNREACHABLE and step + other[nxt] < best:
+                        best = step + other[nxt]
+                        meeting = nxt
+
+        if grow_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if meeting is None:
+        return []
+
+    middle = divmod(meeting, width)
+    path = descend(grid, forward, middle)
+    path.reverse()
+    path.extend(descend(grid, backward, middle)[1:])
+    return path
+
+
+def dead_end_filling(grid: MazeGrid, start: Position, goal: Position,
+                     stats: Optional[dict] = None) -> List[Position]:
+    """
+    Fill dead ends until only corridors between start and goal remain,
+    then BFS over what is left.
+
+    In a perfect maze the remaining cells are exactly the solution; in a
+    maze with loops the final BFS picks the shortest of the surviving
+    routes. Filled cells count as expanded nodes, plus the final BFS.
+    """
+    width = grid.width
+    size = width * grid.height
+    filled_grid = grid.copy()
+    cells = filled_grid.cells
+    source = start[0] * width + start[1]
+    target = goal[0] * width + goal[1]
+
+    # Open neighbour count of every open cell
+    degree = bytearray(size)
+    for index in range(size):
+        if cells[index] != WALL:
+            degree[index] = sum(1 for nxt in _neighbours(index, width, size) if cells[nxt] != WALL)
+
+    stack = [index for index in range(size)
+             if cells[index] != WALL and degree[index] <= 1 and index != source and index != target]
+    filled = 0
+    while stack:
+        current = stack.pop()
+        if cells[current] == WALL:
+            continue
+        cells[current] = WALL
+        filled += 1
+        for nxt in _neighbours(current, width, size):
+            if cells[nxt] != WALL:
+                degree[nxt] -= 1
+                if degree[nxt] <= 1 and nxt != source and nxt != target:
+                    stack.append(nxt)
+
+    path = bfs_shortest_path(filled_grid, start, goal, stats)
+    if stats is not None:
+        stats['filled'] = filled
+        stats['expanded'] += filled
+    return path
+
+
+def field_shortest_path(grid: MazeGrid, start: Position, goal: Position,
+                        stats: Optional[dict] = None) -> List[Position]:
+    """Full distance field from the goal, then descend; what MazeGame caches"""
+    distances = distance_field(grid, goal)
+    if stats is not None:
+        stats['expanded'] = sum(1 for distance in distances if distance != UNREACHABLE)
+    return descend(grid, distances, start)
+
+
+def distance_field(grid: MazeGrid, source: Position) -> array:
+    """
+    Compute BFS distances from one cell to every reachable cell.
+
+    Returns:
+        array: Flat distances indexed by y * width + x, UNREACHABLE for
+        walls and cells cut off from the source
+    """
+    width = grid.width
+    size = width * grid.height
+    cells = grid.cells
+
+    distances = array('i', [UNREACHABLE]) * size
+    origin = source[0] * width + source[1]
+    distances[origin] = 0
+    queue = deque([origin])
+
+    while queue:
+        current = queue.popleft()
+        step = distances[current] + 1
+        for nxt in _neighbours(current, width, size):
+            if cells[nxt] != WALL and distances[nxt] == UNREACHABLE:
+                distances[nxt] = step
+                queue.append(nxt)
+    return distances
+
+
+def descend(grid: MazeGrid, distances: array, start: Position) -> List[Position]:
+    """
+    Follow a distance field downhill from start to its source.
+
+    Each step moves to any neighbour one closer to the source, so the
+    result is a shortest path built in O(path length).
+    """
+    width = grid.width
+    size = width * grid.height
+    current = start[0] * width + start[1]
+    if distances[current] == UNREACHABLE:
+        return []
+
+    path = [start]
+    while distances[current] > 0:
+        current = _downhill(current, distances, width, size)
+        path.append(divmod(current, width))
+    return path
+
+
+class DescentPath:
+    """
+    Descent path from a moving position to a distance field's source.
+
+    Greedy descent always leaves a cell through the same neighbour, so the
+    descents from every cell form a tree rooted at the source. After a
+    move it is enough to descend from the new position until joining the
+    current path and to trim the old path back to that cell; the cost is
+    proportional to the cells that changed, not to the path length.
+    """
+
+    def __init__(self, grid: MazeGrid, distances: array):
+        self.grid = grid
+        self.distances = distances
+        self.width = grid.width
+        self.size = grid.width * grid.height
+        # Flat indices from the source up to the current position
+        self.cells = array('i')
+        self.on_path = bytearray(self.size)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def positions(self) -> List[Position]:
+        """The path from the current position to the source"""
+        width = self.width
+        return [divmod(index, width) for index in reversed(self.cells)]
+
+    def move_to(self, pos: Position) -> Tuple[List[Position], List[Position]]:
+        """
+        Make pos the start of the path.
+
+        Returns:
+            Tuple[List[Position], List[Position]]: Cells added to and
+            removed from the path
+        """
+        width, size = self.width, self.size
+        distances = self.distances
+        on_path = self.on_path
+        current = pos[0] * width + pos[1]
+
+        branch = []
+        if distances[current] != UNREACHABLE:
+            while not on_path[current]:
+                branch.append(current)
+                if distances[current] == 0:
+                    break
+                current = _downhill(current, distances, width, size)
+        join = current if on_path[current] else None
+
+        removed = []
+        cells = self.cells
+        while cells and cells[-1] != join:
+            index = cells.pop()
+            on_path[index] = 0
+            removed.append(divmod(index, width))
+
+        for index in reversed(branch):
+            cells.append(index)
+            on_path[index] = 1
+        return [divmod(index, width) for index in branch], removed
+
+
+SOLVERS: Dict[str, Callable[[MazeGrid, Position, Position], List[Position]]] = {
+    'bfs': bfs_shortest_path,
+    'astar': astar_shortest_path,
+    'bidirectional': bidirectional_bfs,
+    'dead_end': dead_end_filling,
+    'field': field_shortest_path,
+}
@@ -0,0 +1,121 @@
+"""
+Compact record of the cells a player has visited.
+
+A Trail stores visited cells as a bitset over the grid (one bit per cell,
+each row padded to whole bytes) instead of a set of (y, x) tuples.
+Membership and insertion are O(1), and row_runs() turns a row of bits
+into horizontal runs for drawing merged rectangles.
+
+The ordered step log lives in the session's MazeRecording (replay.py)
+rather than here: MazeGame.press_key and reset_position log every key and
+reset, and key_target() replays them into the same moves.
+
+key_target() is the maze game's movement rule, shared by the window and
+headless replay.
+
+Positions are (y, x), like the rest of the maze game.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+from maze_grid import MazeGrid
+
+Position = Tuple[int, int]
+
+# Arrow key -> (dy, dx)
+KEY_STEPS = {
+    'Up': (-1, 0),
+    'Down': (1, 0),
+    'Left': (0, -1),
+    'Right': (0, 1),
+}
+
+
+def key_target(grid: MazeGrid, pos: Position, keysym: str) -> Optional[Position]:
+    """Cell an arrow key moves to from pos, or None if it is not a legal move"""
+    step = KEY_STEPS.get(keysym)
+    if step is None:
+        return None
+    y, x = pos[0] + step[0], pos[1] + step[1]
+    if not grid.in_bounds(x, y) or grid.is_wall(x, y):
+        return None
+    return y, x
+
+
+class Trail:
+    """
+    Visited-cell bitset.
+
+    Attributes:
+        width, height (int): Grid dimensions
+        bits (bytearray): Row-padded visited bitset
+    """
+
+    __slots__ = ('width', 'height', 'row_bytes', 'bits', 'count')
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.row_bytes = (width + 7) // 8
+        self.bits = bytearray(self.row_bytes * height)
+        self.count = 0
+
+    @classmethod
+    def from_positions(cls, width: int, height: int, positions: Iterable[Position]) -> 'Trail':
+        trail = cls(width, height)
+        for pos in positions:
+            trail.add(pos)
+        return trail
+
+    def add(self, pos: Position) -> bool:
+        """
+        Mark pos visited.
+
+        Returns:
+            bool: True if pos had not been visited before
+        """
+        y, x = pos
+        byte = y * self.row_bytes + (x >> 3)
+        mask = 1 << (x & 7)
+        if self.bits[byte] & mask:
+            return False
+        self.bits[byte] |= mask
+        self.count += 1
+        return True
+
+    def discard(self, pos: Position):
+        """Unmark pos"""
+        y, x = pos
+        byte = y * self.row_bytes + (x >> 3)
+        mask = 1 << (x & 7)
+        if self.bits[byte] & mask:
+            self.bits[byte] &= ~mask
+            self.count -= 1
+
+    def __contains__(self, pos: Position) -> bool:
+        y, x = pos
+        return bool(self.bits[y * self.row_bytes + (x >> 3)] & (1 << (x & 7)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Position]:
+        """Visited positions in row-major order"""
+        for y in range(self.height):
+            for x1, x2 in self.row_runs(y):
+                for x in range(x1, x2):
+                    yield y, x
+
+    def row_runs(self, y: int) -> List[Tuple[int, int]]:
+        """Maximal runs of visited cells in row y as (x_start, x_end_exclusive)"""
+        start = y * self.row_bytes
+        value = int.from_bytes(self.bits[start:start + self.row_bytes], 'little')
+        runs = []
+        while value:
+            x1 = (value & -value).bit_length() - 1
+            shifted = value >> x1
+            # Length of the block of ones at the bottom of shifted
+            length = (shifted ^ (shifted + 1)).bit_length() - 1
+            x2 = x1 + length
+            runs.append((x1, x2))
+            value = (shifted >> length) << x2
+        return runs
@@ -30,7 +30,11 @@ Technical Features:
 Usage:
 -----
 Run the game:
-    python pacman2.py
+    python packman.py
+    python packman.py --level levels/classic.txt --seed 42
+
+Measure cold start (import time and time to the first frame):
+    GAMES_STARTUP=exit python packman.py
 
 Controls:
     - Arrow keys: Move Pacman
@@ -78,16 +82,29 @@ Implementation Details:
    - Win/lose conditions
 """
 
-from typing import List, Tuple
-from pacman import *
-import time  # Add this import
+import time
+_IMPORT_START = time.perf_counter()  # Origin of the GAMES_STARTUP report
+
+import argparse
+import random
+import tkinter as tk
+from game_loop import FixedTimestepLoop
+from pacman_level import load_board
+from pacman_sim import PacmanSimulation, DOT_EATEN, POWER_DOT_EATEN, GAME_OVER, VICTORY
+from pacman_render import PacmanScene
+from replay import PacmanPlayer, PacmanRecording
+from startup import StartupTimer, after_first_paint, startup_requested
 
-# ... (GameObject, Pacman, Ghost, Dot, and PowerDot classes remain the same)
+# profiler is imported on first use, after the window is up
+_IMPORT_END = time.perf_counter()
 
 class PacmanGame2(tk.Tk):
     """
     Enhanced version of the Pacman game with improved features.
     
+    Game rules live in PacmanSimulation; this class only forwards
+    keyboard input to it, steps it from the Tk loop and renders it.
+    
     Key Improvements:
         - Better maze layout
         - Improved ghost AI
@@ -96,401 +113,185 @@ class PacmanGame2(tk.Tk):
         - Enhanced visuals
     """
     
-    def __init__(self):
+    def __init__(self, seed=None, replay=None, speed=1, board=None):
         """
         Initialize enhanced game with improved controls and timing.
         
-        Features:
-            - Movement delay controls
-            - Ghost movement timing
-            - Animation counters
-            - Game state tracking
+        Args:
+            seed: Optional seed for reproducible ghost behaviour
+            board: Optional pacman_level.Board; defaults to the classic board
+            replay: Optional PacmanRecording to play back instead of taking input
+            speed: Playback speed multiplier for replay (1-16)
         """
         super().__init__()
         
-        self.title("Pacman")
+        mode = startup_requested()
+        self.startup = StartupTimer("Pacman", _IMPORT_START, _IMPORT_END,
+                                    exit_after=mode == 'exit') if mode else None
+        
+        self.title("Pacman - replay" if replay is not None else "Pacman")
         self.grid_size = 20  # pixels per grid cell
-        self.grid_width = 28
-        self.grid_height = 31
         
-        # Add movement delay controls
-        self.move_delay = 150  # milliseconds between moves (slower)
-        self.last_move_time = time.time() * 1000  # Convert to milliseconds
-        self.ghost_move_counter = 0
-        self.ghost_move_delay = 2  # Move ghosts every N frames
+        # Game state; always seeded so the session can be recorded
+        if replay is not None:
+            self.sim = PacmanSimulation(replay.seed, replay.tick_ms, board)
+        else:
+            self.sim = PacmanSimulation(seed if seed is not None else random.randrange(2**31),
+                                        board=board)
+        
+        # Input log (F5 saves it) and replay playback
+        self.recording = PacmanRecording(self.sim.seed, self.sim.tick_ms)
+        self.player = PacmanPlayer(replay) if replay is not None else None
+        self.grid_width = self.sim.grid_width
+        self.grid_height = self.sim.grid_height
         
         # Create canvas
         self.canvas = tk.Canvas(self, width=self.grid_width * self.grid_size,
                               height=self.grid_height * self.grid_size,
                               bg='black')
         self.canvas.pack()
+        self.scene = None  # Sprites and level are built once the window is shown
         
-        # Create game objects
-        self.pacman = Pacman(14, 23)  # Start position
-        self.ghosts = [
-            Ghost(13, 11, Ghost.COLORS[0]),  # Red ghost
-            Ghost(14, 11, Ghost.COLORS[1]),  # Pink ghost
-            Ghost(13, 12, Ghost.COLORS[2]),  # Cyan ghost
-            Ghost(14, 12, Ghost.COLORS[3])   # Orange ghost
-        ]
-        
-        # Create maze and dots
-        self.maze = self.create_maze()
-        self.dots = self.create_dots()
-        self.power_dots = self.create_power_dots()
-        
-        # Bind keys
-        self.bind('<KeyPress>', self.handle_keypress)
-        
-        # Game state
-        self.game_over = False
-        self.power_mode = False
-        self.power_time = 0
-        
-        # Animation variables
-        self.animation_counter = 0
-        
-        # Start game loop
-        self.update_game()
-    
-    def create_maze(self) -> List[List[bool]]:
-        """
-        Create classic Pacman maze layout.
-        
-        Features:
-            - Proper corridors
-            - Ghost house
-            - Tunnel passages
-            - Strategic walls
-        
-        Returns:
-            List[List[bool]]: 2D grid representing maze layout
-        """
-        # Initialize all as walls
-        maze = [[True] * self.grid_width for _ in range(self.grid_height)]
-        
-        # Define the main corridors
-        # Horizontal corridors
-        for y in [1, 5, 8, 14, 20, 23, 26, 29]:
-            for x in range(1, self.grid_width-1):
-                maze[y][x] = False
-                
-        # Vertical corridors
-        for x in [1, 6, 12, 15, 21, 26]:
-            for y in range(1, self.grid_height-1):
-                maze[y][x] = False
-        
-        # Ghost house
-        for y in range(11, 15):
-            for x in range(11, 17):
-                maze[y][x] = False
+        # Bind keys (looked up per event so the profiler can wrap the handler)
+        self.bind('<KeyPress>', lambda event: self.handle_keypress(event))
         
-        # Add ghost house door
-        maze[11][13] = True
-        maze[11][14] = True
+        # Start game loop: fixed-rate logic updates, one render per frame.
+        # Fast replays shorten the step and allow more updates per frame.
+        self.loop = FixedTimestepLoop(self, self.update_game, self.draw_game,
+                                      step_ms=self.sim.tick_ms / speed,
+                                      max_updates=5 * speed)
         
-        # Add tunnels on sides
-        maze[14][0] = False
-        maze[14][self.grid_width-1] = False
+        # Opt-in instrumentation (F3 toggles, F4 dumps a trace), created on first use
+        self.profiler = None
+        self.profiler_overlay = None
         
-        # Add some additional paths
-        additional_paths = [
-            (2, 2, 4, 4),    # Top left box
-            (2, 23, 4, 25),  # Top right box
-            (26, 2, 28, 4),  # Bottom left box
-            (26, 23, 28, 25) # Bottom right box
-        ]
-        
-        for y1, x1, y2, x2 in additional_paths:
-            for y in range(y1, y2+1):
-                for x in range(x1, x2+1):
-                    maze[y][x] = False
-        
-        return maze
-    
-    def create_dots(self) -> List[Dot]:
-        """Create dots in the maze"""
-        dots = []
-        exclude_positions = {
-            (14, 23),  # Pacman start
-            (13, 11), (14, 11), (13, 12), (14, 12)  # Ghost positions
-        }
-        
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                if not self.maze[y][x] and (x, y) not in exclude_positions:
-                    # Exclude ghost house area
-                    if not (11 <= y <= 14 and 11 <= x <= 16):
-                        dots.append(Dot(x, y))
-        return dots
-    
-    def create_power_dots(self) -> List[PowerDot]:
-        """Create power dots in specific locations"""
-        return [
-            PowerDot(1, 3),    # Top left
-            PowerDot(26, 3),   # Top right
-            PowerDot(1, 23),   # Bottom left
-            PowerDot(26, 23)   # Bottom right
-        ]
-    
-    def move_ghosts(self):
+        after_first_paint(self, self.on_window_shown)
+        if self.startup is not None:
+            self.startup.mark('window built')
+
+    def on_window_shown(self):
         """
-        Enhanced ghost movement with improved AI.
+        Rest of startup, deferred until the empty window has been drawn.
         
-        Features:
-            - Different behaviors per ghost
-            - Power mode reactions
-            - Better pathfinding
-            - Tunnel handling
-            - Collision avoidance
+        Rasterizing the sprites and building the level are the slow part
+        of opening the game, so they run only once the window is up.
         """
-        for ghost in self.ghosts:
-            if self.power_mode:
-                # Reduce ghost movement probability when in power mode
-                if random.random() > 0.7:  # 30% chance to move when vulnerable
-                    continue
-                # Run away from Pacman
-                dx = ghost.x - self.pacman.x
-                dy = ghost.y - self.pacman.y
-                
-                # Choose direction away from Pacman
-                possible_dirs = []
-                # Check all possible directions with boundary wrapping
-                # Right
-                next_x = (ghost.x + 1) % self.grid_width
-                if not self.maze[ghost.y][next_x]:
-                    possible_dirs.append([1, 0])
-                # Left
-                next_x = (ghost.x - 1) % self.grid_width
-                if not self.maze[ghost.y][next_x]:
-                    possible_dirs.append([-1, 0])
-                # Down
-                if ghost.y + 1 < self.grid_height and not self.maze[ghost.y + 1][ghost.x]:
-                    possible_dirs.append([0, 1])
-                # Up
-                if ghost.y - 1 >= 0 and not self.maze[ghost.y - 1][ghost.x]:
-                    possible_dirs.append([0, -1])
-            else:
-                # Reduce direction change probability
-                if random.random() > 0.15:  # 15% chance to change direction
-                    continue
-                # Chase Pacman
-                possible_dirs = []
-                for dx, dy in [[-1, 0], [1, 0], [0, -1], [0, 1]]:
-                    new_x = (ghost.x + dx) % self.grid_width  # Wrap horizontally
-                    new_y = ghost.y + dy
-                    if 0 <= new_y < self.grid_height:  # Only check vertical bounds
-                        if not self.maze[new_y][new_x]:
-                            possible_dirs.append([dx, dy])
-            
-            # Choose new direction
-            if possible_dirs and random.random() < 0.3:  # 30% chance to change direction
-                ghost.direction = random.choice(possible_dirs)
-            
-            # Move ghost
-            new_x = (ghost.x + ghost.direction[0]) % self.grid_width  # Wrap horizontally
-            new_y = ghost.y + ghost.direction[1]
-            
-            # Only move if within vertical bounds and not hitting a wall
-            if 0 <= new_y < self.grid_height and not self.maze[new_y][new_x]:
-                ghost.x = new_x
-                ghost.y = new_y
-            else:
-                # If hit wall, try different direction
-                ghost.direction = random.choice(possible_dirs) if possible_dirs else [0, 0]
-
-    def move_pacman(self):
-        """Move pacman and check collisions with tunnel support"""
-        new_x = self.pacman.x + self.pacman.direction[0]
-        new_y = self.pacman.y + self.pacman.direction[1]
-        
-        # Handle tunnel wrapping
-        if new_x < 0:
-            new_x = self.grid_width - 1
-        elif new_x >= self.grid_width:
-            new_x = 0
-        
-        # Check wall collision
-        if not self.maze[new_y][new_x]:
-            self.pacman.x = new_x
-            self.pacman.y = new_y
-            
-        # Check collisions
-        self._check_dot_collision()
-        self._check_power_dot_collision()
-    
-    def _check_dot_collision(self):
-        """Check and handle dot collisions"""
-        for dot in self.dots[:]:
-            if (dot.x, dot.y) == (self.pacman.x, self.pacman.y):
-                self.dots.remove(dot)
-                self.pacman.score += 10
-    
-    def _check_power_dot_collision(self):
-        """Check and handle power dot collisions"""
-        for dot in self.power_dots[:]:
-            if (dot.x, dot.y) == (self.pacman.x, self.pacman.y):
-                self.power_dots.remove(dot)
-                self.power_mode = True
-                self.power_time = 300  # 5 seconds at 60 FPS
-                self.pacman.score += 50
+        if self.startup is not None:
+            self.startup.mark('window shown')
+        self.scene = PacmanScene(self.canvas, self.grid_size)
+        self.scene.build_level(self.sim.maze, self.sim.dots, self.sim.power_dots)
+        self.draw_game()
+        if self.startup is not None:
+            self.startup.first_frame(self)
+        
+        from profiler import profiling_requested, toggle_profiler
+        if profiling_requested():
+            toggle_profiler(self)
+        self.loop.start()
+
+    def install_profiling(self):
+        """Wrap the hot-path phases with profiler timers"""
+        profiler = self.profiler
+        profiler.instrument_frame(self.loop, '_frame')
+        profiler.instrument(self, 'handle_keypress', 'input')
+        profiler.instrument(self.sim, 'move_pacman')
+        profiler.instrument(self.sim, 'move_ghosts')
+        profiler.instrument(self.sim, 'check_ghost_collision', 'collisions')
+        profiler.instrument(self.sim, '_check_dot_collision', 'collisions')
+        profiler.instrument(self.sim, '_check_power_dot_collision', 'collisions')
+        profiler.instrument(self.loop, 'render', 'draw_game')
+        profiler.instrument_canvas(self.canvas)
 
     def handle_keypress(self, event):
         """Handle keyboard input"""
-        if self.game_over:
+        if event.keysym == 'F3':
+            from profiler import toggle_profiler
+            toggle_profiler(self)
+            return
+        if event.keysym == 'F4':
+            from profiler import dump_trace
+            print("Trace written to", dump_trace(self, 'pacman'))
+            return
+        if event.keysym == 'F5':
+            path = f"pacman-{self.sim.seed}-{int(time.time())}.replay"
+            print("Replay written to", self.recording.save(path, self.sim.tick))
+            return
+        if event.keysym == 'Escape':  # Add pause/quit functionality
+            self.quit()
+            return
+        if self.player is not None:  # Replays ignore player input
+            return
+        
+        if self.sim.game_over:
             if event.keysym == 'Return':  # Press Enter to restart
                 self.restart_game()
             return
             
         if event.keysym == 'Left':
-            self.pacman.direction = [-1, 0]
+            self.steer((-1, 0))
         elif event.keysym == 'Right':
-            self.pacman.direction = [1, 0]
+            self.steer((1, 0))
         elif event.keysym == 'Up':
-            self.pacman.direction = [0, -1]
+            self.steer((0, -1))
         elif event.keysym == 'Down':
-            self.pacman.direction = [0, 1]
-        elif event.keysym == 'Escape':  # Add pause/quit functionality
-            self.quit()
+            self.steer((0, 1))
+
+    def steer(self, direction):
+        """Change Pacman's heading, logging actual changes for replays"""
+        if direction != self.sim.pacman.direction:
+            self.recording.steer(self.sim.tick, direction)
+        self.sim.steer(direction)
 
     def update_game(self):
         """
-        Main game loop with improved timing.
+        Logic update: step the simulation once and apply its events.
+        
+        Called by the fixed-timestep loop every sim.tick_ms of real time,
+        possibly several times per rendered frame when running behind.
         
         Features:
-            - Time-based movement
-            - Smooth animations
-            - State updates
-            - Collision checks
-            - Display updates
+            - Event-driven scene updates
+            - Game over and victory messages
+            - Loop shutdown once the game ends
+            - Recorded input applied before each step when replaying
         """
-        if not self.game_over:
-            current_time = time.time() * 1000  # Get current time in milliseconds
-            
-            self.animation_counter += 1
-            
-            # Update mouth animation (slower)
-            if self.animation_counter % 15 == 0:  # Every 15 frames
-                self.pacman.mouth_open = not self.pacman.mouth_open
-            
-            # Move objects with delay
-            if current_time - self.last_move_time >= self.move_delay:
-                self.move_pacman()
-                self.last_move_time = current_time
-            
-            # Move ghosts less frequently
-            self.ghost_move_counter += 1
-            if self.ghost_move_counter >= self.ghost_move_delay:
-                self.move_ghosts()
-                self.ghost_move_counter = 0
-            
-            self.check_ghost_collision()
-            
-            # Update power mode
-            if self.power_mode:
-                self.power_time -= 1
-                if self.power_time <= 0:
-                    self.power_mode = False
-            
-            # Draw everything
-            self.draw_game()
-            
-            # Check win condition
-            if not self.dots and not self.power_dots:
-                self.game_over = True
+        if self.player is not None and not self.player.advance(self.sim):
+            self.loop.stop()
+            self.title("Pacman - replay finished")
+            return
+        
+        for event in self.sim.step():
+            if event[0] in (DOT_EATEN, POWER_DOT_EATEN):
+                self.scene.remove_dot(*event[1])
+            elif event[0] == GAME_OVER:
+                self.show_game_over_message()
+            elif event[0] == VICTORY:
                 self.show_victory_message()
-            
-            # Schedule next update (slower frame rate)
-            self.after(33, self.update_game)  # ~30 FPS instead of 60
-
-    def check_ghost_collision(self):
-        """
-        Enhanced collision detection between Pacman and ghosts.
         
-        Features:
-            - Power mode handling
-            - Score updates
-            - Life management
-            - Position reset
-            - Game over detection
-        """
-        for ghost in self.ghosts[:]:  # Use slice to allow removal during iteration
-            if (ghost.x, ghost.y) == (self.pacman.x, self.pacman.y):
-                if self.power_mode:
-                    # Remove ghost and add points
-                    self.ghosts.remove(ghost)
-                    self.pacman.score += 200
-                else:
-                    self.pacman.lives -= 1
-                    if self.pacman.lives <= 0:
-                        self.game_over = True
-                        self.show_game_over_message()
-                    else:
-                        self.reset_positions()
-
-    def reset_positions(self):
-        """Reset positions of pacman and ghosts"""
-        self.pacman.x, self.pacman.y = 14, 23
-        self.pacman.direction = [0, 0]
-        self.last_move_time = time.time() * 1000  # Reset movement timer
-        ghost_positions = [(13, 11), (14, 11), (13, 12), (14, 12)]
-        for ghost, pos in zip(self.ghosts, ghost_positions):
-            ghost.x, ghost.y = pos
-            ghost.direction = [0, 1]
+        if self.sim.game_over:
+            self.loop.stop()
+            if self.player is not None:
+                # Play on into a recorded restart, if there is one
+                self.after(1000, self.continue_replay)
+
+    def continue_replay(self):
+        if self.player.advance(self.sim) and not self.sim.game_over:
+            self.restart_level()
+        else:
+            self.title("Pacman - replay finished")
 
     def draw_game(self):
         """
-        Improved game rendering with visual enhancements.
+        Incremental game rendering on the persistent scene.
         
         Features:
-            - Better wall appearance
-            - Ghost visualization
-            - Power mode effects
-            - Score display
-            - Animation handling
+            - Walls and dots kept from build_level
+            - Sprites moved in place
+            - Power mode color change only on transitions
+            - HUD rewritten only when score or lives change
+            - Frame-time counter (self.scene.average_frame_ms())
         """
-        self.canvas.delete('all')
-        
-        # Draw maze
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                if self.maze[y][x]:
-                    self.canvas.create_rectangle(
-                        x * self.grid_size, y * self.grid_size,
-                        (x + 1) * self.grid_size, (y + 1) * self.grid_size,
-                        fill='blue', outline='darkblue'
-                    )
-        
-        # Draw dots
-        for dot in self.dots:
-            dot.draw(self.canvas)
-        
-        # Draw power dots
-        for dot in self.power_dots:
-            dot.draw(self.canvas)
-        
-        # Draw ghosts with power mode color change
-        for ghost in self.ghosts:
-            if self.power_mode:
-                original_color = ghost.color
-                ghost.color = 'blue'  # Ghosts turn blue when vulnerable
-                ghost.draw(self.canvas)
-                ghost.color = original_color
-            else:
-                ghost.draw(self.canvas)
-        
-        # Draw pacman
-        self.pacman.draw(self.canvas)
-        
-        # Draw score and lives
-        self.canvas.create_text(
-            50, 10, text=f"Score: {self.pacman.score}",
-            fill='white', anchor='w'
-        )
-        self.canvas.create_text(
-            200, 10, text=f"Lives: {self.pacman.lives}",
-            fill='white', anchor='w'
-        )
+        self.scene.render(self.sim.pacman, self.sim.ghosts, self.sim.power_mode)
 
     def show_game_over_message(self):
         """Show game over message"""
@@ -508,7 +309,7 @@ class PacmanGame2(tk.Tk):
         self.canvas.create_text(
             self.grid_width * self.grid_size // 2,
             self.grid_height * self.grid_size // 2,
-            text=f"VICTORY!\nScore: {self.pacman.score}\nPress Enter to restart",
+            text=f"VICTORY!\nScore: {self.sim.pacman.score}\nPress Enter to restart",
             fill='yellow',
             font=('Arial', 30),
             justify='center'
@@ -516,23 +317,25 @@ class PacmanGame2(tk.Tk):
 
     def restart_game(self):
         """Restart the game"""
-        self.pacman = Pacman(14, 23)
-        self.ghosts = [
-            Ghost(13, 11, Ghost.COLORS[0]),
-            Ghost(14, 11, Ghost.COLORS[1]),
-            Ghost(13, 12, Ghost.COLORS[2]),
-            Ghost(14, 12, Ghost.COLORS[3])
-        ]
-        self.dots = self.create_dots()
-        self.power_dots = self.create_power_dots()
-        self.game_over = False
-        self.power_mode = False
-        self.power_time = 0
-        self.animation_counter = 0
-        self.last_move_time = time.time() * 1000
-        self.ghost_move_counter = 0
-        self.update_game()
+        self.recording.restart(self.sim.tick)
+        self.sim.reset()
+        self.restart_level()
+
+    def restart_level(self):
+        """Rebuild the scene for the new game and restart the loop"""
+        self.scene.build_level(self.sim.maze, self.sim.dots, self.sim.power_dots)
+        self.loop.start()
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Pacman")
+    parser.add_argument('--level', help="level file (default: levels/classic.txt)")
+    parser.add_argument('--seed', type=int, default=None, help="seed for the ghosts")
+    args = parser.parse_args()
+
+    board = load_board(args.level) if args.level else None
+    game = PacmanGame2(seed=args.seed, board=board)
+    game.mainloop()
+
 
 if __name__ == "__main__":
-    game = PacmanGame2()
-    game.mainloop() 
+    main()
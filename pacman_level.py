@@ -0,0 +1,206 @@
+"""
+Pacman level files.
+
+A level is a small text file describing one board: a few directive lines
+followed by the map. Each file is parsed once into an immutable Board
+that also holds everything derived from the layout (compact wall grid,
+starting dot sets, neighbour table and ghost move targets), and Boards
+are cached per file, so starting or restarting a game only copies the
+dot sets.
+
+File layout:
+    # Comment lines start with '#' before the map
+    name Classic
+    wrap x                  # Rows wrap at the edges (tunnels); 'y' or 'x y' also work
+    pacman 14 23            # Pacman start cell as x y
+    ghost 13 11 red         # One line per ghost: spawn x y and a Tk colour name
+    map
+    ##########
+    #o..  ..o#              # '#' wall, '.' dot, 'o' power dot, ' ' empty floor
+
+Map rows shorter than the widest one are padded with empty floor; empty
+lines after the last row are ignored, but a row of spaces is a row of
+floor. Ghosts may spawn inside walls (e.g. the ghost house door).
+
+Example:
+    board = load_board('levels/classic.txt')
+    sim = PacmanSimulation(seed=1, board=board)
+"""
+
+import os
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
+from ghost_ai import build_move_targets
+from maze_grid import MazeGrid, WALL
+
+Position = Tuple[int, int]
+
+LEVEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'levels')
+CLASSIC_LEVEL = os.path.join(LEVEL_DIR, 'classic.txt')
+
+WALL_CHAR = '#'
+DOT_CHAR = '.'
+POWER_DOT_CHAR = 'o'
+FLOOR_CHAR = ' '
+
+# Expected arguments of the directives that take any, for error messages
+DIRECTIVE_USAGE = {
+    'pacman': 'pacman x y',
+    'ghost': 'ghost x y colour',
+}
+
+
+class Board(NamedTuple):
+    """
+    A parsed level; shared between simulations and treated as read-only.
+
+    Positions are (x, y); moves and targets are indexed by y * width + x.
+    """
+    name: str
+    grid: MazeGrid
+    wrap_x: bool
+    wrap_y: bool
+    pacman_start: Position
+    ghost_starts: Tuple[Tuple[Position, str], ...]
+    dots: FrozenSet[Position]
+    power_dots: FrozenSet[Position]
+    moves: Tuple[Dict[Tuple[int, int], Position], ...]
+    targets: Tuple[tuple, ...]
+
+    @property
+    def width(self) -> int:
+        return self.grid.width
+
+    @property
+    def height(self) -> int:
+        return self.grid.height
+
+
+def _is_color_name(word: str) -> bool:
+    """
+    Whether word is shaped like a Tk colour name: letters, optionally
+    followed by digits (red, DarkOrange, gray50).
+
+    Catches typos such as a stray number or punctuation while the level is
+    parsed, rather than when Tk first draws the ghost. '#rrggbb' values
+    cannot appear, since '#' starts a comment.
+    """
+    return word.rstrip('0123456789').isalpha()
+
+
+def parse_level(text: str, name: str = '') -> Board:
+    """
+    Parse level file text into a Board.
+
+    Raises:
+        ValueError: If the level is malformed
+    """
+    wrap_x = wrap_y = False
+    pacman_start = None
+    ghost_starts = []
+    rows = None
+
+    for number, line in enumerate(text.splitlines(), 1):
+        if rows is not None:
+            rows.append(line.rstrip('\n'))
+            continue
+        words = line.split('#', 1)[0].split()
+        if not words:
+            continue
+        try:
+            if words[0] == 'name':
+                name = ' '.join(words[1:])
+            elif words[0] == 'wrap':
+                wrap_x = 'x' in words[1:]
+                wrap_y = 'y' in words[1:]
+            elif words[0] == 'pacman':
+                pacman_start = (int(words[1]), int(words[2]))
+            elif words[0] == 'ghost':
+                ghost_starts.append(((int(words[1]), int(words[2])), words[3]))
+            elif words[0] == 'map':
+                rows = []
+            else:
+                raise ValueError(f"unknown directive {words[0]!r}")
+        except (IndexError, ValueError) as e:
+            usage = DIRECTIVE_USAGE.get(words[0])
+            detail = f"expected '{usage}'" if usage else e
+            raise ValueError(f"Level line {number}: {detail}") from None
+        if words[0] == 'ghost' and not _is_color_name(words[3]):
+            raise ValueError(f"Level line {number}: {words[3]!r} is not a colour name")
+
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        raise ValueError("Level has no map")
+    if pacman_start is None:
+        raise ValueError("Level has no pacman start")
+
+    width, height = max(len(row) for row in rows), len(rows)
+    grid = MazeGrid(width, height)
+    dots, power_dots = set(), set()
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row.ljust(width, FLOOR_CHAR)):
+            if char == WALL_CHAR:
+                grid.set(x, y, WALL)
+            elif char == DOT_CHAR:
+                dots.add((x, y))
+            elif char == POWER_DOT_CHAR:
+                power_dots.add((x, y))
+            elif char != FLOOR_CHAR:
+                raise ValueError(f"Unknown map character {char!r} at {x}, {y}")
+
+    for pos in [pacman_start] + [pos for pos, _ in ghost_starts]:
+        if not grid.in_bounds(*pos):
+            raise ValueError(f"Start position {pos} is outside the map")
+    if grid.is_wall(*pacman_start):
+        raise ValueError("Pacman starts inside a wall")
+
+    moves = grid.neighbour_table(wrap_x=wrap_x, wrap_y=wrap_y)
+    return Board(name, grid, wrap_x, wrap_y, pacman_start, tuple(ghost_starts),
+                 frozenset(dots), frozenset(power_dots), tuple(moves),
+                 tuple(build_move_targets(moves, width)))
+
+
+def format_level(board: Board) -> str:
+    """Level file text for a board; parse_level(format_level(board)) rebuilds it"""
+    lines = [f"name {board.name}"] if board.name else []
+    wrap = [axis for axis, on in (('x', board.wrap_x), ('y', board.wrap_y)) if on]
+    if wrap:
+        lines.append("wrap " + ' '.join(wrap))
+    lines.append("pacman %d %d" % board.pacman_start)
+    lines.extend(f"ghost {x} {y} {color}" for (x, y), color in board.ghost_starts)
+    lines.append("map")
+    grid = board.grid
+    for y in range(grid.height):
+        row: List[str] = []
+        for x in range(grid.width):
+            if grid.is_wall(x, y):
+                row.append(WALL_CHAR)
+            elif (x, y) in board.dots:
+                row.append(DOT_CHAR)
+            elif (x, y) in board.power_dots:
+                row.append(POWER_DOT_CHAR)
+            else:
+                row.append(FLOOR_CHAR)
+        lines.append(''.join(row))
+    return '\n'.join(lines) + '\n'
+
+
+# (absolute path, modification time) -> Board
+_board_cache: Dict[Tuple[str, int], Board] = {}
+
+
+def load_board(path: str) -> Board:
+    """Parse a level file, reusing the cached Board while the file is unchanged"""
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime_ns)
+    board = _board_cache.get(key)
+    if board is None:
+        with open(path, encoding='utf-8') as stream:
+            board = parse_level(stream.read(), os.path.splitext(os.path.basename(path))[0])
+        _board_cache[key] = board
+    return board
+
+
+def classic_board() -> Board:
+    """The stock board shipped in levels/classic.txt"""
+    return load_board(CLASSIC_LEVEL)
@@ -0,0 +1,160 @@
+"""
+Persistent canvas scene for the Pacman game.
+
+Walls are drawn once per level, dots keep their canvas item IDs so an eaten
+dot is deleted by ID, sprites are single image items moved with coords,
+and the HUD is only rewritten when the score or lives change. Sprite
+images come from a SpriteCache built once per scene.
+"""
+
+import time
+import tkinter as tk
+from collections import deque
+from typing import Dict, Iterable, Tuple
+from maze_grid import MazeGrid
+from sprites import SpriteCache
+
+Position = Tuple[int, int]
+
+
+class PacmanScene:
+    """
+    Retained-mode renderer for the Pacman canvas.
+
+    Features:
+        - Static wall layer built once per level
+        - Dot items indexed by grid position
+        - One pre-rendered image item per sprite
+        - HUD updated only on change
+        - Frame-time counter
+    """
+
+    WALL_FILL = 'blue'
+    WALL_OUTLINE = 'darkblue'
+
+    def __init__(self, canvas: tk.Canvas, grid_size: int, frame_window: int = 120):
+        self.canvas = canvas
+        self.grid_size = grid_size
+        self.sprites = SpriteCache(canvas, grid_size)
+        self.dot_items: Dict[Position, int] = {}
+        # id(ghost) -> (canvas item, (x, y, image))
+        self.ghost_items: Dict[int, Tuple[int, tuple]] = {}
+        self.pacman_item = None
+        self.pacman_state = None
+        self.hud_state = None
+        self.score_item = None
+        self.lives_item = None
+
+        # Frame-time counter
+        self.frame_count = 0
+        self.last_frame_time = 0.0
+        self.frame_times = deque(maxlen=frame_window)
+
+    def build_level(self, maze: MazeGrid, dots: Iterable, power_dots: Iterable):
+        """
+        Create the static layer and all persistent items for a level.
+
+        Args:
+            maze: Compact wall grid
+            dots: (x, y) positions of regular dots
+            power_dots: (x, y) positions of power dots
+        """
+        self.canvas.delete('all')
+        self.dot_items = {}
+        self.ghost_items = {}
+        self.pacman_state = None
+        self.hud_state = None
+
+        size = self.grid_size
+        for y in range(maze.height):
+            for x in range(maze.width):
+                if maze.is_wall(x, y):
+                    self.canvas.create_rectangle(
+                        x * size, y * size, (x + 1) * size, (y + 1) * size,
+                        fill=self.WALL_FILL, outline=self.WALL_OUTLINE
+                    )
+
+        dot_image = self.sprites.dot(False)
+        for x, y in dots:
+            self.dot_items[(x, y)] = self.canvas.create_image(*self._centre(x, y), image=dot_image)
+        power_image = self.sprites.dot(True)
+        for x, y in power_dots:
+            self.dot_items[(x, y)] = self.canvas.create_image(*self._centre(x, y), image=power_image)
+
+        self.pacman_item = self.canvas.create_image(0, 0)
+        self.score_item = self.canvas.create_text(50, 10, fill='white', anchor='w')
+        self.lives_item = self.canvas.create_text(200, 10, fill='white', anchor='w')
+
+    def remove_dot(self, x: int, y: int):
+        """Delete an eaten dot or power dot by its item ID"""
+        item = self.dot_items.pop((x, y), None)
+        if item is not None:
+            self.canvas.delete(item)
+
+    def render(self, pacman, ghosts: Iterable, power_mode: bool):
+        """
+        Update the dynamic items for one frame.
+
+        Only sprites whose state changed issue canvas commands.
+        """
+        start = time.perf_counter()
+
+        self._update_pacman(pacman)
+        self._update_ghosts(ghosts, power_mode)
+        self._update_hud(pacman.score, pacman.lives)
+
+        self.last_frame_time = time.perf_counter() - start
+        self.frame_times.append(self.last_frame_time)
+        self.frame_count += 1
+
+    def average_frame_ms(self) -> float:
+        """Average render time in milliseconds over the recent frame window"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times) * 1000
+
+    def _update_pacman(self, pacman):
+        image = self.sprites.pacman(pacman.direction, pacman.mouth_open)
+        state = (pacman.x, pacman.y, image)
+        previous = self.pacman_state or (None, None, None)
+        if state[:2] != previous[:2]:
+            self.canvas.coords(self.pacman_item, *self._centre(pacman.x, pacman.y))
+        if image is not previous[2]:
+            self.canvas.itemconfigure(self.pacman_item, image=image)
+        self.pacman_state = state
+
+    def _update_ghosts(self, ghosts: Iterable, power_mode: bool):
+        alive = set()
+        for ghost in ghosts:
+            key = id(ghost)
+            alive.add(key)
+            image = self.sprites.ghost(ghost.color, ghost.direction, power_mode)
+            entry = self.ghost_items.get(key)
+            if entry is None:
+                item = self.canvas.create_image(*self._centre(ghost.x, ghost.y), image=image)
+                self.ghost_items[key] = (item, (ghost.x, ghost.y, image))
+                continue
+
+            item, (old_x, old_y, old_image) = entry
+            if (old_x, old_y) != (ghost.x, ghost.y):
+                self.canvas.coords(item, *self._centre(ghost.x, ghost.y))
+            if image is not old_image:
+                self.canvas.itemconfigure(item, image=image)
+            self.ghost_items[key] = (item, (ghost.x, ghost.y, image))
+
+        # Remove eaten ghosts
+        for key in [k for k in self.ghost_items if k not in alive]:
+            self.canvas.delete(self.ghost_items.pop(key)[0])
+
+    def _update_hud(self, score: int, lives: int):
+        if (score, lives) == self.hud_state:
+            return
+        self.canvas.itemconfigure(self.score_item, text=f"Score: {score}")
+        self.canvas.itemconfigure(self.lives_item, text=f"Lives: {lives}")
+        self.canvas.tag_raise(self.score_item)
+        self.canvas.tag_raise(self.lives_item)
+        self.hud_state = (score, lives)
+
+    def _centre(self, x: int, y: int) -> Tuple[int, int]:
+        half = self.grid_size // 2
+        return x * self.grid_size + half, y * self.grid_size + half
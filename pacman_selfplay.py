@@ -0,0 +1,235 @@
+"""
+Parallel self-play runner for scoring Pacman bots and ghost AI variants.
+
+Plays one headless PacmanSimulation per seed with a bot steering Pacman,
+fanning seed chunks out over a process pool. Per-game results (score,
+lives lost, ticks, dots remaining) are streamed to a CSV or JSONL file as
+chunks complete, and summary statistics are printed at the end. Each game
+depends only on its seed, the bot and the ghost variant, so a run is
+reproducible however many workers it uses.
+
+Command line:
+    python pacman_selfplay.py --games 10000 --bot greedy --out results.csv
+    python pacman_selfplay.py --games 2000 --ghosts relentless --out results.jsonl
+    python pacman_selfplay.py --games 1000 --level levels/custom.txt --out custom.csv
+"""
+
+import argparse
+import csv
+import json
+import random
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO
+from pacman_level import load_board
+from pacman_sim import PacmanSimulation
+
+
+class GameResult(NamedTuple):
+    """Outcome of one self-play game"""
+    seed: int
+    score: int
+    lives_lost: int
+    ticks: int
+    dots_remaining: int
+    won: bool
+
+
+def random_bot(sim: PacmanSimulation, rng: random.Random):
+    """Keep going, turning at random now and then or when blocked"""
+    pacman = sim.pacman
+    options = sim.moves[pacman.y * sim.grid_width + pacman.x]
+    if pacman.direction not in options or rng.random() < 0.1:
+        sim.steer(rng.choice(list(options)))
+
+
+def greedy_bot(sim: PacmanSimulation, rng: random.Random):
+    """
+    Head for the nearest dot, avoiding cells next to dangerous ghosts.
+
+    Breadth-first search over the neighbour table, only on ticks where
+    Pacman is about to move.
+    """
+    if sim.move_timer + sim.tick_ms < sim.move_delay:
+        return
+    pacman = sim.pacman
+    width = sim.grid_width
+    here = pacman.y * width + pacman.x
+
+    danger = set()
+    if not sim.power_mode:
+        for ghost in sim.ghosts:
+            cell = ghost.y * width + ghost.x
+            danger.add(cell)
+            danger.update(index for _, _, index in sim.targets[cell])
+
+    first_step = {here: None}
+    queue = deque([here])
+    while queue:
+        current = queue.popleft()
+        pos = divmod(current, width)[::-1]
+        if current != here and (pos in sim.dots or pos in sim.power_dots):
+            sim.steer(first_step[current])
+            return
+        for direction, _, nxt in sim.targets[current]:
+            if nxt not in first_step and nxt not in danger:
+                first_step[nxt] = first_step[current] or direction
+                queue.append(nxt)
+    random_bot(sim, rng)  # Boxed in by ghosts
+
+
+def flow_ghosts(sim: PacmanSimulation):
+    """The stock ghost AI"""
+
+
+def random_ghosts(sim: PacmanSimulation):
+    """Ghosts that always move at random"""
+    for ghost in sim.ghosts:
+        ghost.wander = 1.0
+
+
+def relentless_ghosts(sim: PacmanSimulation):
+    """Every ghost chases directly, like the red one"""
+    for ghost in sim.ghosts:
+        ghost.wander, ghost.shy_distance = 0.0, 0
+
+
+BOTS: Dict[str, Callable[[PacmanSimulation, random.Random], None]] = {
+    'random': random_bot,
+    'greedy': greedy_bot,
+}
+
+GHOST_VARIANTS: Dict[str, Callable[[PacmanSimulation], None]] = {
+    'flow': flow_ghosts,
+    'random': random_ghosts,
+    'relentless': relentless_ghosts,
+}
+
+
+def play_game(seed: int, bot: str = 'random', ghosts: str = 'flow',
+              max_ticks: int = 20000, level: Optional[str] = None) -> GameResult:
+    """
+    Play one seeded game to the end (or max_ticks) and report the result.
+
+    Args:
+        level: Level file to play on; None plays the classic board
+    """
+    board = load_board(level) if level else None  # Parsed once per worker process
+    sim = PacmanSimulation(seed=seed, board=board)
+    GHOST_VARIANTS[ghosts](sim)
+    policy = BOTS[bot]
+    rng = random.Random(seed)  # The bot's own stream, separate from the game's
+    lives = sim.pacman.lives
+    while not sim.game_over and sim.tick < max_ticks:
+        policy(sim, rng)
+        sim.step()
+    return GameResult(seed, sim.pacman.score, lives - sim.pacman.lives, sim.tick,
+                      len(sim.dots) + len(sim.power_dots), sim.won)
+
+
+def _play_chunk(seeds: List[int], bot: str, ghosts: str, max_ticks: int,
+                level: Optional[str]) -> List[GameResult]:
+    return [play_game(seed, bot, ghosts, max_ticks, level) for seed in seeds]
+
+
+def run_games(seeds: Iterable[int], bot: str = 'random', ghosts: str = 'flow',
+              max_ticks: int = 20000, workers: Optional[int] = None,
+              chunksize: int = 8, level: Optional[str] = None) -> Iterator[GameResult]:
+    """
+    Play one game per seed.
+
+    Args:
+        level: Level file to play on; None plays the classic board
+        workers: Worker processes; None uses every core, 1 runs in-process
+        chunksize: Games sent to a worker at a time
+
+    Yields:
+        GameResult: Results in completion order, not seed order
+    """
+    seeds = list(seeds)
+    chunks = [seeds[i:i + chunksize] for i in range(0, len(seeds), chunksize)]
+    if workers == 1:
+        for chunk in chunks:
+            yield from _play_chunk(chunk, bot, ghosts, max_ticks, level)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_play_chunk, chunk, bot, ghosts, max_ticks, level)
+                   for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+class ResultWriter:
+    """Streams GameResults to CSV or JSONL, flushing after every write"""
+
+    def __init__(self, stream: TextIO, format: str):
+        self.stream = stream
+        self.format = format
+        if format == 'csv':
+            self.csv = csv.writer(stream)
+            self.csv.writerow(GameResult._fields)
+
+    def write(self, result: GameResult):
+        if self.format == 'csv':
+            self.csv.writerow(result)
+        else:
+            self.stream.write(json.dumps(result._asdict()) + '\n')
+        self.stream.flush()
+
+
+def summarize(results: List[GameResult]) -> Dict[str, float]:
+    """Aggregate statistics over a set of games"""
+    scores = [result.score for result in results]
+    return {
+        'games': len(results),
+        'mean_score': statistics.mean(scores),
+        'median_score': statistics.median(scores),
+        'stdev_score': statistics.stdev(scores) if len(scores) > 1 else 0.0,
+        'max_score': max(scores),
+        'win_rate': sum(result.won for result in results) / len(results),
+        'mean_lives_lost': statistics.mean(result.lives_lost for result in results),
+        'mean_ticks': statistics.mean(result.ticks for result in results),
+        'mean_dots_remaining': statistics.mean(result.dots_remaining for result in results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score Pacman bots over many seeded games")
+    parser.add_argument('--games', type=int, default=1000, help="number of games")
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--bot', choices=BOTS, default='random')
+    parser.add_argument('--ghosts', choices=GHOST_VARIANTS, default='flow', help="ghost AI variant")
+    parser.add_argument('--level', help="level file (default: levels/classic.txt)")
+    parser.add_argument('--max-ticks', type=int, default=20000, help="stop a game after this many ticks")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunksize', type=int, default=8, help="games per worker task")
+    parser.add_argument('--out', required=True, help="results file (.csv or .jsonl)")
+    parser.add_argument('--format', choices=('csv', 'jsonl'),
+                        help="output format (default: from the file extension)")
+    args = parser.parse_args()
+
+    if args.level:
+        load_board(args.level)  # Report a bad level file here rather than from every worker
+    fmt = args.format or ('csv' if args.out.endswith('.csv') else 'jsonl')
+    seeds = range(args.seed, args.seed + args.games)
+    results = []
+    start = time.perf_counter()
+    with open(args.out, 'w', newline='') as stream:
+        writer = ResultWriter(stream, fmt)
+        for result in run_games(seeds, args.bot, args.ghosts, args.max_ticks,
+                                args.workers, args.chunksize, args.level):
+            writer.write(result)
+            results.append(result)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(results)} games ({args.bot} bot, {args.ghosts} ghosts) in {elapsed:.1f}s "
+          f"({len(results) / elapsed:,.1f} games/s), results in {args.out}")
+    for name, value in summarize(results).items():
+        print(f"  {name:<20} {value:,.2f}" if isinstance(value, float) else f"  {name:<20} {value}")
+
+
+if __name__ == "__main__":
+    main()
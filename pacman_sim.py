@@ -0,0 +1,353 @@
+"""
+Headless Pacman simulation engine.
+
+PacmanSimulation holds the complete game state and advances it one tick at
+a time with step(). Each tick stands for tick_ms of game time, and every
+duration (Pacman and ghost pacing, mouth animation, power mode) is given in
+milliseconds, so behaviour does not depend on the tick rate. It does not
+import Tk, so it can run without a display and as fast as the CPU allows;
+PacmanGame2 only feeds it input and renders the result. All randomness
+comes from a per-simulation random.Random, so a run is fully reproducible
+from its seed and input sequence.
+
+The layout (walls, dots, power dots, tunnels and spawns) comes from a
+pacman_level.Board, by default the classic board in levels/classic.txt.
+Boards are parsed and precomputed once, so reset() only copies the dot
+sets.
+
+Example:
+    sim = PacmanSimulation(seed=42)
+    sim.steer((1, 0))
+    while not sim.game_over:
+        sim.step()
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+from ghost_ai import FlowFields
+from pacman_level import Board, classic_board
+
+Position = Tuple[int, int]
+
+TICK_MS = 33  # Default game time per step (~30 updates per second)
+GHOST_COLORS = ['red', 'pink', 'cyan', 'orange']
+
+# Ghost personalities by colour: (chance of a random move, distance at
+# which the ghost turns shy and backs off instead of chasing)
+GHOST_PERSONALITIES = {
+    'red': (0.0, 0),     # Relentless pursuer
+    'pink': (0.1, 0),    # Mostly direct
+    'cyan': (0.25, 0),   # Erratic
+    'orange': (0.1, 8),  # Keeps its distance when close
+}
+DEFAULT_PERSONALITY = (0.2, 0)
+
+# Durations in milliseconds
+PACMAN_MOVE_MS = 150
+GHOST_MOVE_MS = 66
+MOUTH_MS = 500
+POWER_MS = 5000
+
+# Scoring
+DOT_POINTS = 10
+POWER_DOT_POINTS = 50
+GHOST_POINTS = 200
+
+# Event kinds reported by step()
+DOT_EATEN = 'dot'
+POWER_DOT_EATEN = 'power_dot'
+GHOST_EATEN = 'ghost'
+LIFE_LOST = 'life_lost'
+GAME_OVER = 'game_over'
+VICTORY = 'victory'
+
+
+class Pacman:
+    """Pacman position, heading, animation frame, score and lives"""
+
+    __slots__ = ('x', 'y', 'direction', 'mouth_open', 'score', 'lives')
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+        self.direction = (0, 0)
+        self.mouth_open = True
+        self.score = 0
+        self.lives = 3
+
+
+class Ghost:
+    """Ghost position, heading as a (dx, dy) tuple, colour and personality"""
+
+    __slots__ = ('x', 'y', 'color', 'direction', 'wander', 'shy_distance')
+
+    def __init__(self, x: int, y: int, color: str):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.direction = (0, 1)
+        self.wander, self.shy_distance = GHOST_PERSONALITIES.get(color, DEFAULT_PERSONALITY)
+
+
+class PacmanSimulation:
+    """
+    Deterministic Pacman state/step engine.
+
+    Features:
+        - Millisecond-based movement timing
+        - Seeded ghost randomness
+        - Scoring and life system
+        - Power mode duration
+        - Per-tick event list for renderers
+        - Board loaded from a level file
+        - Ghost position hash for O(1) collision checks with large swarms
+    """
+
+    def __init__(self, seed: Optional[int] = None, tick_ms: float = TICK_MS,
+                 board: Optional[Board] = None):
+        self.board = board = board or classic_board()
+        self.grid_width = board.width
+        self.grid_height = board.height
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.tick_ms = tick_ms
+        self.move_delay = PACMAN_MOVE_MS
+        self.ghost_move_delay = GHOST_MOVE_MS
+        self.mouth_delay = MOUTH_MS
+        self.power_duration = POWER_MS
+        self.maze = board.grid
+        # Legal moves per cell with tunnel wrap resolved, precomputed per board
+        self.moves = board.moves
+        self.targets = board.targets
+        self.fields = FlowFields(self.targets)
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None):
+        """Start a new game, optionally reseeding the random generator"""
+        if seed is not None:
+            self.seed = seed
+            self.random.seed(seed)
+        self.pacman = Pacman(*self.board.pacman_start)
+        self.ghosts = [Ghost(x, y, color) for (x, y), color in self.board.ghost_starts]
+        self.dots = set(self.board.dots)
+        self.power_dots = set(self.board.power_dots)
+        self.game_over = False
+        self.won = False
+        self.power_mode = False
+        self.power_time = 0  # Milliseconds of power mode left
+        self.tick = 0
+        self.mouth_timer = 0
+        self.move_timer = 0
+        self.ghost_move_timer = 0
+        self.events: List[tuple] = []
+
+    @property
+    def ghosts(self) -> List[Ghost]:
+        return self._ghosts
+
+    @ghosts.setter
+    def ghosts(self, ghosts: List[Ghost]):
+        self._ghosts = ghosts
+        self._ghost_cells = None
+
+    def ghosts_at(self, x: int, y: int) -> List[Ghost]:
+        """Ghosts on a cell, in list order, via the position hash"""
+        if self._ghost_cells is None:
+            cells: Dict[Position, List[Ghost]] = {}
+            for ghost in self._ghosts:
+                pos = (ghost.x, ghost.y)
+                if pos in cells:
+                    cells[pos].append(ghost)
+                else:
+                    cells[pos] = [ghost]
+            self._ghost_cells = cells
+        return self._ghost_cells.get((x, y), [])
+
+    def steer(self, direction: Tuple[int, int]):
+        """Set Pacman's heading, e.g. (1, 0) for right"""
+        self.pacman.direction = tuple(direction)
+
+    def step(self) -> List[tuple]:
+        """
+        Advance the game by one tick.
+
+        Returns:
+            List[tuple]: Events that happened during the tick, each starting
+            with one of the event kind constants
+        """
+        self.events = []
+        if self.game_over:
+            return self.events
+
+        self.tick += 1
+        dt = self.tick_ms
+
+        # Update mouth animation
+        self.mouth_timer += dt
+        if self.mouth_timer >= self.mouth_delay:
+            self.pacman.mouth_open = not self.pacman.mouth_open
+            self.mouth_timer -= self.mouth_delay
+
+        # Move Pacman with delay
+        self.move_timer += dt
+        if self.move_timer >= self.move_delay:
+            self.move_pacman()
+            self.move_timer -= self.move_delay
+
+        # Move ghosts on their own timer
+        self.ghost_move_timer += dt
+        if self.ghost_move_timer >= self.ghost_move_delay:
+            self.move_ghosts()
+            self.ghost_move_timer -= self.ghost_move_delay
+
+        self.check_ghost_collision()
+
+        # Update power mode
+        if self.power_mode:
+            self.power_time -= dt
+            if self.power_time <= 0:
+                self.power_mode = False
+
+        # Check win condition
+        if not self.dots and not self.power_dots:
+            self.game_over = True
+            self.won = True
+            self.events.append((VICTORY,))
+
+        return self.events
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Game time simulated so far"""
+        return self.tick * self.tick_ms
+
+    def run(self, ticks: int) -> int:
+        """Step up to the given number of ticks; returns the ticks actually run"""
+        for i in range(ticks):
+            if self.game_over:
+                return i
+            self.step()
+        return ticks
+
+    def move_pacman(self):
+        """Move pacman and check collisions with tunnel support"""
+        pacman = self.pacman
+        target = self.moves[pacman.y * self.grid_width + pacman.x].get(pacman.direction)
+        if target is not None:
+            pacman.x, pacman.y = target
+
+        # Check collisions
+        self._check_dot_collision()
+        self._check_power_dot_collision()
+
+    def _check_dot_collision(self):
+        """Check and handle dot collisions"""
+        pos = (self.pacman.x, self.pacman.y)
+        if pos in self.dots:
+            self.dots.discard(pos)
+            self.pacman.score += DOT_POINTS
+            self.events.append((DOT_EATEN, pos))
+
+    def _check_power_dot_collision(self):
+        """Check and handle power dot collisions"""
+        pos = (self.pacman.x, self.pacman.y)
+        if pos in self.power_dots:
+            self.power_dots.discard(pos)
+            self.power_mode = True
+            self.power_time = self.power_duration
+            self.pacman.score += POWER_DOT_POINTS
+            self.events.append((POWER_DOT_EATEN, pos))
+
+    def move_ghosts(self):
+        """
+        Target-based ghost movement driven by shared flow fields.
+
+        All ghosts move in one pass that also rebuilds the position hash.
+
+        Features:
+            - One chase field per Pacman cell shared by all ghosts
+            - Flee field in power mode
+            - Per-cell move choices cached until Pacman moves
+            - Individual personality traits (wander chance, shyness)
+            - Tunnel handling via the neighbour table
+        """
+        random_value = self.random.random
+        choose_randomly = self.random.choice
+        targets = self.targets
+        width = self.grid_width
+        fields = self.fields
+        pacman_index = self.pacman.y * width + self.pacman.x
+        chase = fields.chase(pacman_index)
+        toward = fields.toward(pacman_index)
+        away = fields.away(pacman_index)
+        escape = fields.escape(pacman_index) if self.power_mode else None
+        # Share of ghost ticks that act: 70% when vulnerable, 15% when chasing
+        threshold = 0.7 if self.power_mode else 0.15
+
+        cells: Dict[Position, List[Ghost]] = {}
+        for ghost in self._ghosts:
+            if random_value() <= threshold:
+                here = ghost.y * width + ghost.x
+                options = targets[here]
+                if not options:
+                    ghost.direction = (0, 0)
+                else:
+                    if random_value() < ghost.wander:
+                        choice = choose_randomly(options)
+                    elif escape is not None:
+                        choice = escape[here]
+                    elif chase[here] < ghost.shy_distance:
+                        choice = away[here]
+                    else:
+                        choice = toward[here]
+                    ghost.direction, (ghost.x, ghost.y), _ = choice
+
+            pos = (ghost.x, ghost.y)
+            if pos in cells:
+                cells[pos].append(ghost)
+            else:
+                cells[pos] = [ghost]
+        self._ghost_cells = cells
+
+    def check_ghost_collision(self):
+        """
+        Collision detection between Pacman and ghosts.
+
+        Features:
+            - Position hash lookup instead of comparing every ghost
+            - Power mode handling
+            - Score updates
+            - Life management
+            - Position reset
+            - Game over detection
+        """
+        hits = self.ghosts_at(self.pacman.x, self.pacman.y)
+        if not hits:
+            return
+        if self.power_mode:
+            # Remove the ghosts and add points
+            for ghost in hits:
+                self.pacman.score += GHOST_POINTS
+                self.events.append((GHOST_EATEN, ghost))
+            eaten = set(map(id, hits))
+            self.ghosts = [ghost for ghost in self._ghosts if id(ghost) not in eaten]
+            return
+
+        # One life per tick, however many ghosts caught Pacman
+        self.pacman.lives -= 1
+        if self.pacman.lives <= 0:
+            self.game_over = True
+            self.events.append((GAME_OVER,))
+        else:
+            self.reset_positions()
+            self.events.append((LIFE_LOST,))
+
+    def reset_positions(self):
+        """Reset positions of pacman and ghosts"""
+        self.pacman.x, self.pacman.y = self.board.pacman_start
+        self.pacman.direction = (0, 0)
+        self.move_timer = 0  # Reset movement timer
+        for ghost, (pos, _) in zip(self._ghosts, self.board.ghost_starts):
+            ghost.x, ghost.y = pos
+            ghost.direction = (0, 1)
+        self._ghost_cells = None
@@ -0,0 +1,327 @@
+"""
+Vectorized multi-environment Pacman for automated players.
+
+PacmanVecEnv runs N independent Pacman boards in lockstep with a gym-style
+reset() / step(actions) API. All state lives in NumPy arrays with one row
+per environment (Pacman and ghost cells, dot bitmaps, timers, power mode,
+score and lives), so a single step() call advances every board with a
+fixed number of array operations instead of a Python loop per board.
+
+Rules, timings and scoring are PacmanSimulation's: the same boards, tick
+length, movement delays, power mode duration, 10/50/200 points and three
+lives, and ghosts follow the same chase/flee fields and personalities.
+Randomness comes from one seeded NumPy generator, so runs are
+reproducible, but they do not replay the exact trajectories of a scalar
+PacmanSimulation with the same seed. Mouth animation is left out.
+
+Observations are views of the live state arrays, not copies: they are
+overwritten by the next step(), so copy anything you want to keep.
+
+Requires NumPy.
+
+Example:
+    env = PacmanVecEnv(1024, seed=42)
+    obs = env.reset()
+    while True:
+        obs, rewards, dones, info = env.step(policy(obs))
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("pacman_vec requires NumPy (pip install numpy)") from e
+
+from ghost_ai import FlowFields
+from maze_grid import DIRECTIONS
+from pacman_level import Board
+from pacman_sim import (DEFAULT_PERSONALITY, DOT_POINTS, GHOST_POINTS, GHOST_PERSONALITIES,
+                        POWER_DOT_POINTS, PacmanSimulation, TICK_MS)
+
+# Actions 0-3 steer towards DIRECTIONS[action] as (dx, dy); NOOP keeps the heading
+ACTIONS = DIRECTIONS
+NOOP = len(DIRECTIONS)
+# Heading of a Pacman that has not been steered yet
+STOPPED = len(DIRECTIONS)
+
+
+class _FieldRows:
+    """
+    Field rows for the Pacman cells visited so far, packed into one table.
+
+    A full cells x cells table grows with the square of the board (about
+    19 GB of flee fields on a 200x200 level), but Pacman only ever stands
+    on open cells, and usually on a fraction of them. Rows are computed
+    the first time a cell is used as a source and appended to a table that
+    doubles as needed; row_of maps a cell to its row.
+    """
+
+    def __init__(self, size: int, dtype, compute: Callable[[int], Sequence]):
+        self.compute = compute
+        self.row_of = np.full(size, -1, dtype=np.int32)
+        self.table = np.zeros((16, size), dtype=dtype)
+        self.count = 0
+
+    def rows(self, sources: np.ndarray) -> np.ndarray:
+        """Table rows for the source cells, computing any that are missing"""
+        rows = self.row_of[sources]
+        missing = np.unique(sources[rows < 0])
+        if missing.size:
+            needed = self.count + missing.size
+            if needed > len(self.table):
+                grown = np.zeros((max(needed, 2 * len(self.table)), self.table.shape[1]),
+                                 dtype=self.table.dtype)
+                grown[:self.count] = self.table[:self.count]
+                self.table = grown
+            for source in missing.tolist():
+                self.table[self.count] = self.compute(source)
+                self.row_of[source] = self.count
+                self.count += 1
+            rows = self.row_of[sources]
+        return rows
+
+
+class PacmanVecEnv:
+    """
+    N Pacman boards stepped together.
+
+    Features:
+        - reset() / step(actions) over every environment at once
+        - Struct-of-arrays state, one row per environment
+        - Chase and flee fields shared by all environments and ghosts
+        - Finished environments restart automatically (autoreset)
+        - Zero-copy observation views
+
+    Attributes:
+        num_envs (int): Number of environments
+        width, height (int): Board size; cells are flat indices y * width + x
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, tick_ms: float = TICK_MS,
+                 autoreset: bool = True, board: Optional[Board] = None):
+        self.num_envs = num_envs
+        self.autoreset = autoreset
+        self.rng = np.random.default_rng(seed)
+
+        # Board, timings and start state come from the scalar engine
+        template = PacmanSimulation(seed=0, tick_ms=tick_ms, board=board)
+        board = template.board
+        self.width = width = template.grid_width
+        self.height = height = template.grid_height
+        self.size = size = width * height
+        self.tick_ms = tick_ms
+        self.move_delay = template.move_delay
+        self.ghost_move_delay = template.ghost_move_delay
+        self.power_duration = template.power_duration
+
+        # move_to[cell, heading]: cell reached, or -1; the STOPPED column is all -1
+        self.move_to = np.full((size, len(DIRECTIONS) + 1), -1, dtype=np.int32)
+        for cell, moves in enumerate(template.moves):
+            for heading, direction in enumerate(DIRECTIONS):
+                target = moves.get(direction)
+                if target is not None:
+                    self.move_to[cell, heading] = target[1] * width + target[0]
+
+        self.start_dots = np.zeros(size, dtype=bool)
+        self.start_dots[[y * width + x for x, y in template.dots]] = True
+        self.start_power_dots = np.zeros(size, dtype=bool)
+        self.start_power_dots[[y * width + x for x, y in template.power_dots]] = True
+        self.start_dot_count = len(template.dots) + len(template.power_dots)
+        x, y = board.pacman_start
+        self.pacman_start = y * width + x
+        self.ghost_starts = np.array([y * width + x for (x, y), _ in board.ghost_starts],
+                                     dtype=np.int32)
+        ghost_count = len(board.ghost_starts)
+        personalities = [GHOST_PERSONALITIES.get(color, DEFAULT_PERSONALITY)
+                         for _, color in board.ghost_starts]
+        self.ghost_wander = np.array([wander for wander, _ in personalities])
+        self.ghost_shy = np.array([shy for _, shy in personalities])
+
+        # Field rows per Pacman cell, filled in the first time Pacman stands there
+        self.fields = FlowFields(template.targets)
+        self.chase_fields = _FieldRows(size, np.int32, self.fields.chase)
+        self.flee_fields = _FieldRows(size, np.float64, self.fields.flee)
+
+        n = num_envs
+        self.pacman = np.zeros(n, dtype=np.int32)
+        self.heading = np.zeros(n, dtype=np.int8)
+        self.ghosts = np.zeros((n, ghost_count), dtype=np.int32)
+        self.ghost_alive = np.zeros((n, ghost_count), dtype=bool)
+        self.dots = np.zeros((n, size), dtype=bool)
+        self.power_dots = np.zeros((n, size), dtype=bool)
+        self.dots_left = np.zeros(n, dtype=np.int32)
+        self.power_mode = np.zeros(n, dtype=bool)
+        self.power_time = np.zeros(n, dtype=np.float64)
+        self.move_timer = np.zeros(n, dtype=np.float64)
+        self.ghost_move_timer = np.zeros(n, dtype=np.float64)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.lives = np.zeros(n, dtype=np.int8)
+        self.ticks = np.zeros(n, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+
+        self.observation: Dict[str, np.ndarray] = {
+            'pacman': self.pacman,
+            'heading': self.heading,
+            'ghosts': self.ghosts,
+            'ghost_alive': self.ghost_alive,
+            'dots': self.dots.reshape(n, height, width),
+            'power_dots': self.power_dots.reshape(n, height, width),
+            'power_time': self.power_time,
+            'score': self.score,
+            'lives': self.lives,
+        }
+
+    def reset(self, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Start a new game on every board, optionally reseeding"""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self.observation
+
+    def step(self, actions) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, dict]:
+        """
+        Advance every environment by one tick.
+
+        Args:
+            actions: Array-like of num_envs ints, 0-3 to steer towards
+                ACTIONS[action] or NOOP to keep the current heading
+
+        Returns:
+            (observation, rewards, dones, info): rewards are the points
+            scored this tick, dones flags games that ended this tick. With
+            autoreset those boards already hold a new game and info['score']
+            and info['won'] give the final result of the finished one.
+
+        Raises:
+            ValueError: If actions is not num_envs integers in 0..NOOP;
+                no environment is touched in that case
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.num_envs,) or not np.issubdtype(actions.dtype, np.integer):
+            raise ValueError(f"Expected {self.num_envs} integer actions, "
+                             f"got shape {actions.shape} of {actions.dtype}")
+        if actions.size and (actions.min() < 0 or actions.max() > NOOP):
+            raise ValueError(f"Actions must be between 0 and {NOOP}")
+        dt = self.tick_ms
+        active = ~self.done
+        score_before = self.score.copy()
+
+        steer = active & (actions != NOOP)
+        self.heading[steer] = actions[steer]
+        self.ticks[active] += 1
+
+        # Pacman, with dot collisions
+        self.move_timer[active] += dt
+        moving = np.flatnonzero(active & (self.move_timer >= self.move_delay))
+        if moving.size:
+            self.move_timer[moving] -= self.move_delay
+            target = self.move_to[self.pacman[moving], self.heading[moving]]
+            self.pacman[moving] = np.where(target >= 0, target, self.pacman[moving])
+            self._eat_dots(moving)
+
+        # Ghosts on their own timer
+        self.ghost_move_timer[active] += dt
+        ghost_turn = np.flatnonzero(active & (self.ghost_move_timer >= self.ghost_move_delay))
+        if ghost_turn.size:
+            self.ghost_move_timer[ghost_turn] -= self.ghost_move_delay
+            self._move_ghosts(ghost_turn)
+
+        self._check_ghost_collisions(active)
+
+        powered = active & self.power_mode
+        self.power_time[powered] -= dt
+        self.power_mode[powered & (self.power_time <= 0)] = False
+
+        cleared = active & (self.dots_left == 0)
+        self.won |= cleared
+        self.done |= cleared
+
+        finished = active & self.done
+        rewards = self.score - score_before
+        info = {'score': self.score.copy(), 'won': self.won.copy()}
+        if self.autoreset and finished.any():
+            self._reset_envs(finished)
+        return self.observation, rewards, finished, info
+
+    def _reset_envs(self, mask: np.ndarray):
+        self.pacman[mask] = self.pacman_start
+        self.heading[mask] = STOPPED
+        self.ghosts[mask] = self.ghost_starts
+        self.ghost_alive[mask] = True
+        self.dots[mask] = self.start_dots
+        self.power_dots[mask] = self.start_power_dots
+        self.dots_left[mask] = self.start_dot_count
+        self.power_mode[mask] = False
+        self.power_time[mask] = 0
+        self.move_timer[mask] = 0
+        self.ghost_move_timer[mask] = 0
+        self.score[mask] = 0
+        self.lives[mask] = 3
+        self.ticks[mask] = 0
+        self.done[mask] = False
+        self.won[mask] = False
+
+    def _eat_dots(self, envs: np.ndarray):
+        cells = self.pacman[envs]
+        dot = self.dots[envs, cells]
+        power = self.power_dots[envs, cells]
+        self.dots[envs, cells] = False
+        self.power_dots[envs, cells] = False
+        self.dots_left[envs] -= dot.astype(np.int32) + power
+        self.score[envs] += np.where(dot, DOT_POINTS, 0) + np.where(power, POWER_DOT_POINTS, 0)
+        powered = envs[power]
+        self.power_mode[powered] = True
+        self.power_time[powered] = self.power_duration
+
+    def _move_ghosts(self, envs: np.ndarray):
+        """Move the ghosts of envs with the rules of PacmanSimulation.move_ghosts"""
+        pacman = self.pacman[envs]
+        power = self.power_mode[envs]
+        here = self.ghosts[envs]
+        options = self.move_to[here, :len(DIRECTIONS)]  # (envs, ghosts, 4)
+        legal = options >= 0
+        cells = np.where(legal, options, 0)
+        draws = self.rng.random((3,) + here.shape)
+
+        # Share of ghost ticks that act: 70% when vulnerable, 15% when chasing
+        threshold = np.where(power, 0.7, 0.15)[:, None]
+        acting = self.ghost_alive[envs] & legal.any(axis=2) & (draws[0] <= threshold)
+
+        rows = self.chase_fields.rows(pacman)
+        table = self.chase_fields.table
+        chase = table[rows[:, None, None], cells].astype(np.float64)
+        shy = table[rows[:, None], here] < self.ghost_shy
+        key = np.where(shy[:, :, None], -chase, chase)
+        if power.any():
+            rows = self.flee_fields.rows(pacman[power])
+            key[power] = self.flee_fields.table[rows[:, None, None], cells[power]]
+        key[~legal] = np.inf
+        choice = key.argmin(axis=2)
+
+        # Wandering ghosts pick any legal move
+        wander = draws[1] < self.ghost_wander
+        pick = (draws[2] * legal.sum(axis=2)).astype(np.int64)
+        random_choice = (legal.cumsum(axis=2) > pick[:, :, None]).argmax(axis=2)
+        choice = np.where(wander, random_choice, choice)
+
+        moved = np.take_along_axis(options, choice[:, :, None], axis=2)[:, :, 0]
+        self.ghosts[envs] = np.where(acting, moved, here)
+
+    def _check_ghost_collisions(self, active: np.ndarray):
+        hit = self.ghost_alive & (self.ghosts == self.pacman[:, None]) & active[:, None]
+        if not hit.any():
+            return
+        eaten = hit & self.power_mode[:, None]
+        self.ghost_alive &= ~eaten
+        self.score += eaten.sum(axis=1, dtype=np.int32) * GHOST_POINTS
+
+        caught = hit.any(axis=1) & ~self.power_mode
+        self.lives[caught] -= 1
+        self.done |= caught & (self.lives <= 0)
+        respawn = caught & (self.lives > 0)
+        self.pacman[respawn] = self.pacman_start
+        self.heading[respawn] = STOPPED
+        self.move_timer[respawn] = 0
+        self.ghosts[respawn] = self.ghost_starts
@@ -0,0 +1,305 @@
+"""
+Opt-in frame profiler and on-canvas stats overlay.
+
+FrameProfiler times named phases of each frame by temporarily replacing
+methods on the instrumented objects with timing wrappers. Nothing is
+patched until enable() is called, so an idle profiler costs nothing on the
+hot path. It also counts canvas items created and deleted per frame,
+keeps rolling FPS and frame-time percentiles, and can dump a JSON trace
+in Chrome trace event format (load it in chrome://tracing or Perfetto).
+
+Enable at startup with the GAMES_PROFILE environment variable, or toggle
+at runtime with F3 in either game; F4 dumps the trace.
+
+Phases may nest (e.g. collisions inside move_pacman); each phase reports
+its inclusive time. Time spent in Tk between frames is reported as idle.
+"""
+
+import json
+import os
+import time
+from collections import defaultdict, deque
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+PROFILE_ENV = 'GAMES_PROFILE'
+_MISSING = object()
+CANVAS_CREATE_METHODS = (
+    'create_arc', 'create_bitmap', 'create_image', 'create_line', 'create_oval',
+    'create_polygon', 'create_rectangle', 'create_text', 'create_window',
+)
+
+
+def profiling_requested() -> bool:
+    """True when the GAMES_PROFILE environment variable is set to a truthy value"""
+    return os.environ.get(PROFILE_ENV, '').lower() not in ('', '0', 'false', 'no')
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler:
+    """
+    Per-frame phase timer with rolling statistics and a JSON trace.
+
+    Attributes:
+        enabled (bool): Whether instrumentation is currently installed
+        frame_times (deque): Recent frame durations in milliseconds
+        phase_history (dict): Recent per-frame milliseconds for each phase
+    """
+
+    def __init__(self, window: int = 300, trace_limit: int = 100000):
+        self.enabled = False
+        self.window = window
+        self.frame_times = deque(maxlen=window)
+        self.frame_starts = deque(maxlen=window)
+        self.phase_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self.created_history = deque(maxlen=window)
+        self.deleted_history = deque(maxlen=window)
+        self.trace = deque(maxlen=trace_limit)
+        self.origin = time.perf_counter()
+        self.frame_count = 0
+        self._frame_start = None
+        self._last_frame_end = None
+        self._phases: Dict[str, float] = defaultdict(float)
+        self._created = 0
+        self._deleted = 0
+        self._patches = []
+        self._installers: List[Callable[[], None]] = []
+
+    # Instrumentation
+
+    def instrument(self, obj, attr: str, phase: Optional[str] = None):
+        """Time every call of obj.attr as the given phase (default: attr)"""
+        name = phase or attr
+        original = getattr(obj, attr)
+
+        @wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter())
+
+        self._patch(obj, attr, timed)
+
+    def instrument_frame(self, obj, attr: str):
+        """Treat every call of obj.attr as one frame"""
+        original = getattr(obj, attr)
+
+        @wraps(original)
+        def framed(*args, **kwargs):
+            self.begin_frame()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.end_frame()
+
+        self._patch(obj, attr, framed)
+
+    def instrument_canvas(self, canvas):
+        """Count canvas items created and deleted"""
+        for attr in CANVAS_CREATE_METHODS:
+            original = getattr(canvas, attr)
+
+            def counted(*args, _original=original, **kwargs):
+                self._created += 1
+                return _original(*args, **kwargs)
+
+            self._patch(canvas, attr, counted)
+
+        original_delete = canvas.delete
+
+        def delete(*args):
+            for tag_or_id in args:
+                self._deleted += len(canvas.find_withtag(tag_or_id))
+            return original_delete(*args)
+
+        self._patch(canvas, 'delete', delete)
+
+    def on_enable(self, installer: Callable[[], None]):
+        """Register a callback that installs instrumentation when enabled"""
+        self._installers.append(installer)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for installer in self._installers:
+            installer()
+
+    def disable(self):
+        """Remove all instrumentation; collected stats are kept"""
+        for obj, attr, previous in reversed(self._patches):
+            if previous is _MISSING:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, previous)
+        self._patches = []
+        self.enabled = False
+        self._frame_start = None
+        self._last_frame_end = None
+
+    def toggle(self) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def _patch(self, obj, attr: str, replacement):
+        # Remember instance attributes (e.g. stored callbacks) so disable()
+        # restores them; methods only need the instance override removed
+        previous = vars(obj).get(attr, _MISSING)
+        setattr(obj, attr, replacement)
+        self._patches.append((obj, attr, previous))
+
+    # Recording
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self._last_frame_end is not None:
+            self.record('idle', self._last_frame_end, now)
+        self._frame_start = now
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        now = time.perf_counter()
+        start = self._frame_start
+        self.frame_times.append((now - start) * 1000)
+        self.frame_starts.append(start)
+        for name in set(self.phase_history) | set(self._phases):
+            self.phase_history[name].append(self._phases.get(name, 0.0))
+        self.created_history.append(self._created)
+        self.deleted_history.append(self._deleted)
+        self.trace.append(self._event('frame', start, now))
+        self._phases.clear()
+        self._created = self._deleted = 0
+        self._frame_start = None
+        self._last_frame_end = now
+        self.frame_count += 1
+
+    def record(self, name: str, start: float, end: float):
+        """Add a timed span to the current frame and the trace"""
+        self._phases[name] += (end - start) * 1000
+        self.trace.append(self._event(name, start, end))
+
+    def _event(self, name: str, start: float, end: float) -> dict:
+        return {
+            'name': name, 'ph': 'X', 'pid': 0, 'tid': 0,
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+        }
+
+    # Reporting
+
+    def stats(self) -> dict:
+        """Rolling FPS, frame-time percentiles, mean phase times and item churn"""
+        ordered = sorted(self.frame_times)
+        fps = 0.0
+        if len(self.frame_starts) > 1:
+            span = self.frame_starts[-1] - self.frame_starts[0]
+            if span > 0:
+                fps = (len(self.frame_starts) - 1) / span
+        frames = len(self.created_history) or 1
+        return {
+            'frames': self.frame_count,
+            'fps': fps,
+            'frame_ms': {
+                'p50': _percentile(ordered, 0.50),
+                'p95': _percentile(ordered, 0.95),
+                'p99': _percentile(ordered, 0.99),
+                'max': ordered[-1] if ordered else 0.0,
+            },
+            'phase_ms': {
+                name: sum(history) / len(history)
+                for name, history in sorted(self.phase_history.items()) if history
+            },
+            'items_created_per_frame': sum(self.created_history) / frames,
+            'items_deleted_per_frame': sum(self.deleted_history) / frames,
+        }
+
+    def summary_text(self) -> str:
+        stats = self.stats()
+        frame = stats['frame_ms']
+        lines = [
+            f"FPS {stats['fps']:5.1f}  frame p50 {frame['p50']:.2f}"
+            f" p95 {frame['p95']:.2f} p99 {frame['p99']:.2f} ms",
+        ]
+        for name, ms in stats['phase_ms'].items():
+            lines.append(f"{name:>14} {ms:7.3f} ms")
+        lines.append(f"items +{stats['items_created_per_frame']:.1f}"
+                     f" -{stats['items_deleted_per_frame']:.1f} /frame")
+        return '\n'.join(lines)
+
+    def dump(self, path: str) -> str:
+        """Write the trace and current stats as JSON; returns the path"""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': list(self.trace), 'stats': self.stats()}, f)
+        return path
+
+
+class ProfilerOverlay:
+    """Periodically refreshed stats text in the top-right corner of a canvas"""
+
+    TAG = 'profiler_overlay'
+
+    def __init__(self, canvas, profiler: FrameProfiler, interval_ms: int = 250):
+        self.canvas = canvas
+        self.profiler = profiler
+        self.interval_ms = interval_ms
+        self.after_id = None
+
+    def show(self):
+        if self.after_id is None:
+            self._refresh()
+
+    def hide(self):
+        if self.after_id is not None:
+            self.canvas.after_cancel(self.after_id)
+            self.after_id = None
+        self.canvas.delete(self.TAG)
+
+    def _refresh(self):
+        text = self.profiler.summary_text()
+        x = self.canvas.canvasx(self.canvas.winfo_width()) - 5
+        y = self.canvas.canvasy(0) + 5
+        if not self.canvas.find_withtag(self.TAG):
+            # Recreate after a full scene rebuild deleted it
+            self.canvas.create_text(x, y, anchor='ne', fill='orange',
+                                    font=('Courier', 9), tags=self.TAG)
+        self.canvas.coords(self.TAG, x, y)
+        self.canvas.itemconfigure(self.TAG, text=text)
+        self.canvas.tag_raise(self.TAG)
+        self.after_id = self.canvas.after(self.interval_ms, self._refresh)
+
+
+# Game hooks, shared by both games' F3/F4 keys. A game provides canvas,
+# install_profiling() and profiler / profiler_overlay attributes that start
+# as None; this module is only imported once one of the keys is pressed.
+
+def get_profiler(game) -> FrameProfiler:
+    """The game's frame profiler, created along with its overlay on first use"""
+    if game.profiler is None:
+        game.profiler = FrameProfiler()
+        game.profiler.on_enable(game.install_profiling)
+        game.profiler_overlay = ProfilerOverlay(game.canvas, game.profiler)
+    return game.profiler
+
+
+def toggle_profiler(game):
+    """Turn the game's instrumentation and stats overlay on or off"""
+    if get_profiler(game).toggle():
+        game.profiler_overlay.show()
+    else:
+        game.profiler_overlay.hide()
+
+
+def dump_trace(game, prefix: str) -> str:
+    """Write the game's trace to <prefix>-trace-<time>.json and return the path"""
+    return get_profiler(game).dump(f"{prefix}-trace-{int(time.time())}.json")
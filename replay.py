@@ -0,0 +1,289 @@
+"""
+Session recording and replay for both games.
+
+A recording is a compact binary input log: a header identifying the game
+and everything needed to rebuild its starting state (the seed, plus the
+maze size and complexity for the maze game), followed by fixed-size event
+records. Pacman events are stamped with the simulation tick they apply
+before, maze events with milliseconds since the maze appeared. Since both
+games are deterministic for a given seed, the input log is enough to
+reproduce a whole session.
+
+File layout:
+    magic b'GRPL\\x01', game byte (b'P' or b'M'), game header,
+    then EVENT records until EOF; the last record is END.
+
+Command line:
+    python replay.py session.replay --headless
+    python replay.py session.replay --speed 4
+    python replay.py session.replay --level levels/custom.txt
+
+Pacman recordings do not store the board; sessions played on a custom
+level need the same --level to replay.
+"""
+
+import argparse
+import struct
+import time
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+FILE_MAGIC = b'GRPL\x01'
+PACMAN = b'P'
+MAZE = b'M'
+
+EVENT = struct.Struct('<IBbb')  # time (tick or ms), kind, two small arguments
+
+# Event kinds
+END = 0
+STEER = 1    # Pacman: dx, dy
+RESTART = 2  # Pacman: Enter after game over
+KEY = 3      # Maze: index into MAZE_KEYS
+RESET = 4    # Maze: Reset Position
+
+MAZE_KEYS = ('Up', 'Down', 'Left', 'Right')
+MAX_SPEED = 16
+
+Event = Tuple[int, int, int, int]
+
+
+class Recording:
+    """
+    Input log for one session, stored as packed EVENT records.
+
+    Subclasses define the game byte and the header struct.
+    """
+
+    game = None
+    header = None
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.data = bytearray()
+
+    def header_values(self) -> tuple:
+        return (self.seed,)
+
+    def log(self, time_stamp: int, kind: int, a: int = 0, b: int = 0):
+        self.data += EVENT.pack(time_stamp, kind, a, b)
+
+    def events(self) -> Iterator[Event]:
+        return EVENT.iter_unpack(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data) // EVENT.size
+
+    def write(self, stream: BinaryIO, end: Optional[int] = None):
+        """
+        Write the recording to a binary stream.
+
+        Args:
+            end: If given, close the written log with an END record at this
+                time; the in-memory log is left open so recording can go on
+        """
+        stream.write(FILE_MAGIC + self.game)
+        stream.write(self.header.pack(*self.header_values()))
+        stream.write(self.data)
+        if end is not None:
+            stream.write(EVENT.pack(end, END, 0, 0))
+
+    def save(self, path: str, end: Optional[int] = None) -> str:
+        """Write the recording to path; returns the path"""
+        with open(path, 'wb') as stream:
+            self.write(stream, end)
+        return path
+
+
+class PacmanRecording(Recording):
+    """Pacman session: seed, tick length and per-tick direction changes"""
+
+    game = PACMAN
+    header = struct.Struct('<qd')  # seed, tick_ms
+
+    def __init__(self, seed: int, tick_ms: float):
+        super().__init__(seed)
+        self.tick_ms = tick_ms
+
+    def header_values(self) -> tuple:
+        return self.seed, self.tick_ms
+
+    def steer(self, tick: int, direction: Tuple[int, int]):
+        """Log a heading change applied before the step after tick"""
+        # Only the last change before a step matters
+        if len(self.data) >= EVENT.size:
+            last_tick, kind, _, _ = EVENT.unpack_from(self.data, len(self.data) - EVENT.size)
+            if kind == STEER and last_tick == tick:
+                del self.data[-EVENT.size:]
+        self.log(tick, STEER, *direction)
+
+    def restart(self, tick: int):
+        self.log(tick, RESTART)
+
+
+class MazeRecording(Recording):
+    """Maze session: maze seed and parameters plus timed key presses"""
+
+    game = MAZE
+    header = struct.Struct('<qIId')  # seed, width, height, complexity
+
+    def __init__(self, seed: int, width: int, height: int, complexity: float):
+        super().__init__(seed)
+        self.width = width
+        self.height = height
+        self.complexity = complexity
+
+    def header_values(self) -> tuple:
+        return self.seed, self.width, self.height, self.complexity
+
+    def key(self, ms: int, keysym: str):
+        """Log an arrow key press"""
+        self.log(ms, KEY, MAZE_KEYS.index(keysym))
+
+    def reset(self, ms: int):
+        self.log(ms, RESET)
+
+
+def read_recording(stream: BinaryIO) -> Recording:
+    """Read a recording written by Recording.write"""
+    magic = stream.read(len(FILE_MAGIC) + 1)
+    if magic[:len(FILE_MAGIC)] != FILE_MAGIC:
+        raise ValueError("Not a replay file")
+
+    game = magic[len(FILE_MAGIC):]
+    if game == PACMAN:
+        cls = PacmanRecording
+    elif game == MAZE:
+        cls = MazeRecording
+    else:
+        raise ValueError(f"Unknown game {game!r} in replay file")
+
+    recording = cls(*cls.header.unpack(stream.read(cls.header.size)))
+    data = stream.read()
+    recording.data = bytearray(data[:len(data) - len(data) % EVENT.size])
+    return recording
+
+
+def load_recording(path: str) -> Recording:
+    with open(path, 'rb') as stream:
+        return read_recording(stream)
+
+
+class PacmanPlayer:
+    """Feeds recorded Pacman input into a simulation tick by tick"""
+
+    def __init__(self, recording: PacmanRecording):
+        self.events = recording.events()
+        self.pending: Optional[Event] = next(self.events, None)
+
+    def advance(self, sim) -> bool:
+        """
+        Apply every event due before the next step of sim.
+
+        Returns:
+            bool: False once the recording has ended
+        """
+        while self.pending is not None and (self.pending[0] <= sim.tick or sim.game_over):
+            tick, kind, a, b = self.pending
+            if kind == END:
+                self.pending = None
+                break
+            if kind == STEER:
+                sim.steer((a, b))
+            elif kind == RESTART:
+                sim.reset()
+            self.pending = next(self.events, None)
+        return self.pending is not None
+
+
+def play_pacman(recording: PacmanRecording, board=None):
+    """
+    Replay a Pacman session headless at full speed.
+
+    Args:
+        board: The pacman_level.Board the session was played on, if not
+            the classic one
+
+    Returns:
+        Tuple[PacmanSimulation, int]: Final simulation state and ticks run
+    """
+    from pacman_sim import PacmanSimulation
+
+    sim = PacmanSimulation(seed=recording.seed, tick_ms=recording.tick_ms, board=board)
+    player = PacmanPlayer(recording)
+    ticks = 0
+    while player.advance(sim) and not sim.game_over:
+        sim.step()
+        ticks += 1
+    return sim, ticks
+
+
+def play_maze(recording: MazeRecording):
+    """
+    Replay a maze session headless, applying every key press immediately.
+
+    Returns:
+        Tuple[GeneratedMaze, Position, Trail]: The maze, the final
+        position and the trail of the last attempt
+    """
+    from maze_batch import generate_compact
+    from maze_trail import Trail, key_target
+
+    maze = generate_compact(recording.width, recording.height, recording.complexity,
+                            recording.seed)
+    grid = maze.grid
+    pos = maze.entrance
+    trail = Trail(grid.width, grid.height)
+    trail.add(pos)
+    for _, kind, a, _ in recording.events():
+        if kind == KEY:
+            target = key_target(grid, pos, MAZE_KEYS[a])
+            if target is not None:
+                pos = target
+                trail.add(pos)
+        elif kind == RESET:
+            pos = maze.entrance
+            trail = Trail(grid.width, grid.height)
+            trail.add(pos)
+    return maze, pos, trail
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded game session")
+    parser.add_argument('path', help="replay file")
+    parser.add_argument('--headless', action='store_true',
+                        help="replay without a window as fast as possible")
+    parser.add_argument('--speed', type=int, default=1, choices=range(1, MAX_SPEED + 1),
+                        metavar=f"1-{MAX_SPEED}", help="canvas playback speed")
+    parser.add_argument('--level', help="Pacman level file the session was played on")
+    args = parser.parse_args()
+
+    recording = load_recording(args.path)
+    board = None
+    if args.level and recording.game == PACMAN:
+        from pacman_level import load_board
+        board = load_board(args.level)
+    if args.headless:
+        start = time.perf_counter()
+        if recording.game == PACMAN:
+            sim, ticks = play_pacman(recording, board)
+            elapsed = time.perf_counter() - start
+            print(f"{ticks} ticks in {elapsed:.3f}s ({ticks / elapsed:,.0f} ticks/s), "
+                  f"score {sim.pacman.score}, lives {sim.pacman.lives}")
+        else:
+            maze, pos, trail = play_maze(recording)
+            elapsed = time.perf_counter() - start
+            print(f"{len(recording)} events in {elapsed:.3f}s, "
+                  f"{'reached the exit' if pos == maze.exit else f'ended at {pos}'}, "
+                  f"{len(trail)} cells visited")
+        return
+
+    if recording.game == PACMAN:
+        from packman import PacmanGame2
+        game = PacmanGame2(replay=recording, speed=args.speed, board=board)
+    else:
+        from maze_runner import MazeGame
+        game = MazeGame(replay=recording, speed=args.speed)
+    game.mainloop()
+
+
+if __name__ == "__main__":
+    main()
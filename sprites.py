@@ -0,0 +1,162 @@
+"""
+Pre-rendered sprite images for the Pacman canvas.
+
+Every sprite variant (entity, colour, mouth state, direction) is
+rasterized once into a tk.PhotoImage, written in bulk as one put() per
+horizontal run of same-coloured pixels. Drawing an entity is then a
+single image item that is only moved or given a different image, rather
+than a set of vector primitives recomputed every frame.
+"""
+
+import math
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Tuple
+
+Direction = Tuple[int, int]
+# (y, x_start, x_end_exclusive, colour)
+Run = Tuple[int, int, int, str]
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, -1), (0, 1))
+PACMAN_COLOR = 'yellow'
+FRIGHTENED_COLOR = 'blue'
+DOT_COLOR = 'white'
+EYE_COLOR = 'white'
+PUPIL_COLOR = 'darkblue'
+
+
+def rasterize(size: int, color_at: Callable[[float, float], Optional[str]]) -> List[Run]:
+    """Sample color_at at each pixel centre and merge each row into runs"""
+    runs = []
+    for y in range(size):
+        start, current = 0, None
+        for x in range(size + 1):
+            color = color_at(x + 0.5, y + 0.5) if x < size else None
+            if color != current:
+                if current is not None:
+                    runs.append((y, start, x, current))
+                start, current = x, color
+    return runs
+
+
+def pacman_runs(size: int, direction: Direction, mouth_open: bool) -> List[Run]:
+    """Pacman disc with a 90 degree mouth facing direction when open"""
+    centre = size / 2
+    radius = size / 2 - 1
+    dx, dy = direction if direction != (0, 0) else (1, 0)
+    facing = math.atan2(dy, dx)
+
+    def color_at(px, py):
+        ox, oy = px - centre, py - centre
+        if ox * ox + oy * oy > radius * radius:
+            return None
+        if mouth_open and (ox or oy):
+            offset = abs((math.atan2(oy, ox) - facing + math.pi) % (2 * math.pi) - math.pi)
+            if offset < math.pi / 4:
+                return None
+        return PACMAN_COLOR
+
+    return rasterize(size, color_at)
+
+
+def ghost_runs(size: int, color: str, direction: Direction, frightened: bool) -> List[Run]:
+    """Ghost with a domed head, notched skirt and eyes looking along direction"""
+    centre = size / 2
+    radius = size / 2 - 1
+    bottom = size - 1
+    body = FRIGHTENED_COLOR if frightened else color
+    eye_radius = max(1.0, size / 8)
+    pupil_radius = eye_radius / 2
+    eye_y = centre - size / 10
+    eyes = (centre - size / 5, centre + size / 5)
+    look_x, look_y = (0, 0) if frightened else direction
+
+    def color_at(px, py):
+        for eye_x in eyes:
+            ex, ey = px - eye_x, py - eye_y
+            if ex * ex + ey * ey <= eye_radius * eye_radius:
+                qx = ex - look_x * pupil_radius
+                qy = ey - look_y * pupil_radius
+                if not frightened and qx * qx + qy * qy <= pupil_radius * pupil_radius:
+                    return PUPIL_COLOR
+                return EYE_COLOR
+        ox = px - centre
+        if abs(ox) > radius:
+            return None
+        if py < centre:
+            oy = py - centre
+            return body if ox * ox + oy * oy <= radius * radius else None
+        # Skirt: three notches along the bottom edge
+        notch = size / 6
+        phase = (px - (centre - radius)) % (2 * radius / 3)
+        depth = notch * (1 - abs(phase - radius / 3) / (radius / 3))
+        return body if py <= bottom - depth else None
+
+    return rasterize(size, color_at)
+
+
+def dot_runs(size: int, radius: float) -> List[Run]:
+    centre = size / 2
+
+    def color_at(px, py):
+        ox, oy = px - centre, py - centre
+        return DOT_COLOR if ox * ox + oy * oy <= radius * radius else None
+
+    return rasterize(size, color_at)
+
+
+class SpriteCache:
+    """
+    Builds and keeps every PhotoImage the Pacman scene uses.
+
+    Images must stay referenced for Tk to keep showing them, so the cache
+    owns them for the lifetime of the scene.
+    """
+
+    def __init__(self, master, size: int, ghost_colors=('red', 'pink', 'cyan', 'orange')):
+        self.master = master
+        self.size = size
+        self.images: Dict[tuple, tk.PhotoImage] = {}
+
+        # Build every known variant up front
+        for direction in DIRECTIONS:
+            for mouth_open in (True, False):
+                self.pacman(direction, mouth_open)
+            for color in ghost_colors:
+                self.ghost(color, direction, False)
+        self.ghost(FRIGHTENED_COLOR, (0, 0), True)
+        self.dot(False)
+        self.dot(True)
+
+    def pacman(self, direction: Direction, mouth_open: bool) -> tk.PhotoImage:
+        if direction == (0, 0):
+            direction = (1, 0)
+        key = ('pacman', direction, mouth_open)
+        image = self.images.get(key)
+        if image is None:
+            image = self._build(key, pacman_runs(self.size, direction, mouth_open))
+        return image
+
+    def ghost(self, color: str, direction: Direction, frightened: bool) -> tk.PhotoImage:
+        if frightened:
+            key = ('ghost', FRIGHTENED_COLOR, (0, 0), True)
+        else:
+            key = ('ghost', color, direction, False)
+        image = self.images.get(key)
+        if image is None:
+            image = self._build(key, ghost_runs(self.size, color, direction, frightened))
+        return image
+
+    def dot(self, power: bool) -> tk.PhotoImage:
+        key = ('dot', power)
+        image = self.images.get(key)
+        if image is None:
+            radius = 6 if power else 2
+            image = self._build(key, dot_runs(self.size, radius))
+        return image
+
+    def _build(self, key: tuple, runs: List[Run]) -> tk.PhotoImage:
+        image = tk.PhotoImage(master=self.master, width=self.size, height=self.size)
+        for y, x1, x2, color in runs:
+            image.put(color, to=(x1, y, x2, y + 1))
+        self.images[key] = image
+        return image
@@ -0,0 +1,83 @@
+"""
+Startup-time measurement for both games.
+
+Both games show their window first and only then build the first maze or
+board, from a callback scheduled by after_first_paint(). StartupTimer
+records how far into startup each milestone was reached:
+
+    imports       the game module and everything it imports are loaded
+    window built  widgets created; nothing drawn yet
+    window shown  Tk has mapped and painted the window
+    first frame   the first maze or board is drawn and the game takes input
+
+Enable with the GAMES_STARTUP environment variable. GAMES_STARTUP=1 prints
+the report once the first frame is up; GAMES_STARTUP=exit also closes the
+game afterwards, for scripted measurements:
+
+    GAMES_STARTUP=exit python packman.py
+    GAMES_STARTUP=exit python maze_runner.py
+
+Times are measured from the first line of the game module, so interpreter
+startup is not included; `python -X importtime` breaks the import time
+down per module.
+"""
+
+import os
+import time
+from typing import Callable, List, Tuple
+
+STARTUP_ENV = 'GAMES_STARTUP'
+
+
+def startup_requested() -> str:
+    """The GAMES_STARTUP mode: '' when unset or falsy, else 'report' or 'exit'"""
+    value = os.environ.get(STARTUP_ENV, '').lower()
+    if value in ('', '0', 'false', 'no'):
+        return ''
+    return 'exit' if value == 'exit' else 'report'
+
+
+def after_first_paint(widget, callback: Callable[[], None]):
+    """
+    Run callback once the window has been shown.
+
+    Tk maps a new window from an idle handler queued when it was created;
+    waiting for the first idle callback and then one more trip through the
+    event loop lets the expose events paint it before callback runs.
+    """
+    widget.after_idle(widget.after, 0, callback)
+
+
+class StartupTimer:
+    """
+    Startup milestones, in milliseconds since the game module began importing.
+
+    Attributes:
+        marks (list): (milestone, ms) pairs in the order they were reached
+    """
+
+    def __init__(self, name: str, import_start: float, import_end: float, exit_after: bool = False):
+        self.name = name
+        self.origin = import_start
+        self.exit_after = exit_after
+        self.finished = False
+        self.marks: List[Tuple[str, float]] = [('imports', (import_end - import_start) * 1000)]
+
+    def mark(self, milestone: str):
+        self.marks.append((milestone, (time.perf_counter() - self.origin) * 1000))
+
+    def first_frame(self, widget):
+        """Record the first interactive frame once Tk has drawn it, then report"""
+        if self.finished:
+            return
+        self.finished = True
+        widget.update_idletasks()
+        self.mark('first frame')
+        print(self.report(), flush=True)
+        if self.exit_after:
+            widget.after_idle(widget.destroy)
+
+    def report(self) -> str:
+        lines = [f"{self.name} startup (ms since import start):"]
+        lines.extend(f"  {milestone:<13} {ms:8.1f}" for milestone, ms in self.marks)
+        return '\n'.join(lines)